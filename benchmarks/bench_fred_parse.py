@@ -0,0 +1,113 @@
+"""Benchmark the columnar FRED payload parse against the previous per-row loop.
+
+Usage:
+    python benchmarks/bench_fred_parse.py [--sizes 1000 10000 100000] [--repeat 5]
+
+Payloads are synthetic daily FRED responses (see synthetic.fred_payload). Timings
+cover JSON decoding through the sorted (date, value) frame. Prints one JSON object
+per (size, implementation) on stdout.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from functools import partial
+from typing import Callable, List, Optional
+
+import pandas as pd
+import requests
+
+from macrolens_poc.sources.fred import FetchResult, _parse_observations
+from synthetic import fred_payload
+
+
+def legacy_parse_observations(resp: requests.Response) -> FetchResult:
+    """_parse_observations as it was before the columnar implementation."""
+
+    try:
+        payload = resp.json()
+    except ValueError as exc:
+        return FetchResult(status="error", message=f"FRED invalid JSON: {exc}", data=None)
+
+    observations = payload.get("observations")
+    if not isinstance(observations, list):
+        return FetchResult(status="error", message="FRED response missing observations list", data=None)
+
+    if not observations:
+        return FetchResult(status="warn", message="FRED returned 0 observations", data=pd.DataFrame(columns=["date", "value"]))
+
+    rows = []
+    for o in observations:
+        if not isinstance(o, dict):
+            continue
+        d = o.get("date")
+        v = o.get("value")
+        if not d:
+            continue
+        # value can be '.' meaning missing
+        if v is None or v == ".":
+            val = float("nan")
+        else:
+            try:
+                val = float(v)
+            except (TypeError, ValueError):
+                val = float("nan")
+
+        rows.append({"date": d, "value": val})
+
+    df = pd.DataFrame(rows)
+    if df.empty:
+        return FetchResult(status="warn", message="FRED observations parsed empty", data=df)
+
+    df["date"] = pd.to_datetime(df["date"], utc=True)
+    df = df.sort_values("date")
+
+    return FetchResult(status="ok", message="ok", data=df)
+
+
+def response(body: bytes) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = body
+    resp.encoding = "utf-8"
+    return resp
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    impls = {"columnar": _parse_observations, "legacy": legacy_parse_observations}
+
+    for n in args.sizes:
+        resp = response(fred_payload(n, "daily"))
+        timings = {name: _time(partial(fn, resp), args.repeat) for name, fn in impls.items()}
+        for name, seconds in timings.items():
+            print(
+                json.dumps(
+                    {
+                        "bench": "parse_fred",
+                        "rows": n,
+                        "impl": name,
+                        "best_s": round(seconds, 6),
+                        "speedup_vs_legacy": round(timings["legacy"] / seconds, 2) if seconds else None,
+                    }
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
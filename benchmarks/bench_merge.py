@@ -0,0 +1,110 @@
+"""Benchmark merge_series against the previous set/concat implementation.
+
+Usage:
+    python benchmarks/bench_merge.py [--sizes 10000 1000000 10000000] [--repeat 3]
+
+Scenarios per size (existing history of n rows; one row per minute so 10M rows stay
+inside the datetime64[ns] range):
+- append:  5 new points after the stored tail
+- overlap: last 90 stored points re-delivered (incremental revision overlap) with one
+           revised value, plus 1 new point
+
+Prints one JSON object per (size, scenario, implementation) on stdout.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from macrolens_poc.storage.parquet_store import merge_series
+
+
+def legacy_merge_series(existing: Optional[pd.DataFrame], incoming: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+    """merge_series as it was before the vectorized implementation."""
+
+    inc = incoming.copy()
+    inc["date"] = pd.to_datetime(inc["date"], utc=True)
+
+    if existing is None or existing.empty:
+        merged = inc.drop_duplicates(subset=["date"], keep="last").sort_values("date")
+        return merged, len(merged)
+
+    ex = existing.copy()
+    ex["date"] = pd.to_datetime(ex["date"], utc=True)
+    ex_dates_ns = set(ex["date"].dt.tz_convert("UTC").dt.tz_localize(None).astype("int64").tolist())
+
+    combined = pd.concat([ex, inc], ignore_index=True)
+    merged = combined.drop_duplicates(subset=["date"], keep="last").sort_values("date")
+
+    merged_dates_ns = set(merged["date"].dt.tz_convert("UTC").dt.tz_localize(None).astype("int64").tolist())
+    return merged, len(merged_dates_ns - ex_dates_ns)
+
+
+def _history(n: int, start: str = "2000-01-01") -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "date": pd.date_range(start, periods=n, freq="min", tz="UTC"),
+            "value": rng.normal(size=n).cumsum(),
+        }
+    )
+
+
+def _scenarios(n: int) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
+    history = _history(n + 5)
+    existing = history.iloc[:n].reset_index(drop=True)
+
+    append = history.iloc[n:].reset_index(drop=True)
+
+    overlap = history.iloc[max(0, n - 90) : n + 1].reset_index(drop=True)
+    overlap.loc[0, "value"] = overlap.loc[0, "value"] + 1.0
+
+    return {"append": (existing, append), "overlap": (existing, overlap)}
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    impls = {"vectorized": merge_series, "legacy": legacy_merge_series}
+
+    for n in args.sizes:
+        for scenario, (existing, incoming) in _scenarios(n).items():
+            timings = {
+                name: _time(partial(fn, existing, incoming), args.repeat) for name, fn in impls.items()
+            }
+            for name, seconds in timings.items():
+                print(
+                    json.dumps(
+                        {
+                            "bench": "merge_series",
+                            "rows": n,
+                            "scenario": scenario,
+                            "impl": name,
+                            "best_s": round(seconds, 6),
+                            "speedup_vs_legacy": round(timings["legacy"] / seconds, 2) if seconds else None,
+                        }
+                    )
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""Cold-start import time of the CLI, per command, against budgets.
+
+Runs `python -X importtime -m macrolens_poc.cli <command>` in fresh processes in a
+temporary workdir (config pointing at the repo's sources matrix, empty data dir)
+and reports per command:
+
+- import_ms: time spent importing modules, i.e. the summed cumulative time of the
+  top-level imports minus the same sum for a bare `python -c pass` (interpreter
+  start-up and site). Lazy imports done by the command body are included.
+- wall_ms:   wall time of the whole process.
+- heaviest:  the top-level imports with the largest cumulative time.
+
+Best of --repeat runs. Exits with status 1 if a command's import_ms exceeds its
+budget (times --budget-scale, for slower machines) or if it imported a module on
+its forbidden list (e.g. yfinance for `--help`); the forbidden check does not
+depend on the machine.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 5] [--only help status ...]
+        [--budget-scale 1.0] [--output startup.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# provider adapters and the data stack; commands that only touch config/metadata must not load them
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "yfinance", "requests")
+
+
+@dataclass(frozen=True)
+class StartupCase:
+    args: Tuple[str, ...]
+    budget_ms: float
+    forbidden: Tuple[str, ...] = HEAVY_MODULES
+    exit_code: int = 0
+
+
+CASES: Dict[str, StartupCase] = {
+    "help": StartupCase(args=("--help",), budget_ms=300.0),
+    "status": StartupCase(args=("status",), budget_ms=220.0),
+    "run-one-unknown": StartupCase(args=("run-one", "--id", "__no_such_series__"), budget_ms=220.0, exit_code=2),
+    "report-help": StartupCase(args=("report", "--help"), budget_ms=300.0),
+    # builds an (all missing) report, so the data stack is expected; the adapters are not
+    "report": StartupCase(args=("report",), budget_ms=650.0, forbidden=("yfinance", "requests")),
+}
+
+
+def write_config(workdir: Path) -> Path:
+    config = {
+        "sources_matrix_path": str(REPO_ROOT / "config" / "sources_matrix.yaml"),
+        "paths": {
+            "data_dir": str(workdir / "data"),
+            "logs_dir": str(workdir / "logs"),
+            "reports_dir": str(workdir / "reports"),
+            "metadata_db": str(workdir / "data" / "metadata.sqlite"),
+        },
+    }
+    path = workdir / "config.yaml"
+    path.write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
+    return path
+
+
+def parse_importtime(stderr: str) -> Tuple[int, Dict[str, int], Set[str]]:
+    """(summed top-level cumulative us, top-level module -> cumulative us, all imported modules)."""
+
+    total = 0
+    top_level: Dict[str, int] = {}
+    modules: Set[str] = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # header line
+        cumulative, name = int(fields[1]), fields[2]
+        modules.add(name.strip())
+        # nested imports are indented by two spaces per level after the separator's space
+        if not name[1:].startswith(" "):
+            total += cumulative
+            top_level[name.strip()] = top_level.get(name.strip(), 0) + cumulative
+    return total, top_level, modules
+
+
+def importtime(args: List[str], *, cwd: Path) -> Tuple[int, float, str, int]:
+    """Run `python -X importtime <args>`; returns (exit code, wall ms, stderr, stdout length)."""
+
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], cwd=cwd, capture_output=True, text=True, timeout=120
+    )
+    wall_ms = (time.perf_counter() - start) * 1000.0
+    return proc.returncode, wall_ms, proc.stderr, len(proc.stdout)
+
+
+def measure_case(name: str, case: StartupCase, *, config: Path, cwd: Path, baseline_us: int, repeat: int) -> Dict[str, Any]:
+    best: Optional[Dict[str, Any]] = None
+    imported: Set[str] = set()
+    exit_codes: Set[int] = set()
+    for _ in range(repeat):
+        code, wall_ms, stderr, _ = importtime(
+            ["-m", "macrolens_poc.cli", "--config", str(config), *case.args], cwd=cwd
+        )
+        total_us, top_level, modules = parse_importtime(stderr)
+        exit_codes.add(code)
+        imported |= modules
+        import_ms = max(0, total_us - baseline_us) / 1000.0
+        if best is None or import_ms < best["import_ms"]:
+            heaviest = sorted(top_level.items(), key=lambda kv: kv[1], reverse=True)[:5]
+            best = {"import_ms": import_ms, "wall_ms": wall_ms, "heaviest": {k: round(v / 1000.0, 1) for k, v in heaviest}}
+    assert best is not None
+
+    forbidden = sorted(m for m in case.forbidden if m in imported)
+    over_budget = best["import_ms"] > case.budget_ms
+    return {
+        "command": name,
+        "args": list(case.args),
+        "import_ms": round(best["import_ms"], 1),
+        "wall_ms": round(best["wall_ms"], 1),
+        "budget_ms": case.budget_ms,
+        "exit_codes": sorted(exit_codes),
+        "forbidden_imported": forbidden,
+        "heaviest_ms": best["heaviest"],
+        "ok": not forbidden and not over_budget and exit_codes == {case.exit_code},
+    }
+
+
+def run_startup(names: List[str], *, repeat: int, budget_scale: float = 1.0) -> List[Dict[str, Any]]:
+    workdir = Path(tempfile.mkdtemp(prefix="macrolens-startup-"))
+    try:
+        config = write_config(workdir)
+        baseline_us = min(parse_importtime(importtime(["-c", "pass"], cwd=workdir)[2])[0] for _ in range(repeat))
+        results = []
+        for name in names:
+            case = CASES[name]
+            scaled = StartupCase(
+                args=case.args, budget_ms=case.budget_ms * budget_scale, forbidden=case.forbidden, exit_code=case.exit_code
+            )
+            results.append(
+                measure_case(name, scaled, config=config, cwd=workdir, baseline_us=baseline_us, repeat=repeat)
+            )
+        return results
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=5, help="runs per command; the fastest counts")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="multiply every budget (slow machines/CI)")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    results = run_startup(args.only, repeat=args.repeat, budget_scale=args.budget_scale)
+    for r in results:
+        flag = "" if r["ok"] else "REGRESSION"
+        extra = f" forbidden={r['forbidden_imported']}" if r["forbidden_imported"] else ""
+        print(
+            f"{r['command']:<18} import {r['import_ms']:>7.1f} ms (budget {r['budget_ms']:.0f})"
+            f"  wall {r['wall_ms']:>7.1f} ms  exit {r['exit_codes']}{extra} {flag}",
+            file=sys.stderr,
+        )
+
+    doc = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "budget_scale": args.budget_scale,
+        },
+        "results": results,
+    }
+    text = json.dumps(doc, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0 if all(r["ok"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
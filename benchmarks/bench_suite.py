@@ -0,0 +1,328 @@
+"""Microbenchmarks for the storage and report hot paths (offline, synthetic data).
+
+Usage:
+    python benchmarks/bench_suite.py run [--sizes 1000 100000 1000000 10000000]
+        [--cadences daily bday monthly minute] [--layouts file partitioned dataset]
+        [--repeat 3] [--only merge_series store_series ...] [--output bench.json]
+        [--baseline old.json] [--threshold 1.25] [--min-delta 0.001]
+    python benchmarks/bench_suite.py compare old.json new.json [--threshold 1.25] [--min-delta 0.001]
+
+Benchmarks (every one per cadence and row count):
+- merge_series:           append (5 new points) and overlap (90 re-delivered, 1 revised, 1 new)
+- store_series:           initial write and incremental append, per storage layout
+- load_series:            cold (cache cleared) full load, warm (cached) full load and a
+                          cold range load of the last 10% of the rows, per storage layout
+- _normalize_timeseries:  unsorted adapter output with ~1% duplicates and NaN
+- compute_deltas:         windows 1,5,21,63,252, abs and pct
+- parse_fred:             FRED observations JSON -> sorted frame (not on the minute
+                          cadence; FRED dates are days)
+
+Combinations a cadence cannot hold (see synthetic.max_rows) are skipped; rows in the
+millions run on the minute cadence.
+
+`run` writes one JSON document {"meta": {...}, "results": [...]} (stdout unless
+--output). Each result has a stable "key" (bench/variant/cadence/rows), best_s and
+median_s. `compare` matches two such documents by key and exits with status 1 if
+any benchmark's best_s got slower by more than --threshold (ratio new/old) and by
+more than --min-delta seconds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+import numpy as np
+import pandas as pd
+
+from macrolens_poc.pipeline.run_series import _normalize_timeseries
+from macrolens_poc.report.generate import compute_deltas
+from macrolens_poc.sources.fred import _parse_observations
+from macrolens_poc.storage.parquet_store import (
+    SeriesLocation,
+    clear_series_cache,
+    load_series,
+    merge_series,
+    series_path,
+    store_series,
+)
+from bench_fred_parse import response
+from synthetic import CADENCES, fred_payload, max_rows, raw_provider_frame, synthetic_series
+
+BENCHES = ("merge_series", "store_series", "load_series", "normalize_timeseries", "compute_deltas", "parse_fred")
+LAYOUTS = ("file", "partitioned", "dataset")
+DELTA_WINDOWS = [1, 5, 21, 63, 252]
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000, 10_000_000]
+DEFAULT_THRESHOLD = 1.25
+DEFAULT_MIN_DELTA_S = 0.001
+
+Setup = Callable[[], Any]
+
+
+def measure(fn: Callable[[Any], object], *, repeat: int, setup: Optional[Setup] = None) -> Dict[str, float]:
+    """Time fn(setup()) `repeat` times; setup runs outside the timed region."""
+
+    samples: List[float] = []
+    for _ in range(max(1, repeat)):
+        arg = setup() if setup is not None else None
+        t0 = time.perf_counter()
+        fn(arg)
+        samples.append(time.perf_counter() - t0)
+    return {"best_s": round(min(samples), 6), "median_s": round(statistics.median(samples), 6)}
+
+
+def _cases(sizes: List[int], cadences: List[str]) -> Iterator[Tuple[str, int]]:
+    for cadence in cadences:
+        limit = max_rows(cadence)
+        for rows in sizes:
+            if rows <= limit:
+                yield cadence, rows
+
+
+def _bench_merge(df: pd.DataFrame, *, repeat: int) -> Iterator[Tuple[str, Dict[str, float]]]:
+    n = len(df) - 5
+    existing = df.iloc[:n].reset_index(drop=True)
+    append = df.iloc[n:].reset_index(drop=True)
+    overlap = df.iloc[max(0, n - 90) : n + 1].reset_index(drop=True)
+    overlap.loc[0, "value"] = overlap.loc[0, "value"] + 1.0
+
+    yield "append", measure(lambda _: merge_series(existing, append), repeat=repeat)
+    yield "overlap", measure(lambda _: merge_series(existing, overlap), repeat=repeat)
+
+
+def _bench_store(
+    df: pd.DataFrame, *, layouts: List[str], workdir: Path, repeat: int
+) -> Iterator[Tuple[str, Dict[str, float]]]:
+    history = df.iloc[:-5].reset_index(drop=True)
+    tail = df.iloc[-5:].reset_index(drop=True)
+
+    for layout in layouts:
+        counter = iter(range(10**9))
+
+        def fresh(layout: str = layout, counter: Iterator[int] = counter) -> SeriesLocation:
+            clear_series_cache()
+            return series_path(workdir / f"store-{next(counter)}", "bench", layout)
+
+        def seeded(layout: str = layout) -> SeriesLocation:
+            path = fresh(layout)
+            store_series(path, history)
+            clear_series_cache()
+            return path
+
+        yield f"{layout}/initial", measure(lambda path: store_series(path, history), repeat=repeat, setup=fresh)
+        yield f"{layout}/append", measure(lambda path: store_series(path, tail), repeat=repeat, setup=seeded)
+
+
+def _bench_load(
+    df: pd.DataFrame, *, layouts: List[str], workdir: Path, repeat: int
+) -> Iterator[Tuple[str, Dict[str, float]]]:
+    range_start = df["date"].iloc[len(df) - max(1, len(df) // 10)]
+
+    for layout in layouts:
+        path = series_path(workdir / "load", "bench", layout)
+        store_series(path, df)
+        clear_series_cache()
+
+        yield f"{layout}/cold", measure(
+            lambda _, path=path: load_series(path), repeat=repeat, setup=clear_series_cache
+        )
+        load_series(path)
+        yield f"{layout}/warm", measure(lambda _, path=path: load_series(path), repeat=repeat)
+        yield f"{layout}/range_cold", measure(
+            lambda _, path=path: load_series(path, start=range_start), repeat=repeat, setup=clear_series_cache
+        )
+    clear_series_cache()
+
+
+def _bench_normalize(rows: int, cadence: str, *, repeat: int) -> Iterator[Tuple[str, Dict[str, float]]]:
+    raw = raw_provider_frame(rows, cadence)
+    yield "unsorted_dupes", measure(lambda _: _normalize_timeseries(raw), repeat=repeat)
+
+
+def _bench_deltas(df: pd.DataFrame, *, repeat: int) -> Iterator[Tuple[str, Dict[str, float]]]:
+    for kind in ("abs", "pct"):
+        yield kind, measure(
+            lambda _, kind=kind: compute_deltas(df, windows=DELTA_WINDOWS, kind=kind, assume_sorted=True),
+            repeat=repeat,
+        )
+
+
+def _bench_parse_fred(rows: int, cadence: str, *, repeat: int) -> Iterator[Tuple[str, Dict[str, float]]]:
+    if cadence == "minute":
+        return
+    resp = response(fred_payload(rows, cadence))
+    yield "observations", measure(lambda _: _parse_observations(resp), repeat=repeat)
+
+
+def run_suite(
+    *,
+    sizes: List[int],
+    cadences: List[str],
+    layouts: List[str],
+    benches: List[str],
+    repeat: int,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Run the selected benchmarks and return one result dict per measurement."""
+
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="macrolens-bench-") as tmp:
+        for cadence, rows in _cases(sizes, cadences):
+            df = synthetic_series(rows, cadence)
+            workdir = Path(tmp) / f"{cadence}-{rows}"
+            runs: Dict[str, Callable[[], Iterator[Tuple[str, Dict[str, float]]]]] = {
+                "merge_series": partial(_bench_merge, df, repeat=repeat),
+                "store_series": partial(_bench_store, df, layouts=layouts, workdir=workdir, repeat=repeat),
+                "load_series": partial(_bench_load, df, layouts=layouts, workdir=workdir, repeat=repeat),
+                "normalize_timeseries": partial(_bench_normalize, rows, cadence, repeat=repeat),
+                "compute_deltas": partial(_bench_deltas, df, repeat=repeat),
+                "parse_fred": partial(_bench_parse_fred, rows, cadence, repeat=repeat),
+            }
+            for bench in benches:
+                for variant, timing in runs[bench]():
+                    result = {
+                        "key": f"{bench}/{variant}/{cadence}/{rows}",
+                        "bench": bench,
+                        "variant": variant,
+                        "cadence": cadence,
+                        "rows": rows,
+                        "repeat": repeat,
+                        **timing,
+                    }
+                    results.append(result)
+                    if progress is not None:
+                        progress(result)
+            shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta_s: float = DEFAULT_MIN_DELTA_S,
+) -> List[Dict[str, Any]]:
+    """Per-key ratio current/baseline of best_s.
+
+    A benchmark counts as regressed when the ratio exceeds threshold and it got
+    slower by more than min_delta_s (sub-millisecond timings are mostly noise).
+    """
+
+    old = {r["key"]: r for r in baseline.get("results", [])}
+    rows: List[Dict[str, Any]] = []
+    for result in current.get("results", []):
+        before = old.get(result["key"])
+        if before is None:
+            continue
+        ratio = result["best_s"] / before["best_s"] if before["best_s"] > 0 else None
+        rows.append(
+            {
+                "key": result["key"],
+                "baseline_s": before["best_s"],
+                "current_s": result["best_s"],
+                "ratio": None if ratio is None else round(ratio, 3),
+                "regressed": ratio is not None
+                and ratio > threshold
+                and result["best_s"] - before["best_s"] > min_delta_s,
+            }
+        )
+    return rows
+
+
+def _meta() -> Dict[str, Any]:
+    try:
+        commit: Optional[str] = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, timeout=10
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+    }
+
+
+def _print_comparison(rows: List[Dict[str, Any]], threshold: float, *, out: TextIO = sys.stdout) -> int:
+    regressed = [r for r in rows if r["regressed"]]
+    for r in rows:
+        flag = "REGRESSION" if r["regressed"] else ""
+        print(f"{r['key']:<55} {r['baseline_s']:>11.6f} {r['current_s']:>11.6f} {r['ratio']!s:>7} {flag}", file=out)
+    print(f"{len(rows)} compared, {len(regressed)} slower than x{threshold}", file=sys.stderr)
+    return 1 if regressed else 0
+
+
+def _load_doc(path: str) -> Dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run benchmarks and write JSON results")
+    run.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    run.add_argument("--cadences", nargs="+", choices=list(CADENCES), default=list(CADENCES))
+    run.add_argument("--layouts", nargs="+", choices=LAYOUTS, default=list(LAYOUTS))
+    run.add_argument("--only", nargs="+", choices=BENCHES, default=list(BENCHES))
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--output", help="write results here instead of stdout")
+    run.add_argument("--baseline", help="compare against an earlier results file")
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    run.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA_S, help="ignore slowdowns below this (s)")
+
+    cmp = sub.add_parser("compare", help="compare two results files")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    cmp.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA_S, help="ignore slowdowns below this (s)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        rows = compare_results(
+            _load_doc(args.baseline), _load_doc(args.current), threshold=args.threshold, min_delta_s=args.min_delta
+        )
+        return _print_comparison(rows, args.threshold)
+
+    results = run_suite(
+        sizes=args.sizes,
+        cadences=args.cadences,
+        layouts=args.layouts,
+        benches=args.only,
+        repeat=args.repeat,
+        progress=lambda r: print(f"{r['key']}: {r['best_s']:.6f}s", file=sys.stderr),
+    )
+    doc = {"meta": _meta(), "results": results}
+    text = json.dumps(doc, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    if args.baseline:
+        rows = compare_results(
+            _load_doc(args.baseline), doc, threshold=args.threshold, min_delta_s=args.min_delta
+        )
+        # stdout may carry the results document
+        return _print_comparison(rows, args.threshold, out=sys.stderr if not args.output else sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""End-to-end load test of run-all against local FRED/Yahoo stand-ins.
+
+Starts benchmarks/standins.py in a child process, writes a synthetic sources matrix
+(--fred-series + --yahoo-series entries) and a config that points fred.base_url at the
+stand-in, redirects yfinance's chart endpoint to it, then runs the real `run-all`
+command in this process --runs times against a fresh data directory (run 1 is a full
+load, later runs are incremental).
+
+Reports per run: wall time, series/s, status counts, peak RSS of this process, the
+per-provider stage breakdown from run_summary.stage_timings, plus the stand-in
+request counters.
+
+Usage:
+    python benchmarks/load_harness.py [--fred-series 2000] [--yahoo-series 500]
+        [--workers 8] [--runs 2] [--points 2500] [--latency-ms 20] [--jitter-ms 10]
+        [--error-rate 0.01] [--burst-every-s 0] [--burst-len-s 0] [--quota-rps 0]
+        [--layout file] [--fred-rps 0] [--fred-burst 10] [--fred-page-size 100000]
+        [--output load.json] [--keep-workdir]
+
+yfinance has no endpoint setting; point_yfinance_at patches its chart base URL and
+skips the cookie/crumb handshake. This is tied to the installed yfinance version.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import requests
+import yaml
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None  # type: ignore[assignment]
+
+STANDINS = Path(__file__).with_name("standins.py")
+
+
+def point_yfinance_at(base_url: str, *, cache_dir: Path) -> None:
+    """Send yfinance chart requests to base_url instead of query2.finance.yahoo.com."""
+
+    import yfinance as yf
+    import yfinance.base as yf_base
+    import yfinance.scrapers.history as yf_history
+    from yfinance.data import YfData
+
+    yf_history._BASE_URL_ = base_url
+    yf_base._BASE_URL_ = base_url
+    YfData._get_cookie_and_crumb = lambda self, timeout=30: (None, "basic")
+    # timezone lookups are cached on disk; keep them out of the user's cache
+    yf.set_tz_cache_location(str(cache_dir))
+
+
+def write_sources_matrix(path: Path, *, fred_series: int, yahoo_series: int) -> None:
+    series: List[Dict[str, Any]] = []
+    for i in range(fred_series):
+        series.append(
+            {"id": f"fred_{i:05d}", "provider": "fred", "provider_symbol": f"SYNF{i:05d}", "category": "load"}
+        )
+    for i in range(yahoo_series):
+        series.append(
+            {"id": f"yf_{i:05d}", "provider": "yfinance", "provider_symbol": f"SYNY{i:05d}", "category": "load"}
+        )
+    path.write_text(yaml.safe_dump({"version": 1, "series": series}, sort_keys=False), encoding="utf-8")
+
+
+def write_config(
+    path: Path,
+    *,
+    workdir: Path,
+    base_url: str,
+    workers: int,
+    layout: str,
+    fred_rps: float = 0.0,
+    burst: float = 10.0,
+    page_size: int = 100_000,
+) -> None:
+    config = {
+        "sources_matrix_path": str(workdir / "sources_matrix.yaml"),
+        "fred_api_key": "load-harness",
+        "paths": {
+            "data_dir": str(workdir / "data"),
+            "logs_dir": str(workdir / "logs"),
+            "reports_dir": str(workdir / "reports"),
+            "metadata_db": str(workdir / "data" / "metadata.sqlite"),
+        },
+        "storage": {"layout": layout},
+        # the stand-ins have no quota; pace FRED only when asked (--fred-rps)
+        "ingest": {"workers": workers, "rate_limits": {"fred": {"rate_per_s": fred_rps or 1e9, "burst": burst}}},
+        "http": {"pool_size": max(10, workers)},
+        "fred": {"base_url": f"{base_url}/fred", "page_size": page_size},
+    }
+    path.write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
+
+
+def start_standins(args: argparse.Namespace) -> tuple[subprocess.Popen, str]:
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            str(STANDINS),
+            "--points",
+            str(args.points),
+            "--latency-ms",
+            str(args.latency_ms),
+            "--jitter-ms",
+            str(args.jitter_ms),
+            "--error-rate",
+            str(args.error_rate),
+            "--burst-every-s",
+            str(args.burst_every_s),
+            "--burst-len-s",
+            str(args.burst_len_s),
+            "--quota-rps",
+            str(args.quota_rps),
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    line = proc.stdout.readline() if proc.stdout is not None else ""
+    if not line.startswith("READY "):
+        proc.kill()
+        raise RuntimeError(f"stand-ins failed to start: {line!r}")
+    return proc, line.split(" ", 1)[1].strip()
+
+
+def peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale, 1)
+
+
+def read_run_summaries(logs_dir: Path) -> List[Dict[str, Any]]:
+    summaries: List[Dict[str, Any]] = []
+    for log in sorted(logs_dir.glob("run-*.jsonl")):
+        for line in log.read_text(encoding="utf-8").splitlines():
+            event = json.loads(line)
+            if event.get("event") == "run_summary":
+                summaries.append(event)
+    return summaries
+
+
+def run_once(config_path: Path, *, workers: int) -> float:
+    from macrolens_poc.cli import app
+
+    start = time.perf_counter()
+    try:
+        app(["--config", str(config_path), "run-all", "--workers", str(workers)], standalone_mode=False)
+    except SystemExit as exc:  # typer.Exit from a failing run
+        if exc.code not in (0, None):
+            print(f"run-all exited with {exc.code}", file=sys.stderr)
+    return time.perf_counter() - start
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fred-series", type=int, default=2000)
+    parser.add_argument("--yahoo-series", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=2, help="run 1 loads everything, later runs are incremental")
+    parser.add_argument("--layout", choices=["file", "partitioned", "dataset"], default="file")
+    parser.add_argument("--fred-rps", type=float, default=0.0, help="FRED rate limit in requests/s (0 = off)")
+    parser.add_argument("--fred-burst", type=float, default=10.0)
+    parser.add_argument("--fred-page-size", type=int, default=100_000, help="observations per FRED request")
+    parser.add_argument("--points", type=int, default=2500, help="observations per series in the stand-ins")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--burst-every-s", type=float, default=0.0)
+    parser.add_argument("--burst-len-s", type=float, default=0.0)
+    parser.add_argument("--quota-rps", type=float, default=0.0, help="stand-in answers 429 above this rate")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--keep-workdir", action="store_true", help="keep data/logs of the runs")
+    args = parser.parse_args(argv)
+
+    workdir = Path(tempfile.mkdtemp(prefix="macrolens-load-"))
+    standins, base_url = start_standins(args)
+    try:
+        write_sources_matrix(
+            workdir / "sources_matrix.yaml", fred_series=args.fred_series, yahoo_series=args.yahoo_series
+        )
+        config_path = workdir / "config.yaml"
+        write_config(
+            config_path,
+            workdir=workdir,
+            base_url=base_url,
+            workers=args.workers,
+            layout=args.layout,
+            fred_rps=args.fred_rps,
+            burst=args.fred_burst,
+            page_size=args.fred_page_size,
+        )
+        point_yfinance_at(base_url, cache_dir=workdir / "yfinance-cache")
+
+        n_series = args.fred_series + args.yahoo_series
+        runs: List[Dict[str, Any]] = []
+        for i in range(1, args.runs + 1):
+            wall_s = run_once(config_path, workers=args.workers)
+            summary = (read_run_summaries(workdir / "logs") or [{}])[-1]
+            runs.append(
+                {
+                    "run": i,
+                    "series": n_series,
+                    "wall_s": round(wall_s, 3),
+                    "series_per_s": round(n_series / wall_s, 1) if wall_s > 0 else None,
+                    "peak_rss_mb": peak_rss_mb(),
+                    "status_counts": summary.get("status_counts"),
+                    "total_new_points": summary.get("total_new_points"),
+                    "stage_timings": summary.get("stage_timings"),
+                }
+            )
+            print(
+                f"run {i}: {n_series} series in {wall_s:.2f}s ({runs[-1]['series_per_s']} series/s), "
+                f"peak RSS {runs[-1]['peak_rss_mb']} MB, status {runs[-1]['status_counts']}",
+                file=sys.stderr,
+            )
+
+        standin_stats = requests.get(f"{base_url}/_stats", timeout=10).json()
+    finally:
+        standins.terminate()
+        standins.wait(timeout=10)
+        if args.keep_workdir:
+            print(f"workdir kept: {workdir}", file=sys.stderr)
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "config": {k: v for k, v in vars(args).items() if k not in ("output", "keep_workdir")},
+        "runs": runs,
+        "standin_requests": standin_stats,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
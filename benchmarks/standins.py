@@ -0,0 +1,307 @@
+"""Local HTTP stand-ins for the FRED and Yahoo endpoints the adapters call.
+
+Routes:
+- GET /fred/series/observations   FRED JSON API (series_id, observation_start/_end,
+                                  limit/offset, sort_order=asc); point fred.base_url
+                                  at {url}/fred
+- GET /v8/finance/chart/{symbol}  Yahoo chart API as used by yfinance (period1/period2
+                                  or range); see load_harness.point_yfinance_at
+- GET /_stats                     request counters per route and status
+
+Every series has `--points` daily observations (Yahoo: business days) ending today,
+with deterministic values per symbol. Faults: fixed latency plus uniform jitter,
+random 500s at --error-rate, 503 bursts of --burst-len-s every --burst-every-s, and
+429 with Retry-After: 1 beyond --quota-rps requests in a second.
+
+Usage:
+    python benchmarks/standins.py [--port 0] [--points 2500] [--latency-ms 20]
+        [--jitter-ms 10] [--error-rate 0.01] [--burst-every-s 0] [--burst-len-s 0]
+        [--quota-rps 0]
+
+Prints "READY <base url>" on stdout once listening.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+FRED_PATH = "/fred/series/observations"
+CHART_PREFIX = "/v8/finance/chart/"
+FRED_MAX_LIMIT = 100_000
+
+
+@dataclass(frozen=True)
+class FaultConfig:
+    latency_ms: float = 20.0
+    jitter_ms: float = 10.0
+    error_rate: float = 0.0
+    burst_every_s: float = 0.0
+    burst_len_s: float = 0.0
+    quota_rps: float = 0.0  # requests per second before answering 429 + Retry-After (0 = off)
+
+
+class StandinState:
+    """Series data and fault injection shared by all handler threads."""
+
+    def __init__(self, *, points: int, faults: FaultConfig, seed: int = 0) -> None:
+        self.points = points
+        self.faults = faults
+        self.started = time.monotonic()
+        self.stats: Counter = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str], Tuple[np.ndarray, np.ndarray]] = {}
+        self._quota_window = -1
+        self._quota_used = 0
+
+    def series(self, symbol: str, freq: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(dates as datetime64[D], values) for a symbol, generated once."""
+
+        key = (symbol, freq)
+        cached = self._series.get(key)
+        if cached is None:
+            today = pd.Timestamp(datetime.now(timezone.utc).date())
+            dates = pd.date_range(end=today, periods=self.points, freq=freq).to_numpy().astype("datetime64[D]")
+            rng = np.random.default_rng(zlib.crc32(symbol.encode()))
+            values = 100.0 + rng.normal(size=self.points).cumsum()
+            cached = (dates, values)
+            with self._lock:
+                self._series[key] = cached
+        return cached
+
+    def fault(self) -> Optional[int]:
+        """Sleep for the configured latency; return an HTTP status to fail with, if any."""
+
+        f = self.faults
+        with self._lock:
+            jitter = self._rng.uniform(0.0, f.jitter_ms) if f.jitter_ms > 0 else 0.0
+            fail = f.error_rate > 0 and self._rng.random() < f.error_rate
+            over_quota = False
+            if f.quota_rps > 0:
+                window = int(time.monotonic() - self.started)
+                if window != self._quota_window:
+                    self._quota_window, self._quota_used = window, 0
+                self._quota_used += 1
+                over_quota = self._quota_used > f.quota_rps
+        if over_quota:
+            return 429
+        delay = (f.latency_ms + jitter) / 1000.0
+        if delay > 0:
+            time.sleep(delay)
+        if f.burst_every_s > 0 and (time.monotonic() - self.started) % f.burst_every_s < f.burst_len_s:
+            return 503
+        return 500 if fail else None
+
+    def count(self, route: str, status: int) -> None:
+        with self._lock:
+            self.stats[f"{route} {status}"] += 1
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real providers
+    server: "StandinServer"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def do_GET(self) -> None:  # noqa: N802 - stdlib hook
+        url = urlparse(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        state = self.server.state
+
+        if url.path == "/_stats":
+            self._send(200, dict(state.stats))
+            return
+        if url.path == FRED_PATH:
+            route, handler = "fred", self._fred
+        elif url.path.startswith(CHART_PREFIX):
+            route, handler = "chart", self._chart
+        else:
+            self._send(404, {"error": f"unknown path {url.path}"})
+            return
+
+        failure = state.fault()
+        if failure is not None:
+            state.count(route, failure)
+            headers = {"Retry-After": "1"} if failure == 429 else None
+            self._send(failure, {"error_code": failure, "error_message": "stand-in fault"}, headers=headers)
+            return
+
+        status, body = handler(url.path, query)
+        state.count(route, status)
+        self._send(status, body)
+
+    def _fred(self, path: str, query: Dict[str, str]) -> Tuple[int, Dict[str, Any]]:
+        series_id = query.get("series_id")
+        if not series_id or not query.get("api_key"):
+            return 400, {"error_code": 400, "error_message": "Bad Request. series_id and api_key are required."}
+
+        dates, values = self.server.state.series(series_id, "D")
+        lo = np.datetime64(query["observation_start"]) if "observation_start" in query else None
+        hi = np.datetime64(query["observation_end"]) if "observation_end" in query else None
+        start = 0 if lo is None else int(np.searchsorted(dates, lo, side="left"))
+        stop = len(dates) if hi is None else int(np.searchsorted(dates, hi, side="right"))
+
+        limit = min(int(query.get("limit", FRED_MAX_LIMIT)), FRED_MAX_LIMIT)
+        offset = int(query.get("offset", 0))
+        window = slice(start + offset, min(stop, start + offset + limit))
+
+        today = date.today().isoformat()
+        observations = [
+            {
+                "realtime_start": today,
+                "realtime_end": today,
+                "date": str(d),
+                # FRED marks missing values with "."
+                "value": "." if i % 97 == 0 else f"{v:.4f}",
+            }
+            for i, d, v in zip(range(window.start, window.stop), dates[window], values[window])
+        ]
+        return 200, {
+            "realtime_start": today,
+            "realtime_end": today,
+            "observation_start": query.get("observation_start", "1776-07-04"),
+            "observation_end": query.get("observation_end", "9999-12-31"),
+            "units": "lin",
+            "output_type": 1,
+            "file_type": "json",
+            "order_by": "observation_date",
+            "sort_order": "asc",
+            "count": max(0, stop - start),
+            "offset": offset,
+            "limit": limit,
+            "observations": observations,
+        }
+
+    def _chart(self, path: str, query: Dict[str, str]) -> Tuple[int, Dict[str, Any]]:
+        symbol = path[len(CHART_PREFIX) :]
+        dates, values = self.server.state.series(symbol, "B")
+        stamps = dates.astype("datetime64[s]").astype(np.int64)
+
+        if "period1" in query:
+            start = int(np.searchsorted(stamps, int(query["period1"]), side="left"))
+            stop = int(np.searchsorted(stamps, int(query.get("period2", stamps[-1] + 1)), side="left"))
+        else:
+            # range=1d (yfinance's timezone probe) or anything else: last point only
+            start, stop = len(stamps) - 1, len(stamps)
+
+        ts = stamps[start:stop].tolist()
+        close = np.round(values[start:stop], 4).tolist()
+        meta = {
+            "currency": "USD",
+            "symbol": symbol,
+            "exchangeName": "NYQ",
+            "instrumentType": "EQUITY",
+            "firstTradeDate": int(stamps[0]),
+            "regularMarketTime": int(stamps[-1]),
+            "gmtoffset": 0,
+            "timezone": "UTC",
+            "exchangeTimezoneName": "UTC",
+            "regularMarketPrice": float(values[-1]),
+            "priceHint": 2,
+            "dataGranularity": "1d",
+            "range": query.get("range", ""),
+            "validRanges": ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"],
+        }
+        return 200, {
+            "chart": {
+                "result": [
+                    {
+                        "meta": meta,
+                        "timestamp": ts,
+                        "indicators": {
+                            "quote": [
+                                {"open": close, "high": close, "low": close, "close": close, "volume": [1000] * len(ts)}
+                            ],
+                            "adjclose": [{"adjclose": close}],
+                        },
+                    }
+                ],
+                "error": None,
+            }
+        }
+
+    def _send(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address: Tuple[str, int], state: StandinState) -> None:
+        super().__init__(address, StandinHandler)
+        self.state = state
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_standins(
+    *, points: int = 2500, faults: FaultConfig = FaultConfig(), host: str = "127.0.0.1", port: int = 0
+) -> StandinServer:
+    """Start the stand-ins on a background thread (call .shutdown() to stop)."""
+
+    server = StandinServer((host, port), StandinState(points=points, faults=faults))
+    threading.Thread(target=server.serve_forever, name="standins", daemon=True).start()
+    return server
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--points", type=int, default=2500, help="observations per series (payload size)")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 500")
+    parser.add_argument("--burst-every-s", type=float, default=0.0, help="start a 503 burst this often (0 = off)")
+    parser.add_argument("--burst-len-s", type=float, default=0.0, help="length of each 503 burst")
+    parser.add_argument("--quota-rps", type=float, default=0.0, help="answer 429 above this many requests/s")
+    args = parser.parse_args(argv)
+
+    faults = FaultConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        burst_every_s=args.burst_every_s,
+        burst_len_s=args.burst_len_s,
+        quota_rps=args.quota_rps,
+    )
+    server = StandinServer((args.host, args.port), StandinState(points=args.points, faults=faults))
+    print(f"READY {server.base_url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Synthetic series for benchmarks and load tests (offline, deterministic).
+
+Stored dates are datetime64[ns, UTC], so a cadence can only hold as many rows as fit
+into the ns range (1677-09-21 .. 2262-04-11). Series end at END and run backwards;
+``max_rows`` tells how many rows a cadence can hold (daily ~127k, business-day ~90k,
+monthly ~4k). Row counts in the millions need the ``minute`` cadence.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+END = pd.Timestamp("2024-12-31", tz="UTC")
+
+# cadence -> pandas frequency alias
+CADENCES: Dict[str, str] = {
+    "daily": "D",
+    "bday": "B",
+    "monthly": "ME",
+    "minute": "min",
+}
+
+_EARLIEST = pd.Timestamp("1678-01-01", tz="UTC")
+
+
+def max_rows(cadence: str) -> int:
+    """Most rows a cadence can hold between 1678-01-01 and END."""
+
+    freq = _freq(cadence)
+    if freq == "min":
+        return int((END - _EARLIEST) / pd.Timedelta(minutes=1))
+    return len(pd.date_range(_EARLIEST, END, freq=freq))
+
+
+def synthetic_series(rows: int, cadence: str = "daily", *, seed: int = 42) -> pd.DataFrame:
+    """A random-walk series (date UTC, value float64) of `rows` rows ending at END.
+
+    Raises ValueError if the cadence cannot hold that many rows (see max_rows).
+    """
+
+    freq = _freq(cadence)
+    if rows < 1:
+        raise ValueError("rows must be >= 1")
+    if rows > max_rows(cadence):
+        raise ValueError(f"cadence {cadence} holds at most {max_rows(cadence)} rows, got {rows}")
+
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "date": pd.date_range(end=END, periods=rows, freq=freq).as_unit("ns"),
+            "value": 100.0 + rng.normal(size=rows).cumsum(),
+        }
+    )
+
+
+def raw_provider_frame(rows: int, cadence: str = "daily", *, seed: int = 42) -> pd.DataFrame:
+    """Adapter-shaped input for normalization: unsorted, ~1% duplicate dates, ~1% NaN."""
+
+    df = synthetic_series(rows, cadence, seed=seed)
+    rng = np.random.default_rng(seed + 1)
+
+    dupes = df.iloc[rng.integers(0, rows, size=max(1, rows // 100))]
+    df = pd.concat([df, dupes], ignore_index=True)
+    df = df.iloc[rng.permutation(len(df))].reset_index(drop=True)
+    df.loc[rng.random(len(df)) < 0.01, "value"] = np.nan
+    return df
+
+
+def fred_payload(rows: int, cadence: str = "daily", *, seed: int = 42) -> bytes:
+    """FRED observations JSON for a synthetic series (4 decimals, every 97th value ".")."""
+
+    df = synthetic_series(rows, cadence, seed=seed)
+    stamp = END.strftime("%Y-%m-%d")
+    observations = [
+        {
+            "realtime_start": stamp,
+            "realtime_end": stamp,
+            "date": d,
+            "value": "." if i % 97 == 0 else f"{v:.4f}",
+        }
+        for i, (d, v) in enumerate(zip(df["date"].dt.strftime("%Y-%m-%d"), df["value"]))
+    ]
+    return json.dumps({"count": rows, "observations": observations}).encode("utf-8")
+
+
+def _freq(cadence: str) -> str:
+    try:
+        return CADENCES[cadence]
+    except KeyError:
+        raise ValueError(f"unknown cadence: {cadence} (expected one of {', '.join(CADENCES)})") from None
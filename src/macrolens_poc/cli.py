@@ -1,30 +1,45 @@
 from __future__ import annotations
 
+import json
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import typer
 
 from macrolens_poc.config import Settings, load_settings
 from macrolens_poc.logging_utils import (
     JsonlLogger,
+    RunContext,
     default_log_path,
     new_run_context,
+    resolve_encoder,
     run_summary_event,
 )
-from macrolens_poc.pipeline import SeriesRunResult, run_series
-from macrolens_poc.report.generate import (
-    DEFAULT_DELTA_WINDOWS,
-    generate_series_report,
-    write_report_artifacts,
-)
-from macrolens_poc.sources import load_sources_matrix
-from macrolens_poc.sources.matrix import SeriesSpec
+from macrolens_poc.sources.matrix import MatrixLoadResult, load_sources_matrix
+from macrolens_poc.sources.rate_limit import build_rate_limiters
 from macrolens_poc.storage.metadata_db import (
+    MetadataSession,
     SeriesMetadataRecord,
+    SeriesRunRecord,
+    SeriesStatusRecord,
     init_db as init_metadata_db,
-    upsert_series_metadata,
+    list_series_summaries,
+    query_series_status,
+    upsert_series_summaries,
 )
+from macrolens_poc.timing import StageStats
+
+# The pipeline, provider adapters (requests, yfinance), report builder and Parquet
+# stores (pandas, pyarrow) are imported inside the commands that use them, so that
+# --help, status and argument errors start without loading them.
+# benchmarks/bench_startup.py checks this per command.
+if TYPE_CHECKING:
+    from macrolens_poc.pipeline.run_series import SeriesRunResult
+    from macrolens_poc.report.generate import DeltaKind
+    from macrolens_poc.sources.matrix import SeriesSpec
+    from macrolens_poc.storage.parquet_store import StorageLayout
 
 app = typer.Typer(add_completion=False, help="macrolens_poc CLI (Milestone M0 skeleton)")
 
@@ -33,12 +48,66 @@ def _ensure_dirs(settings: Settings) -> None:
     settings.paths.data_dir.mkdir(parents=True, exist_ok=True)
     settings.paths.logs_dir.mkdir(parents=True, exist_ok=True)
     settings.paths.reports_dir.mkdir(parents=True, exist_ok=True)
-    init_metadata_db(settings.paths.metadata_db)
+
+
+def _load_matrix(settings: Settings) -> MatrixLoadResult:
+    cache_dir = settings.paths.matrix_cache_dir if settings.sources_matrix_cache else None
+    return load_sources_matrix(settings.sources_matrix_path, cache_dir=cache_dir)
+
+
+def _configure_storage(settings: Settings) -> None:
+    """Size the stored-series cache; called by the commands that read/write series."""
+
+    from macrolens_poc.storage.parquet_store import configure_series_cache
+
+    configure_series_cache(settings.storage.cache_max_bytes)
+
+
+def _compact_storage(settings: Settings) -> int:
+    """Fold the dataset layout's pending deltas into the bucket files (once per run).
+
+    Returns the number of buckets rewritten; 0 for the other layouts.
+    """
+
+    if settings.storage.layout != "dataset":
+        return 0
+
+    from macrolens_poc.storage.dataset_store import DATASET_DIRNAME, compact_dataset
+
+    return compact_dataset(settings.paths.data_dir / DATASET_DIRNAME)
+
+
+def _open_logger(ctx: typer.Context, settings: Settings, run_ctx: RunContext) -> JsonlLogger:
+    """Run log for one command.
+
+    Synchronous unless logging.buffered is set; buffered loggers are closed (flushed)
+    when the command's context closes, also after typer.Exit or an exception.
+    """
+
+    log_cfg = settings.logging
+    logger = JsonlLogger(
+        default_log_path(settings.paths.logs_dir, now_utc=run_ctx.started_at_utc),
+        buffered=log_cfg.buffered,
+        encoder=resolve_encoder(log_cfg.encoder),
+        flush_interval_s=log_cfg.flush_interval_s,
+        buffer_bytes=log_cfg.buffer_bytes,
+    )
+    ctx.call_on_close(logger.close)
+    return logger
 
 
 def _record_series_metadata(
-    settings: Settings, spec: SeriesSpec, result: SeriesRunResult
-) -> None:
+    metadata: MetadataSession, run_id: str, spec: SeriesSpec, result: SeriesRunResult
+) -> float:
+    """Record one series run in the session's buffers.
+
+    Returns the seconds spent building and buffering the records (the
+    metadata_enqueue stage). Batch writes that a buffered call triggers are not
+    included; the session counts them in write_s (run_summary metadata_write_s).
+    """
+
+    start = time.perf_counter()
+    written_before = metadata.write_s
     metadata_record = SeriesMetadataRecord(
         series_id=spec.id,
         provider=spec.provider,
@@ -55,11 +124,52 @@ def _record_series_metadata(
         last_run_at=result.run_at,
         last_ok_at=result.run_at if result.status == "ok" else None,
         last_observation_date=result.last_observation_date,
-        stored_path=result.stored_path,
+        stored_path=Path(str(result.stored_path)) if result.stored_path is not None else None,
         new_points=result.new_points,
     )
 
-    upsert_series_metadata(settings.paths.metadata_db, metadata_record)
+    metadata.upsert_series_metadata(metadata_record)
+    metadata.append_series_run(
+        SeriesRunRecord(
+            run_id=run_id,
+            series_id=spec.id,
+            provider=spec.provider,
+            status=result.status,
+            message=result.message,
+            run_at=result.run_at,
+            new_points=result.new_points,
+            revised_points=result.revised_points,
+            last_observation_date=result.last_observation_date,
+        )
+    )
+    if result.summary is not None:
+        metadata.upsert_series_summaries([result.summary])
+    return time.perf_counter() - start - (metadata.write_s - written_before)
+
+
+def _series_run_event(
+    run_id: str, result: SeriesRunResult, *, metadata_s: Optional[float] = None
+) -> Dict[str, Any]:
+    event: Dict[str, Any] = {
+        "event": "series_run",
+        "run_id": run_id,
+        "series_id": result.series_id,
+        "provider": result.provider,
+        "status": result.status,
+        "message": result.message,
+        "stored_path": str(result.stored_path) if result.stored_path is not None else None,
+        "new_points": result.new_points,
+        "revised_points": result.revised_points,
+        "last_observation_date": result.last_observation_date.isoformat()
+        if result.last_observation_date
+        else None,
+        "run_at": result.run_at.isoformat(),
+    }
+    if result.timings:
+        event["timings"] = dict(result.timings)
+        if metadata_s is not None:
+            event["timings"]["metadata_enqueue"] = round(metadata_s, 6)
+    return event
 
 
 @app.callback()
@@ -86,12 +196,29 @@ def main(
 def run_all(
     ctx: typer.Context,
     lookback_days: int = typer.Option(3650, "--lookback-days", help="How many days to backfill per series"),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        min=1,
+        help="Series processed concurrently (default: ingest.workers from config; 1 = serial)",
+    ),
+    full_backfill: bool = typer.Option(
+        False,
+        "--full-backfill",
+        help="Fetch the whole lookback window instead of only new data since the last stored observation",
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the provider response cache (http_cache) for this run"
+    ),
 ) -> None:
     """Run ingestion for all enabled series."""
 
+    from macrolens_poc.pipeline import iter_series_runs, open_response_cache
+    from macrolens_poc.storage.parquet_store import series_cache_stats
+
     settings: Settings = ctx.obj["settings"]
     run_ctx = new_run_context()
-    logger = JsonlLogger(default_log_path(settings.paths.logs_dir, now_utc=run_ctx.started_at_utc))
+    logger = _open_logger(ctx, settings, run_ctx)
 
     logger.log(
         {
@@ -102,11 +229,14 @@ def run_all(
             "report_tz": settings.report_tz,
             "sources_matrix_path": str(settings.sources_matrix_path),
             "lookback_days": lookback_days,
+            "workers": workers if workers is not None else settings.ingest.workers,
+            "full_backfill": full_backfill,
+            "http_cache": settings.http_cache.enabled and not no_cache,
         }
     )
 
-    matrix_result = load_sources_matrix(settings.sources_matrix_path)
-    enabled = [s for s in matrix_result.matrix.series if s.enabled]
+    matrix_result = _load_matrix(settings)
+    enabled = matrix_result.index.enabled
 
     logger.log(
         {
@@ -115,40 +245,48 @@ def run_all(
             "series_total": len(matrix_result.matrix.series),
             "series_enabled": len(enabled),
             "path": str(matrix_result.path),
+            "cache_hit": matrix_result.cache_hit,
         }
     )
 
     status_counts = {"ok": 0, "warn": 0, "error": 0, "missing": 0}
     total_new_points = 0
+    stage_stats = StageStats()
+    _configure_storage(settings)
+    cache = None if no_cache else open_response_cache(settings)
+    init_metadata_db(settings.paths.metadata_db)
 
-    for spec in enabled:
-        result: SeriesRunResult = run_series(
-            settings=settings, spec=spec, lookback_days=lookback_days
-        )
-        status_counts[result.status] = status_counts.get(result.status, 0) + 1
-        total_new_points += result.new_points
+    with MetadataSession(settings.paths.metadata_db) as metadata:
+        for spec, result in iter_series_runs(
+            settings=settings,
+            specs=enabled,
+            lookback_days=lookback_days,
+            workers=workers,
+            full_backfill=full_backfill,
+            cache=cache,
+        ):
+            status_counts[result.status] = status_counts.get(result.status, 0) + 1
+            total_new_points += result.new_points
 
-        _record_series_metadata(settings, spec, result)
+            metadata_s = _record_series_metadata(metadata, run_ctx.run_id, spec, result)
 
-        logger.log(
-            {
-                "event": "series_run",
-                "run_id": run_ctx.run_id,
-                "series_id": result.series_id,
-                "provider": result.provider,
-                "status": result.status,
-                "message": result.message,
-                "stored_path": str(result.stored_path) if result.stored_path is not None else None,
-                "new_points": result.new_points,
-                "last_observation_date": result.last_observation_date.isoformat()
-                if result.last_observation_date
-                else None,
-                "run_at": result.run_at.isoformat(),
-            }
-        )
+            event = _series_run_event(run_ctx.run_id, result, metadata_s=metadata_s)
+            if "timings" in event:
+                stage_stats.add(result.provider, event["timings"])
+            logger.log(event)
+
+    compacted_buckets = _compact_storage(settings)
 
     summary = run_summary_event(ctx=run_ctx, status_counts=status_counts)
     summary["total_new_points"] = total_new_points
+    if settings.storage.layout == "dataset":
+        summary["compacted_buckets"] = compacted_buckets
+    summary["series_cache"] = series_cache_stats().as_dict()
+    if cache is not None:
+        summary["http_cache"] = cache.stats().as_dict()
+    if settings.logging.stage_timings:
+        summary["stage_timings"] = stage_stats.summary()
+        summary["metadata_write_s"] = round(metadata.write_s, 6)
     logger.log(summary)
 
 
@@ -157,12 +295,20 @@ def run_one(
     ctx: typer.Context,
     series_id: str = typer.Option(..., "--id", help="Internal series id"),
     lookback_days: int = typer.Option(3650, "--lookback-days", help="How many days to backfill"),
+    full_backfill: bool = typer.Option(
+        False,
+        "--full-backfill",
+        help="Fetch the whole lookback window instead of only new data since the last stored observation",
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the provider response cache (http_cache) for this run"
+    ),
 ) -> None:
     """Run ingestion for a single series id."""
 
     settings: Settings = ctx.obj["settings"]
     run_ctx = new_run_context()
-    logger = JsonlLogger(default_log_path(settings.paths.logs_dir, now_utc=run_ctx.started_at_utc))
+    logger = _open_logger(ctx, settings, run_ctx)
 
     logger.log(
         {
@@ -174,13 +320,15 @@ def run_one(
             "report_tz": settings.report_tz,
             "sources_matrix_path": str(settings.sources_matrix_path),
             "lookback_days": lookback_days,
+            "full_backfill": full_backfill,
+            "http_cache": settings.http_cache.enabled and not no_cache,
         }
     )
 
-    matrix_result = load_sources_matrix(settings.sources_matrix_path)
-    matches = [s for s in matrix_result.matrix.series if s.id == series_id]
+    matrix_result = _load_matrix(settings)
+    spec = matrix_result.index.by_id.get(series_id)
 
-    if not matches:
+    if spec is None:
         logger.log(
             {
                 "event": "series_not_found",
@@ -191,7 +339,6 @@ def run_one(
         )
         raise typer.Exit(code=2)
 
-    spec = matches[0]
     if not spec.enabled:
         logger.log(
             {
@@ -212,44 +359,79 @@ def run_one(
         }
     )
 
+    from macrolens_poc.pipeline import open_response_cache, run_series
+    from macrolens_poc.pipeline.windows import plan_observation_starts
+
+    _configure_storage(settings)
+    starts = plan_observation_starts(
+        settings=settings, specs=[spec], lookback_days=lookback_days, full_backfill=full_backfill
+    )
+    cache = None if no_cache else open_response_cache(settings)
     result: SeriesRunResult = run_series(
-        settings=settings, spec=spec, lookback_days=lookback_days
+        settings=settings,
+        spec=spec,
+        lookback_days=lookback_days,
+        observation_start=starts[spec.id],
+        cache=cache,
+        limiter=build_rate_limiters(settings.ingest.rate_limits).get(spec.provider),
     )
+    _compact_storage(settings)
 
-    _record_series_metadata(settings, spec, result)
+    init_metadata_db(settings.paths.metadata_db)
+    with MetadataSession(settings.paths.metadata_db) as metadata:
+        metadata_s = _record_series_metadata(metadata, run_ctx.run_id, spec, result)
 
-    logger.log(
-        {
-            "event": "series_run",
-            "run_id": run_ctx.run_id,
-            "series_id": result.series_id,
-            "provider": result.provider,
-            "status": result.status,
-            "message": result.message,
-            "stored_path": str(result.stored_path) if result.stored_path is not None else None,
-            "new_points": result.new_points,
-            "last_observation_date": result.last_observation_date.isoformat()
-            if result.last_observation_date
-            else None,
-            "run_at": result.run_at.isoformat(),
-        }
-    )
+    logger.log(_series_run_event(run_ctx.run_id, result, metadata_s=metadata_s))
 
     status_counts = {"ok": 0, "warn": 0, "error": 0, "missing": 0}
     status_counts[result.status] = 1
 
     summary = run_summary_event(ctx=run_ctx, status_counts=status_counts)
     summary["total_new_points"] = result.new_points
+    if cache is not None:
+        summary["http_cache"] = cache.stats().as_dict()
+    if settings.logging.stage_timings:
+        summary["metadata_write_s"] = round(metadata.write_s, 6)
     logger.log(summary)
 
 
 @app.command()
-def report(ctx: typer.Context) -> None:
+def report(
+    ctx: typer.Context,
+    windows: Optional[str] = typer.Option(
+        None,
+        "--windows",
+        help="Comma-separated delta windows in days, e.g. 1,5,21,63,252 (default: report.delta_windows)",
+    ),
+    delta_kind: Optional[str] = typer.Option(
+        None, "--delta-kind", help="Delta kind: abs | pct | log (default: report.delta_kind)"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", min=1, help="Worker processes for report building (default: report.jobs)"
+    ),
+) -> None:
     """Generate Markdown/JSON report from stored series."""
 
+    from macrolens_poc.report.generate import iter_series_reports, write_report_artifacts
+    from macrolens_poc.storage.parquet_store import series_cache_stats
+
     settings: Settings = ctx.obj["settings"]
     run_ctx = new_run_context()
-    logger = JsonlLogger(default_log_path(settings.paths.logs_dir, now_utc=run_ctx.started_at_utc))
+    logger = _open_logger(ctx, settings, run_ctx)
+
+    try:
+        delta_windows = _parse_windows(windows) if windows is not None else list(settings.report.delta_windows)
+    except ValueError:
+        typer.echo(f"invalid --windows: {windows} (expected positive integers, e.g. 1,5,21)", err=True)
+        raise typer.Exit(code=2) from None
+
+    kinds: Dict[str, DeltaKind] = {"abs": "abs", "pct": "pct", "log": "log"}
+    kind_name = delta_kind if delta_kind is not None else settings.report.delta_kind
+    if kind_name not in kinds:
+        typer.echo(f"unknown delta kind: {kind_name} (expected one of {sorted(kinds)})", err=True)
+        raise typer.Exit(code=2)
+    kind = kinds[kind_name]
+    report_jobs = jobs if jobs is not None else settings.report.jobs
 
     logger.log(
         {
@@ -258,21 +440,34 @@ def report(ctx: typer.Context) -> None:
             "run_id": run_ctx.run_id,
             "data_tz": settings.data_tz,
             "report_tz": settings.report_tz,
+            "windows": delta_windows,
+            "delta_kind": kind,
+            "jobs": report_jobs,
         }
     )
 
-    matrix_result = load_sources_matrix(settings.sources_matrix_path)
+    _configure_storage(settings)
+    matrix_result = _load_matrix(settings)
     reports = []
+    refreshed_summaries = []
     status_counts = {"ok": 0, "warn": 0, "error": 0, "missing": 0}
-
-    for spec in matrix_result.matrix.series:
-        series_report = generate_series_report(
-            spec=spec,
-            data_dir=settings.paths.data_dir,
-            windows=DEFAULT_DELTA_WINDOWS,
-        )
+    source_counts = {"summary": 0, "parquet": 0}
+
+    for series_report in iter_series_reports(
+        specs=matrix_result.matrix.series,
+        data_dir=settings.paths.data_dir,
+        windows=delta_windows,
+        layout=settings.storage.layout,
+        kind=kind,
+        jobs=report_jobs,
+        summaries=list_series_summaries(settings.paths.metadata_db),
+    ):
         status_counts[series_report.status] = status_counts.get(series_report.status, 0) + 1
         reports.append(series_report)
+        if series_report.status != "missing":
+            source_counts[series_report.source] += 1
+        if series_report.summary is not None:
+            refreshed_summaries.append(series_report.summary)
 
         logger.log(
             {
@@ -286,15 +481,22 @@ def report(ctx: typer.Context) -> None:
                 "last_value": series_report.last_value,
                 "deltas": series_report.deltas,
                 "path": str(series_report.path),
+                "source": series_report.source,
             }
         )
 
+    # series read from Parquet get a fresh summary, so the next report can skip them
+    if refreshed_summaries:
+        init_metadata_db(settings.paths.metadata_db)
+        upsert_series_summaries(settings.paths.metadata_db, refreshed_summaries)
+
     artifacts = write_report_artifacts(
         reports=reports,
         reports_dir=settings.paths.reports_dir,
         report_tz=settings.report_tz,
         run_ctx=run_ctx,
-        windows=DEFAULT_DELTA_WINDOWS,
+        windows=delta_windows,
+        kind=kind,
     )
 
     logger.log(
@@ -307,8 +509,161 @@ def report(ctx: typer.Context) -> None:
         }
     )
 
+    summary = run_summary_event(ctx=run_ctx, status_counts=status_counts)
+    summary["series_cache"] = series_cache_stats().as_dict()
+    summary["report_sources"] = source_counts
+    logger.log(summary)
+
+
+def _parse_windows(raw: str) -> List[int]:
+    windows = [int(part) for part in raw.split(",") if part.strip()]
+    if not windows or any(w <= 0 for w in windows):
+        raise ValueError(raw)
+    return windows
+
+
+@app.command("migrate-storage")
+def migrate_storage(
+    ctx: typer.Context,
+    to_layout: str = typer.Option(
+        "partitioned", "--to", help="Target storage layout: file | partitioned | dataset"
+    ),
+) -> None:
+    """Convert stored series of all matrix entries to another storage layout.
+
+    Set storage.layout in the config to the same value afterwards.
+    """
+
+    from macrolens_poc.storage.parquet_store import migrate_series, series_exists, series_path
+
+    settings: Settings = ctx.obj["settings"]
+    run_ctx = new_run_context()
+    logger = _open_logger(ctx, settings, run_ctx)
+
+    layouts: Dict[str, StorageLayout] = {"file": "file", "partitioned": "partitioned", "dataset": "dataset"}
+    if to_layout not in layouts:
+        typer.echo(f"unknown layout: {to_layout} (expected one of {sorted(layouts)})", err=True)
+        raise typer.Exit(code=2)
+    target = layouts[to_layout]
+
+    logger.log(
+        {
+            "event": "command_start",
+            "command": "migrate-storage",
+            "run_id": run_ctx.run_id,
+            "to_layout": target,
+        }
+    )
+
+    _configure_storage(settings)
+    matrix_result = _load_matrix(settings)
+    status_counts = {"ok": 0, "warn": 0, "error": 0, "missing": 0}
+
+    for spec in matrix_result.matrix.series:
+        dst = series_path(settings.paths.data_dir, spec.id, target)
+        sources = [
+            series_path(settings.paths.data_dir, spec.id, layout)
+            for layout in layouts.values()
+            if layout != target
+        ]
+        src = next((p for p in sources if series_exists(p)), None)
+
+        if src is None:
+            migrated = series_exists(dst)
+            status = "ok" if migrated else "missing"
+            message = "already migrated" if migrated else "stored series not found"
+            rows = None
+        else:
+            try:
+                result = migrate_series(src, dst)
+            except Exception as exc:
+                status, message, rows = "error", f"migrate failed: {exc}", None
+            else:
+                status, message = "ok", "migrated"
+                rows = result.rows_after if result is not None else 0
+
+        status_counts[status] += 1
+        logger.log(
+            {
+                "event": "series_migrated",
+                "run_id": run_ctx.run_id,
+                "series_id": spec.id,
+                "status": status,
+                "message": message,
+                "src": str(src) if src is not None else None,
+                "dst": str(dst),
+                "rows": rows,
+            }
+        )
+
+    if target == "dataset":
+        from macrolens_poc.storage.dataset_store import DATASET_DIRNAME, compact_dataset
+
+        compact_dataset(settings.paths.data_dir / DATASET_DIRNAME)
+
     logger.log(run_summary_event(ctx=run_ctx, status_counts=status_counts))
 
 
+@app.command()
+def status(
+    ctx: typer.Context,
+    stale_days: Optional[int] = typer.Option(
+        None, "--stale-days", min=0, help="Only series without new data points for more than N days"
+    ),
+    min_failures: int = typer.Option(
+        0, "--min-failures", min=0, help="Only series with at least N non-ok runs since their last ok run"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print one JSON object per series"),
+) -> None:
+    """Show per-series health (last ok, last new data, failure streak) from the run history."""
+
+    settings: Settings = ctx.obj["settings"]
+    now = datetime.now(timezone.utc)
+    stale_before = now - timedelta(days=stale_days) if stale_days is not None else None
+
+    init_metadata_db(settings.paths.metadata_db)
+    rows = query_series_status(
+        settings.paths.metadata_db, stale_before=stale_before, min_failure_streak=min_failures
+    )
+
+    if as_json:
+        for row in rows:
+            typer.echo(json.dumps(_series_status_payload(row, now=now), ensure_ascii=False))
+        return
+
+    headers = ["ID", "Provider", "Status", "Last OK", "Last New Data", "Days Without Data", "Failure Streak"]
+    typer.echo(" | ".join(headers))
+    for row in rows:
+        payload = _series_status_payload(row, now=now)
+        typer.echo(
+            " | ".join(
+                str(v) if v is not None else "n/a"
+                for v in (
+                    payload["series_id"],
+                    payload["provider"],
+                    payload["status"],
+                    payload["last_ok_at"],
+                    payload["last_new_data_at"],
+                    payload["days_without_new_data"],
+                    payload["failure_streak"],
+                )
+            )
+        )
+
+
+def _series_status_payload(row: SeriesStatusRecord, *, now: datetime) -> Dict[str, Any]:
+    return {
+        "series_id": row.series_id,
+        "provider": row.provider,
+        "status": row.status,
+        "last_run_at": row.last_run_at.isoformat(),
+        "last_ok_at": row.last_ok_at.isoformat() if row.last_ok_at else None,
+        "last_new_data_at": row.last_new_data_at.isoformat() if row.last_new_data_at else None,
+        "days_without_new_data": (now - row.last_new_data_at).days if row.last_new_data_at else None,
+        "last_observation_date": row.last_observation_date.isoformat() if row.last_observation_date else None,
+        "failure_streak": row.failure_streak,
+    }
+
+
 if __name__ == "__main__":
     app()
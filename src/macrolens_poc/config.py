@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 import yaml
 from dotenv import load_dotenv
@@ -13,6 +13,137 @@ class PathsConfig(BaseModel):
     logs_dir: Path = Field(default=Path("logs"))
     reports_dir: Path = Field(default=Path("reports"))
     metadata_db: Path = Field(default=Path("data/metadata.sqlite"))
+    http_cache_dir: Path = Field(default=Path("data/http_cache"))
+    matrix_cache_dir: Path = Field(default=Path("data/matrix_cache"))
+
+
+class StorageConfig(BaseModel):
+    """Series storage settings.
+
+    - layout: "file" (data/series/{id}.parquet) or "partitioned"
+      (data/series/{id}/year=YYYY.parquet + manifest.json) or "dataset" (all series in
+      one long-format dataset under data/dataset/); switch existing data with the
+      migrate-storage command
+    - cache_max_bytes: byte budget of the in-process LRU cache of loaded series
+      (0 disables it)
+    - revisions: providers whose value history is kept in the vintage log
+      data/revisions/{id}/, one file per vintage (see storage.revision_store); empty = off
+    """
+
+    layout: Literal["file", "partitioned", "dataset"] = Field(default="file")
+    cache_max_bytes: int = Field(default=256 * 1024 * 1024, ge=0)
+    revisions: List[str] = Field(default_factory=list)
+
+
+class HttpConfig(BaseModel):
+    """Shared HTTP session settings (one pooled keep-alive session per run).
+
+    - pool_size: keep-alive connections per provider host
+    - pool_block: wait for a free pooled connection instead of opening extra ones
+    """
+
+    pool_size: int = Field(default=10, ge=1)
+    pool_block: bool = Field(default=True)
+
+
+class HttpCacheConfig(BaseModel):
+    """On-disk provider response cache (see sources.http_cache; FRED only).
+
+    - enabled: answer repeated identical requests from paths.http_cache_dir
+      (run-all/run-one --no-cache bypass it)
+    - max_bytes: size budget of cached bodies; least recently used entries go first
+    - ttl_s: seconds a response counts as fresh, per provider
+    - frequency_ttl_s: per series frequency_target; overrides ttl_s when set
+    Stale entries are revalidated via ETag/Last-Modified when the server sent them.
+    """
+
+    enabled: bool = Field(default=False)
+    max_bytes: int = Field(default=256 * 1024 * 1024, ge=0)
+    ttl_s: Dict[str, float] = Field(default_factory=lambda: {"fred": 3600.0})
+    frequency_ttl_s: Dict[str, float] = Field(default_factory=dict)
+
+    def ttl_for(self, provider: str, frequency: Optional[str] = None) -> float:
+        if frequency is not None and frequency in self.frequency_ttl_s:
+            return self.frequency_ttl_s[frequency]
+        return self.ttl_s.get(provider, 0.0)
+
+
+class FredConfig(BaseModel):
+    """FRED adapter settings.
+
+    - base_url: API root; requests go to {base_url}/series/observations
+    - page_size: observations per request (limit/offset paging, FRED max 100000);
+      smaller pages bound the raw payload held in memory per series
+    - prefetch: request the next page while the current one is normalized
+    """
+
+    base_url: str = Field(default="https://api.stlouisfed.org/fred")
+    page_size: int = Field(default=100_000, ge=1, le=100_000)
+    prefetch: bool = Field(default=True)
+
+
+class RateLimitConfig(BaseModel):
+    """Token bucket for one provider: sustained requests per second plus burst."""
+
+    rate_per_s: float = Field(gt=0)
+    burst: float = Field(default=1.0, ge=1)
+
+
+class IngestConfig(BaseModel):
+    """Ingestion runner settings.
+
+    - workers: total number of series processed concurrently by run-all (1 = serial)
+    - provider_concurrency: per-provider cap on in-flight series (providers not listed
+      are only bounded by workers)
+    - yahoo_batch_size: yfinance symbols downloaded per batched call (1 = one call per
+      symbol)
+    - revision_overlap_days: incremental runs re-request this many days before the
+      last stored observation so provider revisions are picked up
+    - rate_limits: per-provider token buckets shared by all workers of a run
+      (providers not listed are not paced); FRED allows 120 requests/minute per key
+    """
+
+    workers: int = Field(default=1, ge=1)
+    provider_concurrency: Dict[str, int] = Field(
+        default_factory=lambda: {"fred": 4, "yfinance": 2}
+    )
+    yahoo_batch_size: int = Field(default=50, ge=1)
+    revision_overlap_days: int = Field(default=90, ge=0)
+    rate_limits: Dict[str, RateLimitConfig] = Field(
+        default_factory=lambda: {"fred": RateLimitConfig(rate_per_s=2.0, burst=10)}
+    )
+
+
+class LoggingConfig(BaseModel):
+    """JSONL run log settings (see logging_utils.JsonlLogger).
+
+    - buffered: opt-in; write events from a background thread in batches (flushed
+      when the command's context closes or at exit; a killed process loses the
+      unwritten tail). Off by default, so every event is on disk once log() returns
+    - encoder: json | orjson | auto (orjson if installed)
+    - flush_interval_s / buffer_bytes: write a batch when either threshold is reached
+    - stage_timings: per-stage wall times in series_run events and per-provider
+      p50/p95/max in run_summary
+    """
+
+    buffered: bool = Field(default=False)
+    encoder: Literal["json", "orjson", "auto"] = Field(default="json")
+    flush_interval_s: float = Field(default=1.0, gt=0)
+    buffer_bytes: int = Field(default=64 * 1024, ge=0)
+    stage_timings: bool = Field(default=True)
+
+
+class ReportConfig(BaseModel):
+    """Report settings.
+
+    - delta_windows: lookback windows in calendar days (e.g. 1/5/21/63/252)
+    - delta_kind: abs (last - prev), pct (percent change) or log (log return)
+    - jobs: worker processes used to build per-series reports (1 = in-process)
+    """
+
+    delta_windows: List[int] = Field(default_factory=lambda: [1, 5, 21], min_length=1)
+    delta_kind: Literal["abs", "pct", "log"] = Field(default="abs")
+    jobs: int = Field(default=1, ge=1)
 
 
 class Settings(BaseModel):
@@ -24,6 +155,8 @@ class Settings(BaseModel):
 
     Sources matrix:
     - sources_matrix_path points to the YAML that lists all series (single source of truth).
+    - sources_matrix_cache keeps the validated matrix under paths.matrix_cache_dir, keyed
+      by the YAML's mtime/size and sha256 (see sources.matrix.load_sources_matrix).
 
     Provider keys:
     - fred_api_key is read from env/YAML and must not be committed.
@@ -33,10 +166,18 @@ class Settings(BaseModel):
     report_tz: str = Field(default="Europe/Vienna")
 
     sources_matrix_path: Path = Field(default=Path("config/sources_matrix.yaml"))
+    sources_matrix_cache: bool = Field(default=True)
 
     fred_api_key: Optional[str] = Field(default=None)
 
     paths: PathsConfig = Field(default_factory=PathsConfig)
+    storage: StorageConfig = Field(default_factory=StorageConfig)
+    ingest: IngestConfig = Field(default_factory=IngestConfig)
+    http: HttpConfig = Field(default_factory=HttpConfig)
+    http_cache: HttpCacheConfig = Field(default_factory=HttpCacheConfig)
+    fred: FredConfig = Field(default_factory=FredConfig)
+    report: ReportConfig = Field(default_factory=ReportConfig)
+    logging: LoggingConfig = Field(default_factory=LoggingConfig)
 
 
 def load_settings(config_path: Optional[Path]) -> Settings:
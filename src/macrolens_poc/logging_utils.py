@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import atexit
 import json
+import queue
+import threading
+import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, TextIO, Union
+
+Encoder = Callable[[Dict[str, Any]], str]
+EncoderName = Literal["json", "orjson", "auto"]
 
 
 @dataclass(frozen=True)
@@ -23,20 +30,199 @@ def default_log_path(logs_dir: Path, now_utc: Optional[datetime] = None) -> Path
     return logs_dir / f"run-{ts.strftime('%Y%m%d')}.jsonl"
 
 
+def json_encoder(event: Dict[str, Any]) -> str:
+    return json.dumps(event, ensure_ascii=False, sort_keys=True)
+
+
+def resolve_encoder(name: EncoderName = "json") -> Encoder:
+    """Return the event encoder for name.
+
+    - json: stdlib json (default)
+    - orjson: orjson (optional dependency; raises ImportError if missing). Output
+      differs from json only in whitespace and NaN/Infinity (written as null).
+    - auto: orjson if installed, else json
+    """
+
+    if name == "json":
+        return json_encoder
+
+    try:
+        import orjson
+    except ImportError:
+        if name == "orjson":
+            raise
+        return json_encoder
+
+    options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+    def orjson_encoder(event: Dict[str, Any]) -> str:
+        return orjson.dumps(event, option=options).decode("utf-8")
+
+    return orjson_encoder
+
+
+_FLUSH = object()
+_STOP = object()
+
+
 class JsonlLogger:
     """Minimal JSONL logger.
 
     Writes one JSON object per line.
+
+    Default mode encodes and appends each event on the caller's thread (one open/write
+    per event). buffered=True hands events to a background writer thread instead: it
+    encodes them, keeps the file open and writes batches of whole lines when
+    buffer_bytes is reached or flush_interval_s has passed, on flush() and on close()
+    (also registered via atexit). Events must not be mutated after log().
+
+    Both modes are thread-safe and never interleave partial lines. encoder replaces
+    the JSON serializer (see resolve_encoder).
     """
 
-    def __init__(self, path: Path) -> None:
+    def __init__(
+        self,
+        path: Path,
+        *,
+        buffered: bool = False,
+        encoder: Optional[Encoder] = None,
+        flush_interval_s: float = 1.0,
+        buffer_bytes: int = 64 * 1024,
+    ) -> None:
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.encoder: Encoder = encoder or json_encoder
+        self.buffered = buffered
+        self.flush_interval_s = flush_interval_s
+        self.buffer_bytes = buffer_bytes
+
+        self._lock = threading.Lock()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._queue: "queue.SimpleQueue[Union[Dict[str, Any], object, threading.Event]]" = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+
+        if buffered:
+            self._writer = threading.Thread(target=self._run_writer, name="jsonl-logger", daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
+
+    def __enter__(self) -> "JsonlLogger":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def log(self, event: Dict[str, Any]) -> None:
-        line = json.dumps(event, ensure_ascii=False, sort_keys=True)
+        if self._writer is not None and not self._closed:
+            self._queue.put(event)
+            return
+
+        line = self.encoder(event) + "\n"
+        with self._lock:
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line)
+
+    def flush(self) -> None:
+        """Block until all events logged so far are written."""
+
+        if self._writer is None or self._closed:
+            return
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        done.wait()
+        self._raise_writer_error()
+
+    def close(self) -> None:
+        """Write pending events and stop the writer thread (idempotent)."""
+
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        if self._writer is not None:
+            self._queue.put(_STOP)
+            self._writer.join()
+            atexit.unregister(self.close)
+            # events logged concurrently with close() after the stop marker
+            self._drain_after_stop()
+        self._raise_writer_error()
+
+    def _run_writer(self) -> None:
+        pending: List[str] = []
+        pending_bytes = 0
+        deadline = 0.0  # time by which the oldest pending line must be written
+
         with self.path.open("a", encoding="utf-8") as f:
-            f.write(line + "\n")
+            while True:
+                timeout = max(0.0, deadline - time.monotonic()) if pending else None
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+
+                flush_done: Optional[threading.Event] = None
+                if isinstance(item, tuple) and item[0] is _FLUSH:
+                    flush_done = item[1]
+                elif isinstance(item, dict):
+                    line = self._encode(item)
+                    if line is not None:
+                        if not pending:
+                            deadline = time.monotonic() + self.flush_interval_s
+                        pending.append(line)
+                        pending_bytes += len(line)
+
+                stop = item is _STOP
+                if pending and (
+                    stop
+                    or flush_done is not None
+                    or pending_bytes >= self.buffer_bytes
+                    or time.monotonic() >= deadline
+                ):
+                    self._write(f, pending)
+                    pending, pending_bytes = [], 0
+
+                if flush_done is not None:
+                    flush_done.set()
+                if stop:
+                    return
+
+    def _encode(self, event: Dict[str, Any]) -> Optional[str]:
+        try:
+            return self.encoder(event) + "\n"
+        except Exception as exc:  # keep the writer alive; surface on flush/close
+            self._error = self._error or exc
+            return None
+
+    def _write(self, f: TextIO, lines: List[str]) -> None:
+        try:
+            f.write("".join(lines))
+            f.flush()
+        except Exception as exc:
+            self._error = self._error or exc
+
+    def _drain_after_stop(self) -> None:
+        lines: List[str] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, dict):
+                line = self._encode(item)
+                if line is not None:
+                    lines.append(line)
+            elif isinstance(item, tuple) and item[0] is _FLUSH:
+                item[1].set()
+        if lines:
+            with self.path.open("a", encoding="utf-8") as f:
+                self._write(f, lines)
+
+    def _raise_writer_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(f"log writer failed: {error}") from error
 
 
 def run_summary_event(*, ctx: RunContext, status_counts: Dict[str, int]) -> Dict[str, Any]:
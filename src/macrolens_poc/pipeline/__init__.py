@@ -1,5 +1,6 @@
 """Pipeline orchestration (fetch → normalize → store → validate)."""
 
-from macrolens_poc.pipeline.run_series import SeriesRunResult, run_series
+from macrolens_poc.pipeline.executor import iter_series_runs
+from macrolens_poc.pipeline.run_series import SeriesRunResult, open_response_cache, run_series
 
-__all__ = ["SeriesRunResult", "run_series"]
+__all__ = ["SeriesRunResult", "iter_series_runs", "open_response_cache", "run_series"]
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from macrolens_poc.config import Settings
+from macrolens_poc.pipeline.run_series import SeriesRunResult, run_series
+from macrolens_poc.pipeline.windows import plan_observation_starts
+from macrolens_poc.sources.http import build_http_session
+from macrolens_poc.sources.http_cache import ResponseCache
+from macrolens_poc.sources.matrix import SeriesSpec
+from macrolens_poc.sources.rate_limit import build_rate_limiters
+from macrolens_poc.sources.yahoo import fetch_yahoo_history_batch
+
+SeriesRunner = Callable[[SeriesSpec], SeriesRunResult]
+UnitRunner = Callable[[Sequence[SeriesSpec]], List[SeriesRunResult]]
+
+
+def iter_series_runs(
+    *,
+    settings: Settings,
+    specs: Iterable[SeriesSpec],
+    lookback_days: int = 3650,
+    workers: Optional[int] = None,
+    provider_concurrency: Optional[Mapping[str, int]] = None,
+    full_backfill: bool = False,
+    cache: Optional[ResponseCache] = None,
+) -> Iterator[Tuple[SeriesSpec, SeriesRunResult]]:
+    """Run many series and yield (spec, result) pairs as they complete.
+
+    With workers == 1 the series run serially in the given order. Otherwise a thread
+    pool runs up to `workers` units at once, with at most
+    provider_concurrency[provider] of them in flight per provider.
+
+    Fetch windows are incremental (see pipeline.windows.plan_observation_starts)
+    unless full_backfill is set.
+
+    A unit is a single series, except for yfinance: enabled yfinance specs with the
+    same window start are grouped into chunks of ingest.yahoo_batch_size that are
+    downloaded with one batched yfinance call (daily bars) and then stored per series.
+
+    Results are always yielded on the calling thread, so callers can write metadata
+    and JSONL logs without extra locking. Parquet writes happen inside the workers.
+    In the file and partitioned layouts every series id is unique within the matrix
+    and has its own storage path. In the dataset layout, series share bucket files;
+    there, writes to one bucket are serialized by the per-bucket locks in
+    storage.dataset_store, which only hold within this process.
+
+    One pooled keep-alive HTTP session (settings.http) is created for the whole run
+    and shared by all workers; its pool is grown to at least `workers` connections.
+    cache (see run_series.open_response_cache) is shared the same way, as are the
+    per-provider rate limiters built from settings.ingest.rate_limits.
+    """
+
+    n_workers = settings.ingest.workers if workers is None else workers
+    limits = settings.ingest.provider_concurrency if provider_concurrency is None else provider_concurrency
+    spec_list = list(specs)
+    starts = plan_observation_starts(
+        settings=settings, specs=spec_list, lookback_days=lookback_days, full_backfill=full_backfill
+    )
+
+    limiters = build_rate_limiters(settings.ingest.rate_limits)
+
+    with build_http_session(
+        pool_size=max(settings.http.pool_size, n_workers),
+        pool_block=settings.http.pool_block,
+    ) as session:
+
+        def _runner(unit: Sequence[SeriesSpec]) -> List[SeriesRunResult]:
+            if len(unit) > 1 and unit[0].provider == "yfinance":
+                batch_start = time.perf_counter()
+                fetched = fetch_yahoo_history_batch(
+                    symbols=[s.provider_symbol for s in unit],
+                    start=starts[unit[0].id],
+                    end=None,
+                    chunk_size=len(unit),
+                    limiter=limiters.get("yfinance"),
+                )
+                # stage timings: each series gets an even share of the batched call
+                share = len(unit)
+                batch_s = time.perf_counter() - batch_start
+                return [
+                    run_series(
+                        settings=settings,
+                        spec=s,
+                        lookback_days=lookback_days,
+                        observation_start=starts[s.id],
+                        prefetched=replace(
+                            fetched[s.provider_symbol],
+                            retry_sleep_s=fetched[s.provider_symbol].retry_sleep_s / share,
+                            rate_limit_wait_s=fetched[s.provider_symbol].rate_limit_wait_s / share,
+                        ),
+                        prefetch_s=batch_s / share,
+                    )
+                    for s in unit
+                ]
+
+            return [
+                run_series(
+                    settings=settings,
+                    spec=s,
+                    lookback_days=lookback_days,
+                    observation_start=starts[s.id],
+                    session=session,
+                    cache=cache,
+                    limiter=limiters.get(str(s.provider)),
+                )
+                for s in unit
+            ]
+
+        units = plan_units(
+            spec_list,
+            batch_sizes={"yfinance": settings.ingest.yahoo_batch_size},
+            batch_key=lambda s: starts[s.id],
+        )
+        yield from run_units(units, runner=_runner, workers=n_workers, provider_concurrency=limits)
+
+
+def plan_units(
+    specs: Iterable[SeriesSpec],
+    *,
+    batch_sizes: Mapping[str, int],
+    batch_key: Optional[Callable[[SeriesSpec], Hashable]] = None,
+) -> List[List[SeriesSpec]]:
+    """Split specs into units of work, chunking batchable providers.
+
+    Only specs with the same provider and batch_key (e.g. window start) share a
+    batch. Matrix order is kept within every provider.
+    """
+
+    units: List[List[SeriesSpec]] = []
+    open_batches: Dict[Tuple[str, Hashable], List[SeriesSpec]] = {}
+
+    for spec in specs:
+        size = batch_sizes.get(str(spec.provider), 1)
+        if size <= 1:
+            units.append([spec])
+            continue
+
+        key = (str(spec.provider), batch_key(spec) if batch_key is not None else None)
+        batch = open_batches.get(key)
+        if batch is None or len(batch) >= size:
+            batch = []
+            open_batches[key] = batch
+            units.append(batch)
+        batch.append(spec)
+
+    return units
+
+
+def run_specs(
+    specs: Iterable[SeriesSpec],
+    *,
+    runner: SeriesRunner,
+    workers: int,
+    provider_concurrency: Mapping[str, int],
+) -> Iterator[Tuple[SeriesSpec, SeriesRunResult]]:
+    """Run one series per unit (see run_units)."""
+
+    def _unit_runner(unit: Sequence[SeriesSpec]) -> List[SeriesRunResult]:
+        return [runner(spec) for spec in unit]
+
+    return run_units(
+        [[spec] for spec in specs],
+        runner=_unit_runner,
+        workers=workers,
+        provider_concurrency=provider_concurrency,
+    )
+
+
+def run_units(
+    units: Iterable[Sequence[SeriesSpec]],
+    *,
+    runner: UnitRunner,
+    workers: int,
+    provider_concurrency: Mapping[str, int],
+) -> Iterator[Tuple[SeriesSpec, SeriesRunResult]]:
+    """Scheduling core of iter_series_runs (runner is injectable for tests).
+
+    Every unit must contain specs of a single provider; provider caps count units.
+    """
+
+    unit_list = [list(u) for u in units if u]
+
+    if workers <= 1:
+        for unit in unit_list:
+            yield from zip(unit, _run_guarded(runner, unit))
+        return
+
+    # one FIFO queue per provider; the dispatcher only submits a unit when both a
+    # worker slot and a provider slot are free, so no pool thread ever sits blocked
+    queues: Dict[str, Deque[List[SeriesSpec]]] = {}
+    for unit in unit_list:
+        queues.setdefault(str(unit[0].provider), deque()).append(unit)
+
+    provider_order: List[str] = list(queues)
+    in_flight: Dict[str, int] = {p: 0 for p in provider_order}
+    pending: Dict[Future[List[SeriesRunResult]], List[SeriesSpec]] = {}
+    next_provider = 0
+
+    def _has_capacity(provider: str) -> bool:
+        cap = provider_concurrency.get(provider)
+        return cap is None or cap <= 0 or in_flight[provider] < cap
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="series") as pool:
+        while pending or any(queues.values()):
+            # round-robin over providers so a long FRED queue does not starve yfinance
+            submitted = True
+            while submitted and len(pending) < workers:
+                submitted = False
+                for offset in range(len(provider_order)):
+                    provider = provider_order[(next_provider + offset) % len(provider_order)]
+                    if queues[provider] and _has_capacity(provider):
+                        unit = queues[provider].popleft()
+                        pending[pool.submit(_run_guarded, runner, unit)] = unit
+                        in_flight[provider] += 1
+                        next_provider = (next_provider + offset + 1) % len(provider_order)
+                        submitted = True
+                        break
+
+            if not pending:
+                break
+
+            done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+            for future in done:
+                unit = pending.pop(future)
+                in_flight[str(unit[0].provider)] -= 1
+                yield from zip(unit, future.result())
+
+
+def _run_guarded(runner: UnitRunner, unit: Sequence[SeriesSpec]) -> List[SeriesRunResult]:
+    """Never let one unit take down the whole run."""
+
+    try:
+        results = runner(unit)
+    except Exception as exc:
+        return [_error_result(spec, f"code=unhandled_exception; detail={exc}") for spec in unit]
+
+    if len(results) != len(unit):
+        return [_error_result(spec, "code=runner_result_mismatch") for spec in unit]
+    return results
+
+
+def _error_result(spec: SeriesSpec, message: str) -> SeriesRunResult:
+    return SeriesRunResult(
+        series_id=spec.id,
+        provider=str(spec.provider),
+        status="error",
+        message=message,
+        stored_path=None,
+        new_points=0,
+        last_observation_date=None,
+        run_at=datetime.now(timezone.utc),
+    )
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from contextlib import closing
+from dataclasses import dataclass, field, replace
 from datetime import date, datetime, timedelta, timezone
-from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd
+import requests
 
 from macrolens_poc.config import Settings
 from macrolens_poc.sources.matrix import SeriesSpec
-from macrolens_poc.sources.fred import fetch_fred_series_observations
+from macrolens_poc.sources.fred import FetchResult as FredFetchResult
+from macrolens_poc.sources.fred import iter_fred_series_observations
+from macrolens_poc.sources.http_cache import ResponseCache
+from macrolens_poc.sources.rate_limit import TokenBucket
+from macrolens_poc.sources.yahoo import FetchResult as YahooFetchResult
 from macrolens_poc.sources.yahoo import fetch_yahoo_history
-from macrolens_poc.storage.parquet_store import StoreResult, load_series, store_series
+from macrolens_poc.storage.metadata_db import SeriesSummaryRecord
+from macrolens_poc.storage.parquet_store import SeriesLocation, StoreResult, load_series, series_path, store_series
+from macrolens_poc.storage.revision_store import record_vintages, revisions_path
+from macrolens_poc.storage.summary import summarize_store_result
+from macrolens_poc.timing import StageTimer
+
+# fetch statuses from best to worst
+_STATUS_ORDER = ("ok", "warn", "error", "missing")
 
 
 @dataclass(frozen=True)
@@ -20,10 +33,14 @@ class SeriesRunResult:
     provider: str
     status: str  # ok/warn/error/missing
     message: str
-    stored_path: Optional[Path]
+    stored_path: Optional[SeriesLocation]
     new_points: int
     last_observation_date: Optional[date]
     run_at: datetime
+    revised_points: int = 0
+    summary: Optional[SeriesSummaryRecord] = None
+    # seconds per stage (timing.STAGES); empty when logging.stage_timings is off
+    timings: Dict[str, float] = field(default_factory=dict)
 
 
 def _normalize_timeseries(df: pd.DataFrame) -> pd.DataFrame:
@@ -46,36 +63,233 @@ def _normalize_timeseries(df: pd.DataFrame) -> pd.DataFrame:
     return out[["date", "value"]]
 
 
+def _fetch_fred_normalized(
+    *,
+    settings: Settings,
+    spec: SeriesSpec,
+    observation_start: date,
+    session: Optional[requests.Session],
+    cache: Optional[ResponseCache],
+    limiter: Optional[TokenBucket],
+) -> Tuple[FredFetchResult, float]:
+    """Page through FRED (settings.fred.page_size) normalizing each page as it arrives.
+
+    Returns one result whose data is the normalized series (sleeps and limiter waits
+    summed over pages) and the seconds spent normalizing. Its status/message are the
+    worst among the pages that carried rows, so an empty trailing page (warn) does
+    not mask the pages before it. A page without data (error/missing) ends the fetch
+    with that page's status; nothing fetched before it is kept. realtime_starts
+    covers all pages when any page reports per-observation realtime_start.
+    """
+
+    pages = iter_fred_series_observations(
+        page_size=settings.fred.page_size,
+        prefetch=settings.fred.prefetch,
+        series_id=spec.provider_symbol,
+        api_key=settings.fred_api_key,
+        observation_start=observation_start,
+        observation_end=None,
+        session=session,
+        base_url=settings.fred.base_url,
+        cache=cache,
+        cache_ttl_s=settings.http_cache.ttl_for("fred", spec.frequency_target),
+        limiter=limiter,
+    )
+    frames: List[pd.DataFrame] = []
+    with_rows: List[FredFetchResult] = []
+    slept = waited = normalize_s = 0.0
+    last: Optional[FredFetchResult] = None
+    worst: Optional[FredFetchResult] = None  # worst-status page with rows
+    with closing(pages):
+        for page in pages:
+            slept += page.retry_sleep_s
+            waited += page.rate_limit_wait_s
+            last = page
+            if page.data is None:
+                return replace(page, retry_sleep_s=slept, rate_limit_wait_s=waited), normalize_s
+            if not page.data.empty:
+                with_rows.append(page)
+                if worst is None or _STATUS_ORDER.index(page.status) > _STATUS_ORDER.index(worst.status):
+                    worst = page
+            start = time.perf_counter()
+            try:
+                frames.append(_normalize_timeseries(page.data))
+            except Exception as exc:
+                failed = FredFetchResult(status="error", message=f"normalize failed: {exc}", data=None)
+                return replace(failed, retry_sleep_s=slept, rate_limit_wait_s=waited), normalize_s
+            finally:
+                normalize_s += time.perf_counter() - start
+
+    assert last is not None  # the pager yields at least one page
+    data = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+    if len(frames) > 1 and not (data["date"].is_monotonic_increasing and data["date"].is_unique):
+        # pages of a changing series can overlap at the seams
+        start = time.perf_counter()
+        data = _normalize_timeseries(data)
+        normalize_s += time.perf_counter() - start
+    return (
+        replace(
+            worst or last,
+            data=data,
+            retry_sleep_s=slept,
+            rate_limit_wait_s=waited,
+            realtime_starts=_page_realtime_starts(with_rows),
+        ),
+        normalize_s,
+    )
+
+
+def _page_realtime_starts(pages: List[FredFetchResult]) -> Optional[pd.DataFrame]:
+    """Per-observation realtime_start over all pages (None if no page reports its own)."""
+
+    if all(page.realtime_starts is None for page in pages):
+        return None
+    frames = []
+    for page in pages:
+        if page.realtime_starts is not None:
+            frames.append(page.realtime_starts)
+        elif page.data is not None and page.realtime_start is not None:
+            frames.append(
+                pd.DataFrame({"date": page.data["date"], "realtime_start": pd.Timestamp(page.realtime_start, tz="UTC")})
+            )
+    return pd.concat(frames, ignore_index=True)
+
+
+def _record_revisions(
+    *,
+    settings: Settings,
+    spec: SeriesSpec,
+    store_result: StoreResult,
+    valid_from: Union[date, datetime],
+    realtime_end: Optional[date] = None,
+    realtime_starts: Optional[pd.DataFrame] = None,
+) -> int:
+    """Append this write's new/revised points to the series' vintage log.
+
+    Points listed in realtime_starts (FRED per-observation realtime_start) are valid
+    from their own date; all others from valid_from.
+    """
+
+    path = revisions_path(settings.paths.data_dir, spec.id)
+    changes = store_result.changes
+    if not path.exists() and store_result.rows_before > 0:
+        # log switched on for a series with history: start from what is stored now
+        changes = load_series(store_result.path)
+    if changes is None:
+        return 0
+    if realtime_starts is not None and not changes.empty:
+        by_date = pd.Series(realtime_starts["realtime_start"].array, index=pd.DatetimeIndex(realtime_starts["date"]))
+        by_date = by_date[~by_date.index.duplicated(keep="last")]
+        changes = changes.assign(valid_from=by_date.reindex(pd.DatetimeIndex(changes["date"])).array)
+    return record_vintages(path, changes, valid_from=valid_from, realtime_end=realtime_end)
+
+
+def open_response_cache(settings: Settings) -> Optional[ResponseCache]:
+    """The provider response cache configured in settings.http_cache (None when off)."""
+
+    cfg = settings.http_cache
+    if not cfg.enabled or cfg.max_bytes <= 0:
+        return None
+    return ResponseCache(settings.paths.http_cache_dir, max_bytes=cfg.max_bytes)
+
+
 def run_series(
     *,
     settings: Settings,
     spec: SeriesSpec,
     lookback_days: int = 3650,
+    observation_start: Optional[date] = None,
+    session: Optional[requests.Session] = None,
+    prefetched: Optional[Union[FredFetchResult, YahooFetchResult]] = None,
+    prefetch_s: float = 0.0,
+    cache: Optional[ResponseCache] = None,
+    limiter: Optional[TokenBucket] = None,
 ) -> SeriesRunResult:
     """Fetch + normalize + store one series.
 
-    Storage layout (PoC):
-      data/series/{id}.parquet
+    Storage layout (settings.storage.layout, see storage.parquet_store.series_path):
+      data/series/{id}.parquet or data/series/{id}/year=YYYY.parquet
 
     lookback_days is a pragmatic default to avoid full-history fetch for some providers.
+    observation_start overrides the lookback window (incremental runs pass the start
+    resolved by pipeline.windows).
+    session is an optional shared HTTP session for the HTTP-based adapters (FRED).
+    prefetched skips the provider call and uses an already fetched result (e.g. one
+    slice of a batched yfinance download); prefetch_s is its share of the fetch time.
+    cache is an optional on-disk response cache for FRED (see open_response_cache);
+    the TTL comes from settings.http_cache for the provider / frequency_target.
+    limiter is the run's shared rate limiter for spec.provider (see
+    sources.rate_limit.build_rate_limiters).
+    FRED is paged (settings.fred.page_size) and each page is normalized as it
+    arrives, so only the normalized frame grows with history length.
+    For providers in settings.storage.revisions, new and revised points are also
+    appended to the vintage log (storage.revision_store), valid from the
+    observation's FRED realtime_start (else the response's, else the run time); a
+    failing log write turns the result into warn.
+
+    With settings.logging.stage_timings, result.timings holds the wall time of each
+    stage (fetch excluding retry sleeps and limiter waits, retry_sleep,
+    rate_limit_wait, normalize, read/merge/write from store_series, summary for
+    the report summary built from the written frame).
     """
 
-    observation_start = date.today() - timedelta(days=lookback_days)
+    timer = StageTimer(enabled=settings.logging.stage_timings)
+    result = _run_series(
+        settings=settings,
+        spec=spec,
+        lookback_days=lookback_days,
+        observation_start=observation_start,
+        session=session,
+        prefetched=prefetched,
+        prefetch_s=prefetch_s,
+        cache=cache,
+        limiter=limiter,
+        timer=timer,
+    )
+    if not timer.enabled:
+        return result
+    return replace(result, timings=timer.as_dict())
+
+
+def _run_series(
+    *,
+    settings: Settings,
+    spec: SeriesSpec,
+    lookback_days: int,
+    observation_start: Optional[date],
+    session: Optional[requests.Session],
+    prefetched: Optional[Union[FredFetchResult, YahooFetchResult]],
+    prefetch_s: float,
+    cache: Optional[ResponseCache],
+    limiter: Optional[TokenBucket],
+    timer: StageTimer,
+) -> SeriesRunResult:
+    if observation_start is None:
+        observation_start = date.today() - timedelta(days=lookback_days)
     run_ts = datetime.now(timezone.utc)
 
-    if spec.provider == "fred":
-        fetched = fetch_fred_series_observations(
-            series_id=spec.provider_symbol,
-            api_key=settings.fred_api_key,
+    fetch_start = time.perf_counter()
+    # FRED pages are normalized while the next page downloads
+    normalized: Optional[pd.DataFrame] = None
+    normalize_s = 0.0
+    if prefetched is not None:
+        fetched = prefetched
+    elif spec.provider == "fred":
+        fetched, normalize_s = _fetch_fred_normalized(
+            settings=settings,
+            spec=spec,
             observation_start=observation_start,
-            observation_end=None,
+            session=session,
+            cache=cache,
+            limiter=limiter,
         )
+        normalized = fetched.data
     elif spec.provider == "yfinance":
         fetched = fetch_yahoo_history(
             symbol=spec.provider_symbol,
             start=observation_start,
             end=None,
-            interval="1d",
+            limiter=limiter,
         )
     else:
         return SeriesRunResult(
@@ -89,6 +303,11 @@ def run_series(
             run_at=run_ts,
         )
 
+    fetch_s = prefetch_s if prefetched is not None else time.perf_counter() - fetch_start - normalize_s
+    timer.add("fetch", max(0.0, fetch_s - fetched.retry_sleep_s - fetched.rate_limit_wait_s))
+    timer.add("retry_sleep", fetched.retry_sleep_s)
+    timer.add("rate_limit_wait", fetched.rate_limit_wait_s)
+
     if fetched.data is None:
         return SeriesRunResult(
             series_id=spec.id,
@@ -102,7 +321,10 @@ def run_series(
         )
 
     try:
-        normalized = _normalize_timeseries(fetched.data)
+        with timer.stage("normalize"):
+            if normalized is None:
+                normalized = _normalize_timeseries(fetched.data)
+        timer.add("normalize", normalize_s)
     except Exception as exc:
         return SeriesRunResult(
             series_id=spec.id,
@@ -130,7 +352,7 @@ def run_series(
             run_at=run_ts,
         )
 
-    out_path = settings.paths.data_dir / "series" / f"{spec.id}.parquet"
+    out_path = series_path(settings.paths.data_dir, spec.id, settings.storage.layout)
 
     try:
         store_result: StoreResult = store_series(out_path, normalized)
@@ -146,18 +368,48 @@ def run_series(
             run_at=run_ts,
         )
 
-    final_series = load_series(out_path)
-    last_observation_date = (
-        final_series["date"].max().date() if final_series is not None and not final_series.empty else None
-    )
+    timer.add("read", store_result.read_s)
+    timer.add("merge", store_result.merge_s)
+    timer.add("write", store_result.write_s)
+
+    revision_error: Optional[str] = None
+    if spec.provider in settings.storage.revisions:
+        # FRED tells which vintage the values belong to; otherwise they are as of now
+        fred = fetched if isinstance(fetched, FredFetchResult) else None
+        try:
+            with timer.stage("write"):
+                _record_revisions(
+                    settings=settings,
+                    spec=spec,
+                    store_result=store_result,
+                    valid_from=(fred.realtime_start if fred else None) or run_ts,
+                    realtime_end=fred.realtime_end if fred else None,
+                    realtime_starts=fred.realtime_starts if fred else None,
+                )
+        except Exception as exc:
+            revision_error = f"code=revision_store_failed; detail={exc}"
+
+    # last date and summary come from the in-memory merge; no need to re-read the file
+    last_observation_date = store_result.last_date.date() if store_result.last_date is not None else None
+
+    try:
+        with timer.stage("summary"):
+            summary = summarize_store_result(
+                series_id=spec.id, result=store_result, windows=settings.report.delta_windows
+            )
+    except Exception:
+        # the summary is only a report shortcut; without it the report reads Parquet
+        summary = None
 
     return SeriesRunResult(
         series_id=spec.id,
         provider=spec.provider,
-        status=fetched.status,
-        message="ok",
+        status="warn" if revision_error else fetched.status,
+        message=revision_error or "ok",
         stored_path=store_result.path,
         new_points=store_result.new_points,
         last_observation_date=last_observation_date,
         run_at=run_ts,
+        revised_points=store_result.revised_points,
+        summary=summary,
     )
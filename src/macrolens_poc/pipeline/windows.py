@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Dict, Iterable, Optional
+
+from macrolens_poc.config import Settings
+from macrolens_poc.sources.matrix import SeriesSpec
+from macrolens_poc.storage.metadata_db import list_series_metadata
+from macrolens_poc.storage.parquet_store import series_exists, series_path, stored_last_date
+
+
+def resolve_observation_start(
+    *,
+    today: date,
+    lookback_days: int,
+    last_observation_date: Optional[date],
+    revision_overlap_days: int,
+    full_backfill: bool = False,
+) -> date:
+    """Pick the first date to request from a provider.
+
+    - full backfill or unknown history: today - lookback_days
+    - incremental: last_observation_date - revision_overlap_days, so recent
+      revisions are picked up again; never earlier than the lookback start
+    """
+
+    lookback_start = today - timedelta(days=lookback_days)
+    if full_backfill or last_observation_date is None:
+        return lookback_start
+
+    return max(last_observation_date - timedelta(days=max(0, revision_overlap_days)), lookback_start)
+
+
+def plan_observation_starts(
+    *,
+    settings: Settings,
+    specs: Iterable[SeriesSpec],
+    lookback_days: int,
+    full_backfill: bool = False,
+    today: Optional[date] = None,
+) -> Dict[str, date]:
+    """Resolve the fetch window start for every spec (keyed by series id).
+
+    last_observation_date comes from the metadata index (one query for the whole
+    run), but only while the series is still stored: a row whose Parquet data was
+    deleted or moved would otherwise fetch just the overlap tail and lose history.
+    Series without a usable metadata row fall back to the last stored date, read
+    from Parquet footer statistics / the partition manifest (see
+    parquet_store.stored_last_date), e.g. data written before the index existed;
+    nothing stored means a full lookback window.
+    """
+
+    day = today or date.today()
+    spec_list = list(specs)
+    known: Dict[str, Optional[date]] = {}
+
+    if not full_backfill:
+        db_path = settings.paths.metadata_db
+        if db_path.exists():
+            known = {r.series_id: r.last_observation_date for r in list_series_metadata(db_path)}
+
+        for spec in spec_list:
+            path = series_path(settings.paths.data_dir, spec.id, settings.storage.layout)
+            if known.get(spec.id) is None or not series_exists(path):
+                known[spec.id] = stored_last_date(path)
+
+    return {
+        spec.id: resolve_observation_start(
+            today=day,
+            lookback_days=lookback_days,
+            last_observation_date=known.get(spec.id),
+            revision_overlap_days=settings.ingest.revision_overlap_days,
+            full_backfill=full_backfill,
+        )
+        for spec in spec_list
+    }
@@ -1,20 +1,41 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Literal, Mapping, Optional, Tuple
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
 
 from macrolens_poc.logging_utils import RunContext
 from macrolens_poc.sources.matrix import SeriesSpec
-from macrolens_poc.storage.parquet_store import load_series
+from macrolens_poc.storage.metadata_db import SeriesSummaryRecord
+from macrolens_poc.storage.parquet_store import (
+    SeriesLocation,
+    StorageLayout,
+    load_series,
+    series_fingerprint,
+    series_path,
+)
+from macrolens_poc.storage.summary import anchor_indices, build_series_summary, summary_is_current
 
 DEFAULT_DELTA_WINDOWS: List[int] = [1, 5, 21]
 
+DeltaKind = Literal["abs", "pct", "log"]
+
+_DELTA_KIND_LABELS: Dict[str, str] = {
+    "abs": "absolute change",
+    "pct": "percent change",
+    "log": "log return",
+}
+_DELTA_HEADER_SUFFIX: Dict[str, str] = {"abs": "", "pct": " %", "log": " log"}
+
 
 @dataclass(frozen=True)
 class SeriesReport:
@@ -25,35 +46,97 @@ class SeriesReport:
     last_date: Optional[pd.Timestamp]
     last_value: Optional[float]
     deltas: Dict[int, Optional[float]]
-    path: Path
+    path: SeriesLocation
+    source: str = "parquet"  # parquet/summary
+    # summary computed from the loaded Parquet data (source=parquet), so callers can
+    # refresh a stale series_summary row
+    summary: Optional[SeriesSummaryRecord] = field(default=None, compare=False, repr=False)
 
 
-def compute_deltas(series: pd.DataFrame, *, windows: List[int]) -> Dict[int, Optional[float]]:
-    """Compute absolute deltas to past observations.
+def compute_deltas(
+    series: pd.DataFrame,
+    *,
+    windows: List[int],
+    kind: DeltaKind = "abs",
+    assume_sorted: bool = False,
+) -> Dict[int, Optional[float]]:
+    """Compute deltas to past observations for all windows in one pass.
 
     For each window (in calendar days), pick the most recent value *on or before*
     last_date - window_days. Returns None when no such value exists.
+
+    kind:
+    - abs: last - prev
+    - pct: percent change, 100 * (last / prev - 1)
+    - log: log return, ln(last / prev)
+    pct/log give NaN where the ratio is undefined (prev == 0, or non-positive values
+    for log).
+
+    All lookbacks come from a single searchsorted over the date array; the frame is
+    only sorted when it is not already (assume_sorted skips the check).
     """
 
     if series.empty:
         return {w: None for w in windows}
 
-    sorted_series = series.sort_values("date")
-    last_date = sorted_series["date"].iloc[-1]
-    last_value = sorted_series["value"].iloc[-1]
+    dates, values = _sorted_arrays(series, assume_sorted=assume_sorted)
+    return _deltas_from_arrays(dates, values, windows=windows, kind=kind)
+
 
-    deltas: Dict[int, Optional[float]] = {}
-    for w in windows:
-        cutoff = last_date - pd.Timedelta(days=w)
-        historical = sorted_series[sorted_series["date"] <= cutoff]
-        if historical.empty:
-            deltas[w] = None
-            continue
+def _sorted_arrays(series: pd.DataFrame, *, assume_sorted: bool) -> Tuple[np.ndarray, np.ndarray]:
+    date_col = series["date"]
+    if isinstance(date_col.dtype, pd.DatetimeTZDtype):
+        date_col = date_col.dt.tz_convert(None)
+    else:
+        date_col = pd.to_datetime(date_col, utc=True).dt.tz_convert(None)
+
+    dates = date_col.to_numpy(dtype="datetime64[ns]").view(np.int64)
+    values = series["value"].to_numpy(dtype="float64")
+
+    if not assume_sorted and len(dates) > 1 and (np.diff(dates) < 0).any():
+        order = np.argsort(dates, kind="stable")
+        dates = dates[order]
+        values = values[order]
+    return dates, values
+
+
+def _deltas_from_arrays(
+    dates: np.ndarray,
+    values: np.ndarray,
+    *,
+    windows: List[int],
+    kind: DeltaKind,
+) -> Dict[int, Optional[float]]:
+    idx = anchor_indices(dates, windows)
+    prev = values[np.clip(idx, 0, None)]
+    out = _apply_kind(values[-1], prev, kind)
+    return {w: (float(out[i]) if idx[i] >= 0 else None) for i, w in enumerate(windows)}
 
-        prev_value = historical["value"].iloc[-1]
-        deltas[w] = float(last_value) - float(prev_value)
 
-    return deltas
+def _deltas_from_summary(
+    summary: SeriesSummaryRecord,
+    *,
+    windows: List[int],
+    kind: DeltaKind,
+) -> Dict[int, Optional[float]]:
+    anchors = [summary.anchors[w] for w in windows]
+    prev = np.asarray([np.nan if a is None else a for a in anchors], dtype="float64")
+    out = _apply_kind(summary.last_value, prev, kind)
+    return {w: (float(out[i]) if anchors[i] is not None else None) for i, w in enumerate(windows)}
+
+
+def _apply_kind(last_value: float, prev: np.ndarray, kind: DeltaKind) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if kind == "abs":
+            out = last_value - prev
+        elif kind == "pct":
+            out = np.where(prev != 0, (last_value / prev - 1.0) * 100.0, np.nan)
+        elif kind == "log":
+            valid = (prev > 0) & (last_value > 0)
+            out = np.where(valid, np.log(np.where(valid, last_value / prev, 1.0)), np.nan)
+        else:
+            raise ValueError(f"unknown delta kind: {kind}")
+    return out
 
 
 def generate_series_report(
@@ -61,10 +144,32 @@ def generate_series_report(
     spec: SeriesSpec,
     data_dir: Path,
     windows: List[int] = DEFAULT_DELTA_WINDOWS,
+    layout: StorageLayout = "file",
+    kind: DeltaKind = "abs",
+    summary: Optional[SeriesSummaryRecord] = None,
 ) -> SeriesReport:
-    """Build a per-series report from stored Parquet data."""
+    """Build a per-series report from stored Parquet data.
+
+    If summary (the series_summary row written at ingest) still matches the stored
+    state and covers all windows, the report is answered from it without reading
+    Parquet.
+    """
 
-    path = data_dir / "series" / f"{spec.id}.parquet"
+    path = series_path(data_dir, spec.id, layout)
+
+    if summary is not None and summary_is_current(summary, path=path, windows=windows):
+        deltas = _deltas_from_summary(summary, windows=windows, kind=kind)
+        return _report_with_deltas(
+            spec=spec,
+            path=path,
+            deltas=deltas,
+            last_date=pd.Timestamp(summary.last_date).tz_convert("UTC"),
+            last_value=summary.last_value,
+            source="summary",
+        )
+
+    # taken before reading: a write in between makes the refreshed summary stale, not wrong
+    fingerprint = series_fingerprint(path)
     df = load_series(path)
 
     if df is None:
@@ -91,9 +196,41 @@ def generate_series_report(
             path=path,
         )
 
-    last_row = df.sort_values("date").iloc[-1]
-    deltas = compute_deltas(df, windows=windows)
+    # one sort check for both the last row and the deltas
+    dates, values = _sorted_arrays(df, assume_sorted=False)
+    deltas = _deltas_from_arrays(dates, values, windows=windows, kind=kind)
+    refreshed = None
+    if fingerprint is not None:
+        refreshed = build_series_summary(
+            series_id=spec.id,
+            path=path,
+            fingerprint=fingerprint,
+            dates_ns=dates,
+            values=values,
+            windows=windows,
+        )
+
+    return _report_with_deltas(
+        spec=spec,
+        path=path,
+        deltas=deltas,
+        last_date=pd.Timestamp(dates[-1], unit="ns", tz="UTC"),
+        last_value=float(values[-1]),
+        source="parquet",
+        summary=refreshed,
+    )
+
 
+def _report_with_deltas(
+    *,
+    spec: SeriesSpec,
+    path: SeriesLocation,
+    deltas: Dict[int, Optional[float]],
+    last_date: pd.Timestamp,
+    last_value: float,
+    source: str,
+    summary: Optional[SeriesSummaryRecord] = None,
+) -> SeriesReport:
     status = "ok" if all(v is not None for v in deltas.values()) else "warn"
     message = "ok" if status == "ok" else "insufficient history for some deltas"
 
@@ -102,10 +239,62 @@ def generate_series_report(
         provider=spec.provider,
         status=status,
         message=message,
-        last_date=last_row["date"],
-        last_value=float(last_row["value"]),
+        last_date=last_date,
+        last_value=last_value,
         deltas=deltas,
         path=path,
+        source=source,
+        summary=summary,
+    )
+
+
+def iter_series_reports(
+    *,
+    specs: Iterable[SeriesSpec],
+    data_dir: Path,
+    windows: List[int] = DEFAULT_DELTA_WINDOWS,
+    layout: StorageLayout = "file",
+    kind: DeltaKind = "abs",
+    jobs: int = 1,
+    summaries: Optional[Mapping[str, SeriesSummaryRecord]] = None,
+) -> Iterator[SeriesReport]:
+    """Yield one SeriesReport per spec, in spec order.
+
+    summaries (series_id -> series_summary row) lets unchanged series skip Parquet.
+
+    jobs > 1 builds the reports in a process pool (loading and delta computation are
+    CPU-bound pandas work). Results are still yielded in spec order, so artifacts stay
+    deterministic. Worker processes use their own series cache.
+    """
+
+    spec_list = list(specs)
+    spec_summaries = [(summaries or {}).get(spec.id) for spec in spec_list]
+    build = partial(_build_report, data_dir=data_dir, windows=windows, layout=layout, kind=kind)
+
+    if jobs <= 1 or len(spec_list) <= 1:
+        for spec, summary in zip(spec_list, spec_summaries):
+            yield build(spec, summary)
+        return
+
+    workers = min(jobs, len(spec_list))
+    # a few chunks per worker: amortizes IPC without starving the pool at the tail
+    chunksize = max(1, len(spec_list) // (workers * 4))
+    # spawn: forking a parent that already runs Arrow/BLAS threads is not safe
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        yield from pool.map(build, spec_list, spec_summaries, chunksize=chunksize)
+
+
+def _build_report(
+    spec: SeriesSpec,
+    summary: Optional[SeriesSummaryRecord],
+    *,
+    data_dir: Path,
+    windows: List[int],
+    layout: StorageLayout,
+    kind: DeltaKind,
+) -> SeriesReport:
+    return generate_series_report(
+        spec=spec, data_dir=data_dir, windows=windows, layout=layout, kind=kind, summary=summary
     )
 
 
@@ -128,6 +317,7 @@ def write_report_artifacts(
     report_tz: str,
     run_ctx: RunContext,
     windows: List[int] = DEFAULT_DELTA_WINDOWS,
+    kind: DeltaKind = "abs",
 ) -> Dict[str, Path]:
     tz = ZoneInfo(report_tz)
     ts_tag = run_ctx.started_at_utc.strftime("%Y%m%d")
@@ -137,10 +327,14 @@ def write_report_artifacts(
 
     reports_dir.mkdir(parents=True, exist_ok=True)
 
-    md = _render_markdown(reports=reports, tz=tz, windows=windows, generated_at=run_ctx.started_at_utc)
+    md = _render_markdown(
+        reports=reports, tz=tz, windows=windows, kind=kind, generated_at=run_ctx.started_at_utc
+    )
     md_path.write_text(md, encoding="utf-8")
 
-    payload = _render_json_payload(reports=reports, tz=tz, windows=windows, generated_at=run_ctx.started_at_utc)
+    payload = _render_json_payload(
+        reports=reports, tz=tz, windows=windows, kind=kind, generated_at=run_ctx.started_at_utc
+    )
     json_path.write_text(payload, encoding="utf-8")
 
     return {"markdown": md_path, "json": json_path}
@@ -151,15 +345,24 @@ def _render_markdown(
     reports: List[SeriesReport],
     tz: ZoneInfo,
     windows: List[int],
+    kind: DeltaKind,
     generated_at: datetime,
 ) -> str:
     lines: List[str] = []
     lines.append("# MacroLens Daily Report")
     lines.append("")
     lines.append(f"Generated at {generated_at.astimezone(tz).isoformat()}")
+    if kind != "abs":
+        lines.append("")
+        lines.append(f"Deltas: {_DELTA_KIND_LABELS[kind]}")
     lines.append("")
 
-    headers = ["ID", "Provider", "Last Date", "Last Value"] + [f"Δ{w}d" for w in windows] + ["Status", "Note"]
+    suffix = _DELTA_HEADER_SUFFIX[kind]
+    headers = (
+        ["ID", "Provider", "Last Date", "Last Value"]
+        + [f"Δ{w}d{suffix}" for w in windows]
+        + ["Status", "Note"]
+    )
     lines.append(" | ".join(headers))
     lines.append(" | ".join(["---"] * len(headers)))
 
@@ -185,11 +388,13 @@ def _render_json_payload(
     reports: List[SeriesReport],
     tz: ZoneInfo,
     windows: List[int],
+    kind: DeltaKind,
     generated_at: datetime,
 ) -> str:
     serializable: Dict[str, object] = {
         "generated_at": generated_at.astimezone(tz).isoformat(),
         "windows_days": windows,
+        "delta_kind": kind,
         "series": [],
     }
 
@@ -1,21 +1,62 @@
-"""Provider adapters and source-matrix handling."""
-
-from macrolens_poc.sources.fred import FetchResult as FredFetchResult
-from macrolens_poc.sources.fred import fetch_fred_series_observations
-from macrolens_poc.sources.matrix import (
-    MatrixLoadResult,
-    SeriesSpec,
-    SourcesMatrix,
-    load_sources_matrix,
-)
-from macrolens_poc.sources.yahoo import FetchResult as YahooFetchResult
-from macrolens_poc.sources.yahoo import fetch_yahoo_history
+"""Provider adapters and source-matrix handling.
+
+Exports resolve on first access (PEP 562) so that importing a light submodule
+such as sources.matrix does not load the provider adapters (requests, yfinance).
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+if TYPE_CHECKING:
+    from macrolens_poc.sources.fred import FetchResult as FredFetchResult
+    from macrolens_poc.sources.fred import fetch_fred_series_observations, iter_fred_series_observations
+    from macrolens_poc.sources.matrix import (
+        MatrixLoadResult,
+        SeriesSpec,
+        SourcesMatrix,
+        load_sources_matrix,
+    )
+    from macrolens_poc.sources.yahoo import FetchResult as YahooFetchResult
+    from macrolens_poc.sources.yahoo import fetch_yahoo_history, fetch_yahoo_history_batch
+
+# export name -> (module, attribute)
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "FredFetchResult": ("macrolens_poc.sources.fred", "FetchResult"),
+    "YahooFetchResult": ("macrolens_poc.sources.yahoo", "FetchResult"),
+    "fetch_fred_series_observations": ("macrolens_poc.sources.fred", "fetch_fred_series_observations"),
+    "iter_fred_series_observations": ("macrolens_poc.sources.fred", "iter_fred_series_observations"),
+    "fetch_yahoo_history": ("macrolens_poc.sources.yahoo", "fetch_yahoo_history"),
+    "fetch_yahoo_history_batch": ("macrolens_poc.sources.yahoo", "fetch_yahoo_history_batch"),
+    "MatrixLoadResult": ("macrolens_poc.sources.matrix", "MatrixLoadResult"),
+    "SeriesSpec": ("macrolens_poc.sources.matrix", "SeriesSpec"),
+    "SourcesMatrix": ("macrolens_poc.sources.matrix", "SourcesMatrix"),
+    "load_sources_matrix": ("macrolens_poc.sources.matrix", "load_sources_matrix"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     "FredFetchResult",
     "YahooFetchResult",
     "fetch_fred_series_observations",
+    "iter_fred_series_observations",
     "fetch_yahoo_history",
+    "fetch_yahoo_history_batch",
     "MatrixLoadResult",
     "SeriesSpec",
     "SourcesMatrix",
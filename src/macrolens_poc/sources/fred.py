@@ -1,19 +1,42 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import date
+import json
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import requests
 
+try:  # optional extra "fast"
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+from macrolens_poc.sources.http_cache import ResponseCache
+from macrolens_poc.sources.rate_limit import TokenBucket, parse_retry_after
+
+FRED_BASE_URL = "https://api.stlouisfed.org/fred"
+FRED_DATE_FORMAT = "%Y-%m-%d"
+FRED_MAX_LIMIT = 100_000  # most observations per response (also FRED's default limit)
+
 
 @dataclass(frozen=True)
 class FetchResult:
     status: str  # ok/warn/error/missing
     message: str
     data: Optional[pd.DataFrame]
+    retry_sleep_s: float = 0.0  # time spent in retry backoff sleeps
+    rate_limit_wait_s: float = 0.0  # time spent waiting for the provider rate limiter
+    count: Optional[int] = None  # observations in the requested range (FRED "count"), across all pages
+    realtime_start: Optional[date] = None  # first day of the vintage the values belong to
+    realtime_end: Optional[date] = None  # last day of the real-time period (9999-12-31 = current)
+    # per-observation realtime_start (columns date, realtime_start as UTC timestamps) when
+    # observations carry one that differs from realtime_start; None otherwise
+    realtime_starts: Optional[pd.DataFrame] = None
 
 
 def fetch_fred_series_observations(
@@ -25,10 +48,18 @@ def fetch_fred_series_observations(
     timeout_s: float = 20.0,
     max_attempts: int = 3,
     backoff_factor: float = 1.5,
+    session: Optional[requests.Session] = None,
+    base_url: str = FRED_BASE_URL,
+    cache: Optional[ResponseCache] = None,
+    cache_ttl_s: float = 0.0,
+    limiter: Optional[TokenBucket] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
 ) -> FetchResult:
     """Fetch observations from FRED.
 
-    Endpoint: https://api.stlouisfed.org/fred/series/observations
+    Endpoint: {base_url}/series/observations (default https://api.stlouisfed.org/fred;
+    point base_url at a stand-in server for load tests)
 
     Returns a DataFrame with columns:
       - date (timezone-aware UTC Timestamp)
@@ -38,12 +69,26 @@ def fetch_fred_series_observations(
     - FRED may return "." for missing values.
     - We use file_type=json.
     - Retry/backoff (max_attempts, backoff_factor) is applied to network errors/timeouts.
+    - Pass a shared session (see sources.http.build_http_session) to reuse pooled
+      keep-alive connections across series; without one, each call connects anew.
+    - retry_sleep_s on the result is the total backoff sleep.
+    - With a response cache, entries younger than cache_ttl_s are answered from disk
+      without a request; older ones are revalidated with If-None-Match /
+      If-Modified-Since when FRED sent validators (304 refreshes the entry), else
+      refetched. Only parseable responses are stored.
+    - A shared limiter (sources.rate_limit.TokenBucket) paces every request attempt;
+      rate_limit_wait_s on the result is the time spent waiting for it. HTTP 429 is
+      retried after Retry-After (or the backoff): with a limiter the pause is applied
+      to the limiter, so all workers hitting FRED hold off, and counts as limiter wait.
+    - limit/offset request one page of the range (FRED returns at most FRED_MAX_LIMIT
+      observations per response); result.count is the size of the whole range. See
+      iter_fred_series_observations for paging through it.
     """
 
     if api_key is None:
         return FetchResult(status="missing", message="FRED_API_KEY missing", data=None)
 
-    url = "https://api.stlouisfed.org/fred/series/observations"
+    url = f"{base_url.rstrip('/')}/series/observations"
     params: Dict[str, Any] = {
         "series_id": series_id,
         "api_key": api_key,
@@ -54,43 +99,160 @@ def fetch_fred_series_observations(
         params["observation_start"] = observation_start.isoformat()
     if observation_end is not None:
         params["observation_end"] = observation_end.isoformat()
+    if limit is not None:
+        params["limit"] = limit
+        params["offset"] = offset
 
     resp: Optional[requests.Response] = None
     last_error: Optional[str] = None
     attempts = max(1, max_attempts)
+    http_get = session.get if session is not None else requests.get
+    slept = 0.0
+    waited = 0.0
+
+    def _done(result: FetchResult) -> FetchResult:
+        return replace(result, retry_sleep_s=slept, rate_limit_wait_s=waited)
+
+    cache_key: Optional[str] = None
+    cached = None
+    conditional: Dict[str, str] = {}
+    if cache is not None:
+        cache_key = cache.key("fred", url, params)
+        cached = cache.get(cache_key)
+        if cached is not None and cached.age_s() < cache_ttl_s:
+            cache.record("hit")
+            return _parse_observations(cached.to_response())
+        if cached is not None:
+            conditional = cached.validators()
+    request_kwargs: Dict[str, Any] = {"headers": conditional} if conditional else {}
+    revalidated = False
 
     for attempt in range(1, attempts + 1):
+        retry_after: Optional[float] = None
+        throttled = False
+        if limiter is not None:
+            waited += limiter.acquire()
         try:
-            resp = requests.get(url, params=params, timeout=timeout_s)
+            resp = http_get(url, params=params, timeout=timeout_s, **request_kwargs)
         except requests.Timeout as exc:
             last_error = f"code=timeout; detail={exc}"
         except requests.RequestException as exc:
             last_error = f"code=request_exception; detail={exc}"
         else:
-            if resp.status_code == 404:
-                return FetchResult(status="missing", message=f"FRED series not found: {series_id}", data=None)
-            if 400 <= resp.status_code < 500:
-                return FetchResult(
-                    status="error",
-                    message=f"code=http_error; status={resp.status_code}; detail={resp.text}",
-                    data=None,
+            if resp.status_code == 304 and cached is not None and cache is not None and cache_key is not None:
+                resp = cache.refresh(cached, cache_key).to_response()
+                revalidated = True
+                break
+            if resp.status_code == 429:
+                last_error = "code=rate_limited; status=429"
+                retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                throttled = True
+            elif resp.status_code == 404:
+                return _done(FetchResult(status="missing", message=f"FRED series not found: {series_id}", data=None))
+            elif 400 <= resp.status_code < 500:
+                return _done(
+                    FetchResult(
+                        status="error",
+                        message=f"code=http_error; status={resp.status_code}; detail={resp.text}",
+                        data=None,
+                    )
                 )
-            if resp.status_code >= 500:
+            elif resp.status_code >= 500:
                 last_error = f"code=server_error; status={resp.status_code}"
             else:
                 break
 
         if attempt < attempts:
-            sleep_s = backoff_factor ** (attempt - 1)
-            time.sleep(sleep_s)
+            sleep_s = retry_after if retry_after is not None else backoff_factor ** (attempt - 1)
+            if throttled and limiter is not None:
+                # the next acquire (here and in every other worker) waits it out
+                limiter.block_for(sleep_s)
+            else:
+                time.sleep(sleep_s)
+                slept += sleep_s
         else:
-            return FetchResult(status="error", message=last_error or "code=unknown_error", data=None)
+            return _done(FetchResult(status="error", message=last_error or "code=unknown_error", data=None))
 
     if resp is None:
-        return FetchResult(status="error", message=last_error or "code=no_response", data=None)
+        return _done(FetchResult(status="error", message=last_error or "code=no_response", data=None))
+
+    result = _parse_observations(resp)
+    if cache is not None and cache_key is not None:
+        cache.record("revalidated" if revalidated else "miss")
+        if not revalidated and result.status in ("ok", "warn"):
+            cache.put(cache_key, resp)
+    return _done(result)
+
+
+def iter_fred_series_observations(
+    *, page_size: int = FRED_MAX_LIMIT, prefetch: bool = True, **fetch_kwargs: Any
+) -> Iterator[FetchResult]:
+    """Page through a FRED series with limit/offset, one FetchResult per page.
+
+    fetch_kwargs go to fetch_fred_series_observations (series_id, api_key, window,
+    session, cache, limiter, ...). Paging stops after the page that reaches the
+    range's count (or, without a count, after a short page) and after any page
+    without data (error/missing), which is yielded as the last result.
+
+    With prefetch, the next page is requested on a background thread while the
+    caller processes the current one, so at most two pages are held at a time.
+    """
+
+    page_size = max(1, min(page_size, FRED_MAX_LIMIT))
+
+    def fetch(offset: int) -> FetchResult:
+        return fetch_fred_series_observations(limit=page_size, offset=offset, **fetch_kwargs)
+
+    if not prefetch:
+        offset = 0
+        while True:
+            page = fetch(offset)
+            yield page
+            offset += page_size
+            if not _has_more(page, offset, page_size):
+                return
+
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fred-prefetch")
+    try:
+        pending: Future[FetchResult] = pool.submit(fetch, 0)
+        offset = 0
+        while True:
+            page = pending.result()
+            offset += page_size
+            more = _has_more(page, offset, page_size)
+            if more:
+                pending = pool.submit(fetch, offset)
+            yield page
+            if not more:
+                return
+    finally:
+        # consumer stopped early: return without joining the worker. A prefetch that
+        # has not started is cancelled; one already in flight cannot be interrupted,
+        # it finishes on the worker thread and its page is dropped.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _has_more(page: FetchResult, next_offset: int, page_size: int) -> bool:
+    if page.data is None or page.data.empty:
+        return False
+    if page.count is not None:
+        return next_offset < page.count
+    return len(page.data) >= page_size
+
+
+def _parse_observations(resp: requests.Response) -> FetchResult:
+    """Columnar parse of a FRED observations payload.
+
+    Decodes with orjson when installed, pulls date/value into arrays, maps "." to
+    NaN with one cast of the value column and parses dates with the fixed FRED
+    format. The frame is identical to a per-row parse (values via float()); rows
+    without a date or non-object entries are dropped, unparseable values are NaN.
+    Observation realtime_start values are only parsed when they differ from the
+    response-level one (FetchResult.realtime_starts).
+    """
 
     try:
-        payload = resp.json()
+        payload = _loads(resp.content)
     except ValueError as exc:
         return FetchResult(status="error", message=f"FRED invalid JSON: {exc}", data=None)
 
@@ -101,30 +263,96 @@ def fetch_fred_series_observations(
     if not observations:
         return FetchResult(status="warn", message="FRED returned 0 observations", data=pd.DataFrame(columns=["date", "value"]))
 
-    rows = []
-    for o in observations:
-        if not isinstance(o, dict):
-            continue
-        d = o.get("date")
-        v = o.get("value")
-        if not d:
-            continue
-        # value can be '.' meaning missing
-        if v is None or v == ".":
-            val = float("nan")
-        else:
-            try:
-                val = float(v)
-            except (TypeError, ValueError):
-                val = float("nan")
-
-        rows.append({"date": d, "value": val})
+    count = payload.get("count")
+    count = count if isinstance(count, int) else None
+    realtime_start = _parse_day(payload.get("realtime_start"))
+    realtime_end = _parse_day(payload.get("realtime_end"))
 
-    df = pd.DataFrame(rows)
-    if df.empty:
-        return FetchResult(status="warn", message="FRED observations parsed empty", data=df)
+    dates, values, starts = _observation_columns(observations)
+    if not dates:
+        return FetchResult(
+            status="warn",
+            message="FRED observations parsed empty",
+            data=pd.DataFrame(),
+            count=count,
+            realtime_start=realtime_start,
+            realtime_end=realtime_end,
+        )
 
-    df["date"] = pd.to_datetime(df["date"], utc=True)
+    parsed_dates = _parse_dates(dates)
+    df = pd.DataFrame({"date": parsed_dates, "value": _parse_values(values)})
     df = df.sort_values("date")
 
-    return FetchResult(status="ok", message="ok", data=df)
+    return FetchResult(
+        status="ok",
+        message="ok",
+        data=df,
+        count=count,
+        realtime_start=realtime_start,
+        realtime_end=realtime_end,
+        realtime_starts=_realtime_starts(parsed_dates, starts, payload.get("realtime_start")),
+    )
+
+
+def _realtime_starts(dates: pd.DatetimeIndex, starts: List[Any], default: Any) -> Optional[pd.DataFrame]:
+    # the usual response stamps every observation with the request's realtime_start
+    if starts.count(default) == len(starts):
+        return None
+    parsed = pd.to_datetime(pd.Index(starts, dtype=object), format=FRED_DATE_FORMAT, utc=True, errors="coerce")
+    return pd.DataFrame({"date": dates, "realtime_start": parsed})
+
+
+def _parse_day(value: Any) -> Optional[date]:
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _loads(body: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _observation_columns(observations: List[Any]) -> Tuple[List[Any], List[Any], List[Any]]:
+    """dates, values and realtime_start of the observations, one list each."""
+
+    try:
+        dates = [o["date"] for o in observations]
+    except (KeyError, TypeError):
+        dates = None
+    if dates is not None and all(dates):
+        return dates, [o.get("value") for o in observations], [o.get("realtime_start") for o in observations]
+
+    # malformed rows: keep objects with a date only
+    kept = [o for o in observations if isinstance(o, dict) and o.get("date")]
+    return [o["date"] for o in kept], [o.get("value") for o in kept], [o.get("realtime_start") for o in kept]
+
+
+def _parse_dates(dates: List[Any]) -> pd.DatetimeIndex:
+    # a plain list skips the string-dtype Series conversion; other shapes fall back to inference
+    try:
+        return pd.to_datetime(dates, format=FRED_DATE_FORMAT, utc=True)
+    except (TypeError, ValueError):
+        return pd.to_datetime(dates, utc=True)
+
+
+def _parse_values(values: List[Any]) -> np.ndarray:
+    arr = np.fromiter(values, dtype=object, count=len(values))
+    # value "." means missing
+    arr[arr == "."] = np.nan
+    try:
+        # object -> float64 calls float() per element, so results match a per-row parse
+        return arr.astype(np.float64)
+    except (TypeError, ValueError):
+        return np.array([_to_float(v) for v in values], dtype=np.float64)
+
+
+def _to_float(value: Any) -> float:
+    if value is None or value == ".":
+        return float("nan")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
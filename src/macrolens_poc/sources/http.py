@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_USER_AGENT = "macrolens-poc/0.0.0"
+
+
+def build_http_session(
+    *,
+    pool_size: int = 10,
+    pool_block: bool = True,
+    user_agent: str = DEFAULT_USER_AGENT,
+) -> requests.Session:
+    """Create a keep-alive HTTP session with a bounded connection pool.
+
+    One session is meant to be created per run and shared by all adapter calls (and
+    worker threads), so each provider host pays the TCP/TLS handshake only once per
+    pooled connection instead of once per request.
+
+    - pool_size: connections kept alive per host; size it to the number of concurrent
+      workers hitting the same provider
+    - pool_block: when all pooled connections are busy, wait for one instead of
+      opening a throwaway connection
+
+    Retries stay in the adapters (they own backoff + error reporting), so the
+    transport adapter is mounted with max_retries=0.
+    """
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=max(1, pool_size),
+        pool_maxsize=max(1, pool_size),
+        pool_block=pool_block,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+            "User-Agent": user_agent,
+        }
+    )
+    return session
+
+
+__all__ = ["DEFAULT_USER_AGENT", "build_http_session"]
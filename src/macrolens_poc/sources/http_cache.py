@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# request parameters that never go into cache keys or onto disk
+SECRET_PARAMS = frozenset({"api_key"})
+
+_VALIDATOR_HEADERS = ("ETag", "Last-Modified", "Content-Type")
+
+
+@dataclass(frozen=True)
+class HttpCacheStats:
+    hits: int
+    revalidated: int
+    misses: int
+    stores: int
+    evictions: int
+    entries: int
+    bytes: int
+    max_bytes: int
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    url: str
+    status_code: int
+    body: bytes
+    stored_at: float  # time.time() of the last store or successful revalidation
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    def age_s(self, now: Optional[float] = None) -> float:
+        return (time.time() if now is None else now) - self.stored_at
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidation (empty if the server sent none)."""
+
+        out: Dict[str, str] = {}
+        if "ETag" in self.headers:
+            out["If-None-Match"] = self.headers["ETag"]
+        if "Last-Modified" in self.headers:
+            out["If-Modified-Since"] = self.headers["Last-Modified"]
+        return out
+
+    def to_response(self) -> requests.Response:
+        resp = requests.Response()
+        resp.status_code = self.status_code
+        resp._content = self.body
+        resp.headers = CaseInsensitiveDict(self.headers)
+        resp.url = self.url
+        resp.encoding = "utf-8"
+        return resp
+
+
+class ResponseCache:
+    """On-disk cache of successful provider HTTP responses.
+
+    Entries live under root/{key[:2]}/{key}.json (url, status, validators, stored_at)
+    plus {key}.body (raw payload). Keys hash the provider, URL and the request
+    parameters without secrets (SECRET_PARAMS), so e.g. the FRED api_key is never
+    stored.
+
+    Freshness is decided by the caller (TTL per provider/frequency, see
+    HttpCacheConfig); stale entries with ETag/Last-Modified can be revalidated with a
+    conditional request and refreshed on 304 (see refresh).
+
+    The total body size is bounded by max_bytes; least recently used entries are
+    evicted first (access order is kept in memory and seeded from file mtimes, so it
+    survives restarts). Thread-safe within a process; files are written via rename so
+    concurrent readers never see partial entries.
+    """
+
+    def __init__(self, root: Path, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._index: "OrderedDict[str, int]" = OrderedDict()  # key -> body bytes, LRU first
+        self._bytes = 0
+        self._loaded = False
+
+    @staticmethod
+    def key(provider: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        normalized = {k: str(v) for k, v in sorted((params or {}).items()) if k not in SECRET_PARAMS}
+        raw = json.dumps({"provider": provider, "url": url, "params": normalized}, sort_keys=True)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        self._ensure_index()
+        meta_path, body_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            with self._lock:
+                self._forget(key)
+            return None
+
+        with self._lock:
+            if key in self._index:
+                self._index.move_to_end(key)
+        _touch(meta_path)
+        return CachedResponse(
+            url=meta["url"],
+            status_code=int(meta["status_code"]),
+            body=body,
+            stored_at=float(meta["stored_at"]),
+            headers=dict(meta.get("headers") or {}),
+        )
+
+    def put(self, key: str, resp: requests.Response) -> None:
+        """Store a response (body + validator headers); evicts LRU entries over budget."""
+
+        body = resp.content
+        if len(body) > self.max_bytes:
+            return
+        self._ensure_index()
+        headers = {h: resp.headers[h] for h in _VALIDATOR_HEADERS if h in resp.headers}
+        self._write(key, url=_strip_secrets(resp.url), status_code=resp.status_code, body=body, headers=headers)
+
+        with self._lock:
+            self._forget(key)
+            self._index[key] = len(body)
+            self._bytes += len(body)
+            self.stores += 1
+            while self._bytes > self.max_bytes and len(self._index) > 1:
+                oldest = next(iter(self._index))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def refresh(self, entry: CachedResponse, key: str) -> CachedResponse:
+        """Mark a revalidated (304) entry fresh again."""
+
+        refreshed = CachedResponse(
+            url=entry.url,
+            status_code=entry.status_code,
+            body=entry.body,
+            stored_at=time.time(),
+            headers=entry.headers,
+        )
+        meta_path, _ = self._paths(key)
+        _atomic_write(meta_path, _meta_bytes(refreshed))
+        return refreshed
+
+    def record(self, outcome: str) -> None:
+        """Count a lookup outcome: hit | revalidated | miss."""
+
+        with self._lock:
+            if outcome == "hit":
+                self.hits += 1
+            elif outcome == "revalidated":
+                self.revalidated += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> HttpCacheStats:
+        self._ensure_index()
+        with self._lock:
+            return HttpCacheStats(
+                hits=self.hits,
+                revalidated=self.revalidated,
+                misses=self.misses,
+                stores=self.stores,
+                evictions=self.evictions,
+                entries=len(self._index),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def clear(self) -> None:
+        self._ensure_index()
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+
+    def _ensure_index(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            found = []
+            if self.root.exists():
+                for meta_path in self.root.glob("*/*.json"):
+                    body_path = meta_path.with_suffix(".body")
+                    try:
+                        found.append((meta_path.stat().st_mtime, meta_path.stem, body_path.stat().st_size))
+                    except OSError:
+                        continue
+            for _, key, size in sorted(found):
+                self._index[key] = size
+                self._bytes += size
+            self._loaded = True
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        base = self.root / key[:2] / key
+        return base.with_suffix(".json"), base.with_suffix(".body")
+
+    def _write(self, key: str, *, url: str, status_code: int, body: bytes, headers: Dict[str, str]) -> None:
+        meta_path, body_path = self._paths(key)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        entry = CachedResponse(url=url, status_code=status_code, body=body, stored_at=time.time(), headers=headers)
+        # body first: a meta file always points at a complete body
+        _atomic_write(body_path, body)
+        _atomic_write(meta_path, _meta_bytes(entry))
+
+    def _forget(self, key: str) -> None:
+        size = self._index.pop(key, None)
+        if size is not None:
+            self._bytes -= size
+
+    def _remove(self, key: str) -> None:
+        self._forget(key)
+        for path in self._paths(key):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _meta_bytes(entry: CachedResponse) -> bytes:
+    meta = {
+        "url": entry.url,
+        "status_code": entry.status_code,
+        "stored_at": entry.stored_at,
+        "headers": entry.headers,
+    }
+    return json.dumps(meta, sort_keys=True).encode("utf-8")
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _touch(path: Path) -> None:
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _strip_secrets(url: Optional[str]) -> str:
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in SECRET_PARAMS]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+__all__ = ["CachedResponse", "HttpCacheStats", "ResponseCache", "SECRET_PARAMS"]
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
 
 import yaml
 from pydantic import BaseModel, Field, ValidationError
 
+# libyaml's loader is several times faster on large matrices; same result
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# bump when the cache file layout changes; model changes need no bump (see _read_cache)
+MATRIX_CACHE_FORMAT = 1
+
 
 Provider = Literal["fred", "yfinance"]
 
@@ -35,13 +45,41 @@ class SourcesMatrix(BaseModel):
     series: List[SeriesSpec]
 
 
+@dataclass(frozen=True)
+class MatrixIndex:
+    """Lookups over the matrix series, built once per load (matrix order kept)."""
+
+    by_id: Dict[str, SeriesSpec]
+    by_provider: Dict[str, Tuple[SeriesSpec, ...]]
+    by_category: Dict[str, Tuple[SeriesSpec, ...]]
+    enabled: Tuple[SeriesSpec, ...]
+    disabled: Tuple[SeriesSpec, ...]
+
+    @classmethod
+    def build(cls, series: Sequence[SeriesSpec]) -> "MatrixIndex":
+        by_provider: Dict[str, List[SeriesSpec]] = {}
+        by_category: Dict[str, List[SeriesSpec]] = {}
+        for spec in series:
+            by_provider.setdefault(spec.provider, []).append(spec)
+            by_category.setdefault(spec.category, []).append(spec)
+        return cls(
+            by_id={spec.id: spec for spec in series},
+            by_provider={k: tuple(v) for k, v in by_provider.items()},
+            by_category={k: tuple(v) for k, v in by_category.items()},
+            enabled=tuple(spec for spec in series if spec.enabled),
+            disabled=tuple(spec for spec in series if not spec.enabled),
+        )
+
+
 @dataclass(frozen=True)
 class MatrixLoadResult:
     matrix: SourcesMatrix
     path: Path
+    index: MatrixIndex
+    cache_hit: bool = False
 
 
-def load_sources_matrix(path: Path) -> MatrixLoadResult:
+def load_sources_matrix(path: Path, *, cache_dir: Optional[Path] = None) -> MatrixLoadResult:
     """Load and validate the data-source-matrix.
 
     The matrix is a YAML mapping with keys:
@@ -49,13 +87,42 @@ def load_sources_matrix(path: Path) -> MatrixLoadResult:
       - series: list[SeriesSpec]
 
     System-maintained fields (last_ok/status) are optional.
+
+    With cache_dir, the validated matrix is kept there as compact JSON keyed by the
+    file's mtime/size and sha256. A hit skips YAML parsing and the duplicate scan;
+    a touched but unchanged file is recognized by its hash. Cache files that cannot
+    be read or no longer validate are rebuilt from the YAML.
     """
 
     if not path.exists():
         raise FileNotFoundError(str(path))
 
-    raw = path.read_text(encoding="utf-8")
-    parsed = yaml.safe_load(raw) or {}
+    if cache_dir is None:
+        matrix = _parse_matrix(path.read_bytes())
+        return MatrixLoadResult(matrix=matrix, path=path, index=MatrixIndex.build(matrix.series))
+
+    stat = path.stat()
+    entry = _cache_entry_path(cache_dir, path)
+    header, matrix = _read_cache(entry)
+
+    raw: Optional[bytes] = None
+    if matrix is not None and header is not None:
+        if header.get("mtime_ns") == stat.st_mtime_ns and header.get("size") == stat.st_size:
+            return MatrixLoadResult(matrix=matrix, path=path, index=MatrixIndex.build(matrix.series), cache_hit=True)
+        raw = path.read_bytes()
+        if header.get("sha256") == hashlib.sha256(raw).hexdigest():
+            _write_cache(entry, path, stat, raw, matrix)  # refresh mtime/size
+            return MatrixLoadResult(matrix=matrix, path=path, index=MatrixIndex.build(matrix.series), cache_hit=True)
+
+    if raw is None:
+        raw = path.read_bytes()
+    matrix = _parse_matrix(raw)
+    _write_cache(entry, path, stat, raw, matrix)
+    return MatrixLoadResult(matrix=matrix, path=path, index=MatrixIndex.build(matrix.series))
+
+
+def _parse_matrix(raw: bytes) -> SourcesMatrix:
+    parsed = yaml.load(raw.decode("utf-8"), Loader=_YamlLoader) or {}
     if not isinstance(parsed, dict):
         raise ValueError("sources matrix must be a mapping/object at the top level")
 
@@ -65,8 +132,51 @@ def load_sources_matrix(path: Path) -> MatrixLoadResult:
         raise ValueError(f"Invalid sources matrix: {exc}") from exc
 
     _validate_uniqueness(matrix)
+    return matrix
+
+
+def _cache_entry_path(cache_dir: Path, path: Path) -> Path:
+    # one entry per matrix file, so several matrices can share a cache dir
+    key = hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"sources_matrix-{key}.json"
+
+
+def _read_cache(entry: Path) -> Tuple[Optional[Dict[str, Any]], Optional[SourcesMatrix]]:
+    """(header, matrix) of a cache file, or (None, None) if missing/unusable.
 
-    return MatrixLoadResult(matrix=matrix, path=path)
+    Layout: one JSON header line, then the matrix as model JSON. The matrix is
+    re-validated by pydantic's JSON parser (cheaper than YAML parsing), so a
+    cache written by an older SeriesSpec either still validates or is rebuilt.
+    """
+
+    try:
+        data = entry.read_bytes()
+        head, _, body = data.partition(b"\n")
+        header = json.loads(head)
+        if not isinstance(header, dict) or header.get("format") != MATRIX_CACHE_FORMAT:
+            return None, None
+        return header, SourcesMatrix.model_validate_json(body)
+    except (OSError, ValueError):  # ValidationError and JSONDecodeError are ValueErrors
+        return None, None
+
+
+def _write_cache(entry: Path, path: Path, stat: os.stat_result, raw: bytes, matrix: SourcesMatrix) -> None:
+    header = {
+        "format": MATRIX_CACHE_FORMAT,
+        "source": str(path),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": hashlib.sha256(raw).hexdigest(),
+    }
+    payload = json.dumps(header).encode("utf-8") + b"\n" + matrix.model_dump_json(exclude_defaults=True).encode("utf-8")
+    tmp = entry.with_name(f".{entry.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(payload)
+        os.replace(tmp, entry)
+    except OSError:
+        # the cache is an optimization; a read-only data dir must not break commands
+        tmp.unlink(missing_ok=True)
 
 
 def _validate_uniqueness(matrix: SourcesMatrix) -> None:
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Mapping, Optional, Protocol
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by all workers calling one provider.
+
+    Tokens refill at rate_per_s up to burst. acquire(n) takes n tokens and sleeps
+    until the bucket would have held them; the balance may go negative (debt), so a
+    batched call that needs more tokens than burst still works and simply delays
+    later callers. block_for(seconds) pauses every caller, e.g. for Retry-After.
+
+    Waiting happens outside the lock; acquire returns the seconds slept so callers
+    can report it (FetchResult.rate_limit_wait_s).
+    """
+
+    def __init__(
+        self,
+        rate_per_s: float,
+        burst: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate_per_s <= 0:
+            raise ValueError("rate_per_s must be > 0")
+        self.rate_per_s = rate_per_s
+        self.burst = max(1.0, float(burst))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        # refill time of _tokens; lies in the future while blocked (block_for)
+        self._updated = clock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= tokens
+            # the balance is back at zero `debt / rate` after the last refill point
+            wait = max(0.0, self._updated + max(0.0, -self._tokens) / self.rate_per_s - now)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def block_for(self, seconds: float) -> None:
+        """Make every acquire wait at least `seconds` from now (Retry-After)."""
+
+        if seconds <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            # the server said stop: resume from an empty bucket, not a burst
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + seconds)
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_s)
+            self._updated = now
+
+
+class _RateLimit(Protocol):
+    rate_per_s: float
+    burst: float
+
+
+def build_rate_limiters(limits: Mapping[str, _RateLimit]) -> Dict[str, TokenBucket]:
+    """One TokenBucket per configured provider (see IngestConfig.rate_limits)."""
+
+    return {provider: TokenBucket(limit.rate_per_s, limit.burst) for provider, limit in limits.items()}
+
+
+def parse_retry_after(value: Optional[str], *, now: Optional[datetime] = None) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+__all__ = ["TokenBucket", "build_rate_limiters", "parse_retry_after"]
@@ -1,20 +1,24 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import date
 import time
-from typing import Optional
+from typing import Dict, List, Optional, Sequence
 
 import pandas as pd
 import requests
 import yfinance as yf
+from yfinance.exceptions import YFRateLimitError
 
+from macrolens_poc.sources.rate_limit import TokenBucket
 
 @dataclass(frozen=True)
 class FetchResult:
     status: str  # ok/warn/error/missing
     message: str
     data: Optional[pd.DataFrame]
+    retry_sleep_s: float = 0.0  # time spent in retry backoff sleeps
+    rate_limit_wait_s: float = 0.0  # time spent waiting for the provider rate limiter
 
 
 def fetch_yahoo_history(
@@ -26,6 +30,7 @@ def fetch_yahoo_history(
     timeout_s: float = 10.0,
     max_attempts: int = 3,
     backoff_factor: float = 1.5,
+    limiter: Optional[TokenBucket] = None,
 ) -> FetchResult:
     """Fetch historical daily prices from Yahoo Finance via yfinance.
 
@@ -39,13 +44,20 @@ def fetch_yahoo_history(
     - yfinance returns index as DatetimeIndex.
     - We normalize to UTC and pick Close.
     - Retry/backoff (max_attempts, backoff_factor) is applied to network errors/timeouts.
+    - A shared limiter paces every attempt (one token); Yahoo throttling
+      (YFRateLimitError) blocks the limiter for the backoff so all workers hold off.
     """
 
     df = None
     last_error: Optional[str] = None
     attempts = max(1, max_attempts)
+    slept = 0.0
+    waited = 0.0
 
     for attempt in range(1, attempts + 1):
+        throttled = False
+        if limiter is not None:
+            waited += limiter.acquire()
         try:
             df = yf.download(
                 symbol,
@@ -57,17 +69,29 @@ def fetch_yahoo_history(
             )
         except requests.Timeout as exc:
             last_error = f"code=timeout; detail={exc}"
+        except YFRateLimitError as exc:
+            last_error = f"code=rate_limited; detail={exc}"
+            throttled = True
         except Exception as exc:  # yfinance can raise various runtime exceptions
             last_error = f"code=download_failed; detail={exc}"
         else:
             break
 
         if attempt < attempts:
-            sleep_s = backoff_factor ** (attempt - 1)
-            time.sleep(sleep_s)
+            slept += _backoff(backoff_factor ** (attempt - 1), limiter=limiter if throttled else None)
         else:
-            return FetchResult(status="error", message=last_error or "code=unknown_error", data=None)
+            return FetchResult(
+                status="error",
+                message=last_error or "code=unknown_error",
+                data=None,
+                retry_sleep_s=slept,
+                rate_limit_wait_s=waited,
+            )
+
+    return replace(_close_result(df), retry_sleep_s=slept, rate_limit_wait_s=waited)
+
 
+def _close_result(df: Optional[pd.DataFrame]) -> FetchResult:
     if df is None or df.empty:
         return FetchResult(status="warn", message="yfinance returned 0 rows", data=pd.DataFrame(columns=["date", "value"]))
 
@@ -86,3 +110,179 @@ def fetch_yahoo_history(
     out = out[["date", "value"]].sort_values("date")
 
     return FetchResult(status="ok", message="ok", data=out)
+
+
+def fetch_yahoo_history_batch(
+    *,
+    symbols: Sequence[str],
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    interval: str = "1d",
+    chunk_size: int = 50,
+    timeout_s: float = 10.0,
+    max_attempts: int = 3,
+    backoff_factor: float = 1.5,
+    limiter: Optional[TokenBucket] = None,
+) -> Dict[str, FetchResult]:
+    """Fetch many symbols with one threaded yfinance call per chunk.
+
+    All symbols share the same window (start/end/interval). Returns one FetchResult
+    per requested symbol, in the same canonical (date, value) shape as
+    fetch_yahoo_history.
+
+    Notes:
+    - Retry/backoff applies to a whole chunk; if a chunk is exhausted, every symbol in
+      it gets the error result.
+    - yfinance does not raise for single bad tickers inside a batch (it catches their
+      errors, including throttling, per ticker) and leaves their column empty or
+      missing. A missing column gets status "error" (code=symbol_failed); an all-NaN
+      column or an empty frame means no rows in the window ("warn", as in
+      fetch_yahoo_history).
+    - A shared limiter is charged one token per symbol before every chunk attempt;
+      like retry_sleep_s, rate_limit_wait_s on each result is the chunk's total.
+    """
+
+    unique: List[str] = list(dict.fromkeys(symbols))
+    size = max(1, chunk_size)
+    results: Dict[str, FetchResult] = {}
+
+    for i in range(0, len(unique), size):
+        chunk = unique[i : i + size]
+        results.update(
+            _fetch_yahoo_chunk(
+                chunk,
+                start=start,
+                end=end,
+                interval=interval,
+                timeout_s=timeout_s,
+                max_attempts=max_attempts,
+                backoff_factor=backoff_factor,
+                limiter=limiter,
+            )
+        )
+
+    return results
+
+
+def _fetch_yahoo_chunk(
+    symbols: List[str],
+    *,
+    start: Optional[date],
+    end: Optional[date],
+    interval: str,
+    timeout_s: float,
+    max_attempts: int,
+    backoff_factor: float,
+    limiter: Optional[TokenBucket],
+) -> Dict[str, FetchResult]:
+    df = None
+    last_error: Optional[str] = None
+    attempts = max(1, max_attempts)
+    slept = 0.0
+    waited = 0.0
+
+    for attempt in range(1, attempts + 1):
+        throttled = False
+        if limiter is not None:
+            waited += limiter.acquire(len(symbols))
+        try:
+            df = yf.download(
+                symbols,
+                start=start,
+                end=end,
+                interval=interval,
+                progress=False,
+                timeout=timeout_s,
+                group_by="column",
+                threads=True,
+                multi_level_index=True,
+            )
+        except requests.Timeout as exc:
+            last_error = f"code=timeout; detail={exc}"
+        except YFRateLimitError as exc:
+            last_error = f"code=rate_limited; detail={exc}"
+            throttled = True
+        except Exception as exc:  # yfinance can raise various runtime exceptions
+            last_error = f"code=download_failed; detail={exc}"
+        else:
+            break
+
+        if attempt < attempts:
+            slept += _backoff(backoff_factor ** (attempt - 1), limiter=limiter if throttled else None)
+        else:
+            failed = FetchResult(
+                status="error",
+                message=last_error or "code=unknown_error",
+                data=None,
+                retry_sleep_s=slept,
+                rate_limit_wait_s=waited,
+            )
+            return {symbol: failed for symbol in symbols}
+
+    results = _chunk_results(df, symbols)
+    return {
+        symbol: replace(result, retry_sleep_s=slept, rate_limit_wait_s=waited) for symbol, result in results.items()
+    }
+
+
+def _backoff(seconds: float, *, limiter: Optional[TokenBucket]) -> float:
+    """Back off before a retry; returns the seconds slept here.
+
+    Throttled calls with a limiter hand the pause to the limiter instead, so every
+    worker waits (the next acquire counts it as rate-limit wait).
+    """
+
+    if limiter is not None:
+        limiter.block_for(seconds)
+        return 0.0
+    time.sleep(seconds)
+    return seconds
+
+
+def _chunk_results(df: Optional[pd.DataFrame], symbols: List[str]) -> Dict[str, FetchResult]:
+    empty = FetchResult(
+        status="warn", message="yfinance returned 0 rows", data=pd.DataFrame(columns=["date", "value"])
+    )
+    if df is None or df.empty:
+        return {symbol: empty for symbol in symbols}
+
+    close = _close_columns(df, symbols)
+    if close is None:
+        missing = FetchResult(status="error", message="yfinance missing Close column", data=None)
+        return {symbol: missing for symbol in symbols}
+
+    out: Dict[str, FetchResult] = {}
+
+    for symbol in symbols:
+        # yfinance upper-cases tickers in the result columns
+        column = symbol if symbol in close.columns else symbol.upper()
+        if column not in close.columns:
+            out[symbol] = FetchResult(
+                status="error", message="code=symbol_failed; detail=no column in batch response", data=None
+            )
+            continue
+        values = close[column].dropna()
+        if values.empty:
+            out[symbol] = empty
+            continue
+
+        frame = pd.DataFrame({"date": pd.to_datetime(values.index, utc=True), "value": values.to_numpy()})
+        out[symbol] = FetchResult(status="ok", message="ok", data=frame.sort_values("date"))
+
+    return out
+
+
+def _close_columns(df: pd.DataFrame, symbols: List[str]) -> Optional[pd.DataFrame]:
+    """Return Close prices as one column per symbol, whatever the column layout."""
+
+    if isinstance(df.columns, pd.MultiIndex):
+        if "Close" in df.columns.get_level_values(0):
+            return df["Close"]
+        if "Close" in df.columns.get_level_values(-1):  # group_by="ticker" layout
+            return df.xs("Close", axis=1, level=-1)
+        return None
+
+    # flat columns: only possible for a single symbol
+    if "Close" not in df.columns or len(symbols) != 1:
+        return None
+    return df[["Close"]].rename(columns={"Close": symbols[0]})
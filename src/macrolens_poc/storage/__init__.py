@@ -1,22 +1,127 @@
-"""Storage backends (Parquet/CSV/SQLite)."""
+"""Storage backends (Parquet/CSV/SQLite).
+
+Exports resolve on first access (PEP 562) so that the SQLite metadata store can
+be used without loading pandas/pyarrow for the Parquet stores.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+if TYPE_CHECKING:
+    from macrolens_poc.storage.metadata_db import (
+        SeriesMetadataRecord,
+        SeriesSummaryRecord,
+        get_series_metadata,
+        init_db as init_metadata_db,
+        list_series_metadata,
+        list_series_summaries,
+        upsert_series_metadata,
+        upsert_series_summaries,
+    )
+    from macrolens_poc.storage.parquet_store import (
+        DatasetKey,
+        MergeResult,
+        StorageLayout,
+        StoreResult,
+        clear_series_cache,
+        configure_series_cache,
+        load_series,
+        merge_series,
+        merge_series_detailed,
+        migrate_series,
+        series_cache_stats,
+        series_exists,
+        series_fingerprint,
+        series_path,
+        store_series,
+        stored_last_date,
+    )
+    from macrolens_poc.storage.revision_store import (
+        compact_vintages,
+        load_series_as_of,
+        load_vintages,
+        record_vintages,
+        revisions_path,
+    )
+
+# export name -> (module, attribute)
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "SeriesMetadataRecord": ("macrolens_poc.storage.metadata_db", "SeriesMetadataRecord"),
+    "SeriesSummaryRecord": ("macrolens_poc.storage.metadata_db", "SeriesSummaryRecord"),
+    "get_series_metadata": ("macrolens_poc.storage.metadata_db", "get_series_metadata"),
+    "init_metadata_db": ("macrolens_poc.storage.metadata_db", "init_db"),
+    "list_series_metadata": ("macrolens_poc.storage.metadata_db", "list_series_metadata"),
+    "list_series_summaries": ("macrolens_poc.storage.metadata_db", "list_series_summaries"),
+    "upsert_series_metadata": ("macrolens_poc.storage.metadata_db", "upsert_series_metadata"),
+    "upsert_series_summaries": ("macrolens_poc.storage.metadata_db", "upsert_series_summaries"),
+    "DatasetKey": ("macrolens_poc.storage.parquet_store", "DatasetKey"),
+    "MergeResult": ("macrolens_poc.storage.parquet_store", "MergeResult"),
+    "StorageLayout": ("macrolens_poc.storage.parquet_store", "StorageLayout"),
+    "StoreResult": ("macrolens_poc.storage.parquet_store", "StoreResult"),
+    "clear_series_cache": ("macrolens_poc.storage.parquet_store", "clear_series_cache"),
+    "configure_series_cache": ("macrolens_poc.storage.parquet_store", "configure_series_cache"),
+    "load_series": ("macrolens_poc.storage.parquet_store", "load_series"),
+    "merge_series": ("macrolens_poc.storage.parquet_store", "merge_series"),
+    "merge_series_detailed": ("macrolens_poc.storage.parquet_store", "merge_series_detailed"),
+    "migrate_series": ("macrolens_poc.storage.parquet_store", "migrate_series"),
+    "series_cache_stats": ("macrolens_poc.storage.parquet_store", "series_cache_stats"),
+    "series_exists": ("macrolens_poc.storage.parquet_store", "series_exists"),
+    "series_fingerprint": ("macrolens_poc.storage.parquet_store", "series_fingerprint"),
+    "series_path": ("macrolens_poc.storage.parquet_store", "series_path"),
+    "store_series": ("macrolens_poc.storage.parquet_store", "store_series"),
+    "stored_last_date": ("macrolens_poc.storage.parquet_store", "stored_last_date"),
+    "compact_vintages": ("macrolens_poc.storage.revision_store", "compact_vintages"),
+    "load_series_as_of": ("macrolens_poc.storage.revision_store", "load_series_as_of"),
+    "load_vintages": ("macrolens_poc.storage.revision_store", "load_vintages"),
+    "record_vintages": ("macrolens_poc.storage.revision_store", "record_vintages"),
+    "revisions_path": ("macrolens_poc.storage.revision_store", "revisions_path"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_EXPORTS))
 
-from macrolens_poc.storage.metadata_db import (
-    SeriesMetadataRecord,
-    get_series_metadata,
-    init_db as init_metadata_db,
-    list_series_metadata,
-    upsert_series_metadata,
-)
-from macrolens_poc.storage.parquet_store import StoreResult, load_series, merge_series, store_series
 
 __all__ = [
+    "DatasetKey",
+    "MergeResult",
+    "StorageLayout",
     "StoreResult",
+    "clear_series_cache",
+    "configure_series_cache",
     "load_series",
     "merge_series",
+    "merge_series_detailed",
+    "migrate_series",
+    "series_cache_stats",
+    "series_exists",
+    "series_fingerprint",
+    "series_path",
     "store_series",
+    "stored_last_date",
     "SeriesMetadataRecord",
+    "SeriesSummaryRecord",
     "get_series_metadata",
     "init_metadata_db",
     "list_series_metadata",
+    "list_series_summaries",
     "upsert_series_metadata",
+    "upsert_series_summaries",
+    "compact_vintages",
+    "load_series_as_of",
+    "load_vintages",
+    "record_vintages",
+    "revisions_path",
 ]
@@ -0,0 +1,469 @@
+"""Consolidated long-format storage: all series in one Parquet dataset.
+
+Layout (storage.layout: dataset):
+
+    data/dataset/_dataset.json                 {"version": 1, "buckets": N}
+    data/dataset/bucket=NN.parquet             columns series_id, date, value
+    data/dataset/bucket=NN.deltas/{id}@{seq}@{token}.parquet
+                                               points written since the last compaction
+
+Every series id is hashed into one of N bucket files. Each bucket is sorted by
+(series_id, date) and written with moderate row groups, so reads filtered on
+series_id/date only decode the matching row groups (predicate pushdown on Parquet
+statistics). Compared to one file per series this keeps the number of files, footers
+and tiny row groups constant as the matrix grows.
+
+store_series does not rewrite the bucket: it appends the new and revised points of
+one series as a small delta file (nothing when the merge changed nothing). Readers
+fold the deltas over the bucket, later writes winning per (series_id, date).
+compact_dataset folds the deltas into the bucket files, so a run writes each
+touched bucket once at its end (run-all/run-one call it); a bucket is also compacted
+when it collects MAX_BUCKET_DELTAS deltas.
+
+A series' fingerprint is its content token (row count and CRC of its dates/values),
+kept in the delta file name and, for compacted data, in the bucket's footer
+metadata. Writing or compacting other series of the bucket therefore leaves the
+cache entries and report summaries of a series valid.
+
+A series is addressed by a parquet_store.DatasetKey (see series_path);
+load_series/store_series dispatch here for such keys.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import zlib
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from macrolens_poc.storage.parquet_store import (
+    DATASET_DIRNAME,
+    DatasetKey,
+    StoreResult,
+    merge_series_detailed,
+)
+from macrolens_poc.storage.series_cache import Fingerprint
+
+DATASET_META_NAME = "_dataset.json"
+DEFAULT_BUCKETS = 32
+ROW_GROUP_SIZE = 65_536
+# compact a bucket inline once this many deltas pile up (e.g. many run-one calls)
+MAX_BUCKET_DELTAS = 256
+
+# footer key of the bucket files: JSON {series_id: content token}
+_TOKENS_KEY = b"macrolens.series_tokens"
+
+_SCHEMA = pa.schema(
+    [
+        ("series_id", pa.string()),
+        ("date", pa.timestamp("ns", tz="UTC")),
+        ("value", pa.float64()),
+    ]
+)
+
+# writers and compaction replace/delete files of a bucket; serialize all access per
+# bucket so concurrent run-all workers neither drop rows nor read deleted deltas
+_BUCKET_LOCKS: Dict[Path, threading.Lock] = {}
+_BUCKET_LOCKS_GUARD = threading.Lock()
+
+# dataset root -> bucket count from its meta file (fixed once the file exists)
+_BUCKET_COUNTS: Dict[Path, int] = {}
+
+# bucket path -> ((mtime_ns, size), token map or None for buckets without one)
+_TOKEN_CACHE: Dict[Path, Tuple[Tuple[int, int], Optional[Dict[str, str]]]] = {}
+
+# last delta sequence number handed out in this process (see _next_seq)
+_SEQ_LOCK = threading.Lock()
+_LAST_SEQ = 0
+
+
+def bucket_path(root: Path, series_id: str) -> Path:
+    buckets = _bucket_count(root)
+    return root / f"bucket={zlib.crc32(series_id.encode('utf-8')) % buckets:02d}.parquet"
+
+
+def load_dataset_series(
+    key: DatasetKey,
+    *,
+    start: Optional[pd.Timestamp] = None,
+    end: Optional[pd.Timestamp] = None,
+) -> Optional[pd.DataFrame]:
+    """Load one series (date, value) from the dataset; None if it has no rows."""
+
+    path = bucket_path(key.root, key.series_id)
+    with _bucket_lock(path):
+        table = _read_bucket(path, series_ids=[key.series_id], start=start, end=end)
+    if table.num_rows == 0:
+        # distinguish "no rows in range" from "series not stored"
+        if (start is not None or end is not None) and dataset_series_exists(key):
+            return _empty_frame()
+        return None
+
+    df = table.select(["date", "value"]).to_pandas()
+    df["date"] = df["date"].dt.tz_convert("UTC")
+    return df
+
+
+def scan_dataset(
+    root: Path,
+    *,
+    series_ids: Optional[Iterable[str]] = None,
+    start: Optional[pd.Timestamp] = None,
+    end: Optional[pd.Timestamp] = None,
+) -> pd.DataFrame:
+    """Cross-series read in long format (series_id, date, value) with filter pushdown."""
+
+    ids = list(series_ids) if series_ids is not None else None
+    paths = sorted(root.glob("bucket=*.parquet")) + [
+        d.with_suffix(".parquet") for d in sorted(root.glob("bucket=*.deltas"))
+    ]
+    tables = []
+    for path in sorted(set(paths)):
+        with _bucket_lock(path):
+            tables.append(_read_bucket(path, series_ids=ids, start=start, end=end))
+    if not tables:
+        return _SCHEMA.empty_table().to_pandas()
+
+    table = pa.concat_tables(tables)
+    return table.sort_by([("series_id", "ascending"), ("date", "ascending")]).to_pandas()
+
+
+def dataset_series_exists(key: DatasetKey) -> bool:
+    return dataset_fingerprint(key) is not None
+
+
+def dataset_fingerprint(key: DatasetKey) -> Optional[Fingerprint]:
+    """Content token of one series (None if it is not stored).
+
+    Taken from its latest delta file name, else from the bucket's token map; buckets
+    written without a token map fall back to their file mtime/size.
+    """
+
+    path = bucket_path(key.root, key.series_id)
+    with _bucket_lock(path):
+        deltas = _delta_files(path, {key.series_id})
+        if deltas:
+            return ("dataset", _parse_delta(deltas[-1])[2])
+        tokens = _base_tokens(path)
+        if tokens is not None:
+            token = tokens.get(key.series_id)
+            return ("dataset", token) if token is not None else None
+        if not path.exists():
+            return None
+        if ds.dataset(path, format="parquet").count_rows(filter=ds.field("series_id") == key.series_id) == 0:
+            return None
+        st = path.stat()
+        return ("dataset", st.st_mtime_ns, st.st_size)
+
+
+def dataset_last_date(key: DatasetKey) -> Optional[date]:
+    """Last stored date of one series; reads only its row groups' date column."""
+
+    path = bucket_path(key.root, key.series_id)
+    expr = ds.field("series_id") == key.series_id
+    with _bucket_lock(path):
+        # deltas never remove points, so the max over bucket and deltas is the last date
+        files = ([path] if path.exists() else []) + _delta_files(path, {key.series_id})
+        maxima = [pc.max(ds.dataset(f, format="parquet").to_table(columns=["date"], filter=expr)["date"]) for f in files]
+    last = max((m.as_py() for m in maxima if m.is_valid), default=None)
+    if last is None:
+        return None
+    return pd.Timestamp(last).tz_convert("UTC").date()
+
+
+def store_dataset_series(key: DatasetKey, incoming: pd.DataFrame) -> StoreResult:
+    """Merge incoming into one series and append the changed points as a delta file."""
+
+    root, series_id = key.root, key.series_id
+    root.mkdir(parents=True, exist_ok=True)
+    _ensure_meta(root)
+    path = bucket_path(root, series_id)
+
+    with _bucket_lock(path):
+        t0 = time.perf_counter()
+        existing_table = _read_bucket(path, series_ids=[series_id], start=None, end=None)
+        existing = existing_table.select(["date", "value"]).to_pandas() if existing_table.num_rows else None
+
+        t1 = time.perf_counter()
+        merge_result = merge_series_detailed(existing, incoming)
+        merged = merge_result.frame
+        changes = merge_result.changes
+
+        t2 = time.perf_counter()
+        if len(changes):
+            token = _content_token(_series_table(series_id, merged))
+            _write_delta(path, series_id, _series_table(series_id, changes), token)
+            if len(_delta_files(path)) >= MAX_BUCKET_DELTAS:
+                _compact_bucket(path)
+        t3 = time.perf_counter()
+
+    rows_after = len(merged)
+    return StoreResult(
+        path=key,
+        rows_before=existing_table.num_rows,
+        rows_after=rows_after,
+        new_points=merge_result.new_points,
+        revised_points=merge_result.revised_points,
+        first_date=merged["date"].iloc[0] if rows_after else None,
+        last_date=merged["date"].iloc[-1] if rows_after else None,
+        last_value=float(merged["value"].iloc[-1]) if rows_after else None,
+        read_s=t1 - t0,
+        merge_s=t2 - t1,
+        write_s=t3 - t2,
+        changes=changes,
+        frame=merged,
+    )
+
+
+def compact_dataset(root: Path) -> int:
+    """Fold the pending deltas of every bucket into its file; returns the buckets rewritten."""
+
+    compacted = 0
+    for deltas_dir in sorted(root.glob("bucket=*.deltas")):
+        path = deltas_dir.with_suffix(".parquet")
+        with _bucket_lock(path):
+            if _delta_files(path):
+                _compact_bucket(path)
+                compacted += 1
+    return compacted
+
+
+def delete_dataset_series(key: DatasetKey) -> None:
+    path = bucket_path(key.root, key.series_id)
+    with _bucket_lock(path):
+        if path.exists() or _delta_files(path):
+            _compact_bucket(path, drop=key.series_id)
+
+
+def _read_bucket(
+    path: Path,
+    *,
+    series_ids: Optional[List[str]],
+    start: Optional[pd.Timestamp],
+    end: Optional[pd.Timestamp],
+) -> pa.Table:
+    """Rows of the bucket file with its deltas folded in (caller holds the bucket lock)."""
+
+    expr = _filter(series_ids, start=start, end=end)
+    parts = [ds.dataset(path, format="parquet").to_table(filter=expr).cast(_SCHEMA)] if path.exists() else []
+    deltas = _delta_files(path, set(series_ids) if series_ids is not None else None)
+    if not deltas:
+        return parts[0] if parts else _SCHEMA.empty_table()
+    parts.extend(ds.dataset(d, format="parquet").to_table(filter=expr).cast(_SCHEMA) for d in deltas)
+    return _latest(parts)
+
+
+def _latest(parts: List[pa.Table]) -> pa.Table:
+    """Concatenate tables in write order; the last row per (series_id, date) wins."""
+
+    table = pa.concat_tables(parts)
+    table = table.append_column("_seq", pa.array(np.arange(table.num_rows, dtype=np.int64)))
+    table = table.sort_by([("series_id", "ascending"), ("date", "ascending"), ("_seq", "ascending")])
+
+    ids = table["series_id"].to_numpy(zero_copy_only=False)
+    dates = pc.cast(table["date"], pa.int64()).to_numpy(zero_copy_only=False)
+    keep = np.ones(table.num_rows, dtype=bool)
+    keep[:-1] = (ids[1:] != ids[:-1]) | (dates[1:] != dates[:-1])
+    return table.filter(pa.array(keep)).drop_columns(["_seq"])
+
+
+def _compact_bucket(path: Path, *, drop: Optional[str] = None) -> None:
+    """Rewrite the bucket with its deltas folded in, then remove the deltas."""
+
+    deltas = _delta_files(path)
+    table = _read_bucket(path, series_ids=None, start=None, end=None)
+    if drop is not None:
+        table = table.filter(pc.not_equal(table["series_id"], drop))
+    _write_bucket(table, path)
+    for delta in deltas:
+        delta.unlink()
+
+
+def _filter(
+    series_ids: Optional[list],
+    *,
+    start: Optional[pd.Timestamp],
+    end: Optional[pd.Timestamp],
+) -> Optional[ds.Expression]:
+    expr: Optional[ds.Expression] = None
+    if series_ids is not None:
+        expr = ds.field("series_id").isin(series_ids)
+    if start is not None:
+        cond = ds.field("date") >= start
+        expr = cond if expr is None else expr & cond
+    if end is not None:
+        cond = ds.field("date") <= end
+        expr = cond if expr is None else expr & cond
+    return expr
+
+
+def _series_table(series_id: str, frame: pd.DataFrame) -> pa.Table:
+    return pa.table(
+        {
+            "series_id": pa.array([series_id] * len(frame), type=pa.string()),
+            "date": pa.array(frame["date"], type=_SCHEMA.field("date").type),
+            "value": pa.array(frame["value"].astype("float64"), type=pa.float64()),
+        },
+        schema=_SCHEMA,
+    )
+
+
+def _content_token(table: pa.Table) -> str:
+    """Row count and CRC32 of one series' sorted dates and values."""
+
+    dates = pc.cast(table["date"], pa.int64()).to_numpy(zero_copy_only=False)
+    values = table["value"].to_numpy(zero_copy_only=False).astype(np.float64)
+    crc = zlib.crc32(values.tobytes(), zlib.crc32(dates.astype(np.int64).tobytes()))
+    return f"{table.num_rows}-{crc:08x}"
+
+
+def _bucket_tokens(table: pa.Table) -> Dict[str, str]:
+    """Content token of every series in a bucket table sorted by (series_id, date)."""
+
+    if table.num_rows == 0:
+        return {}
+    ids = table["series_id"].to_numpy(zero_copy_only=False)
+    starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+    ends = np.r_[starts[1:], len(ids)]
+    return {str(ids[s]): _content_token(table.slice(s, e - s)) for s, e in zip(starts, ends)}
+
+
+def _base_tokens(path: Path) -> Optional[Dict[str, str]]:
+    """Token map from the bucket's footer ({} without a bucket file, None if it has no map)."""
+
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return {}
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _TOKEN_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    raw = (pq.read_metadata(path).metadata or {}).get(_TOKENS_KEY)
+    tokens = json.loads(raw) if raw is not None else None
+    _TOKEN_CACHE[path] = (stamp, tokens)
+    return tokens
+
+
+def _deltas_dir(path: Path) -> Path:
+    return path.with_suffix(".deltas")
+
+
+def _delta_files(path: Path, series_ids: Optional[Set[str]] = None) -> List[Path]:
+    """Delta files of a bucket in write order, optionally only those of series_ids."""
+
+    try:
+        names = os.listdir(_deltas_dir(path))
+    except FileNotFoundError:
+        return []
+    files = []
+    for name in names:
+        if not name.endswith(".parquet") or name.startswith("."):
+            continue
+        series_id, seq, _ = _parse_delta(Path(name))
+        if series_ids is None or series_id in series_ids:
+            files.append((seq, name))
+    return [_deltas_dir(path) / name for _, name in sorted(files)]
+
+
+def _parse_delta(delta: Path) -> Tuple[str, int, str]:
+    """(series_id, sequence number, content token) from a delta file name."""
+
+    series_id, seq, token = delta.name[: -len(".parquet")].rsplit("@", 2)
+    return series_id, int(seq), token
+
+
+def _next_seq() -> int:
+    # wall clock in ns, strictly increasing within the process
+    global _LAST_SEQ
+    with _SEQ_LOCK:
+        _LAST_SEQ = max(time.time_ns(), _LAST_SEQ + 1)
+        return _LAST_SEQ
+
+
+def _write_delta(path: Path, series_id: str, table: pa.Table, token: str) -> None:
+    deltas_dir = _deltas_dir(path)
+    deltas_dir.mkdir(exist_ok=True)
+    target = deltas_dir / f"{series_id}@{_next_seq():020d}@{token}.parquet"
+    tmp = target.with_name(f".{target.name}.tmp")
+    pq.write_table(table, tmp)
+    os.replace(tmp, target)
+
+
+def _write_bucket(table: pa.Table, path: Path) -> None:
+    tokens = _bucket_tokens(table)
+    table = table.replace_schema_metadata({_TOKENS_KEY: json.dumps(tokens, sort_keys=True)})
+    tmp = path.with_name(f".{path.name}.tmp")
+    pq.write_table(table, tmp, row_group_size=ROW_GROUP_SIZE)
+    os.replace(tmp, path)
+    # coarse mtimes could make an equal-size rewrite look unchanged to _base_tokens
+    st = path.stat()
+    _TOKEN_CACHE[path] = ((st.st_mtime_ns, st.st_size), tokens)
+
+
+def _bucket_lock(path: Path) -> threading.Lock:
+    with _BUCKET_LOCKS_GUARD:
+        return _BUCKET_LOCKS.setdefault(path, threading.Lock())
+
+
+def _bucket_count(root: Path) -> int:
+    # _dataset.json is read once per root; without it the default applies, uncached,
+    # until _ensure_meta writes it
+    buckets = _BUCKET_COUNTS.get(root)
+    if buckets is None:
+        meta_path = root / DATASET_META_NAME
+        if not meta_path.exists():
+            return DEFAULT_BUCKETS
+        buckets = _BUCKET_COUNTS[root] = int(json.loads(meta_path.read_text(encoding="utf-8"))["buckets"])
+    return buckets
+
+
+def _read_meta(root: Path) -> dict:
+    meta_path = root / DATASET_META_NAME
+    if not meta_path.exists():
+        return {"version": 1, "buckets": DEFAULT_BUCKETS}
+    return json.loads(meta_path.read_text(encoding="utf-8"))
+
+
+def _ensure_meta(root: Path) -> None:
+    # the bucket count is fixed once the dataset exists; changing it would orphan rows
+    meta_path = root / DATASET_META_NAME
+    if not meta_path.exists():
+        # concurrent writers may race here: write aside and rename so readers never
+        # see a partially written file
+        tmp = meta_path.with_name(f".{meta_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(_read_meta(root), sort_keys=True), encoding="utf-8")
+        os.replace(tmp, meta_path)
+
+
+def _empty_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {"date": pd.DatetimeIndex([], dtype="datetime64[ns, UTC]"), "value": pd.Series([], dtype="float64")}
+    )
+
+
+__all__ = [
+    "DATASET_DIRNAME",
+    "MAX_BUCKET_DELTAS",
+    "bucket_path",
+    "compact_dataset",
+    "dataset_fingerprint",
+    "dataset_last_date",
+    "dataset_series_exists",
+    "delete_dataset_series",
+    "load_dataset_series",
+    "scan_dataset",
+    "store_dataset_series",
+]
@@ -1,10 +1,184 @@
 from __future__ import annotations
 
+from contextlib import closing
 from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
+import json
+import math
 import sqlite3
+import time
+
+
+SCHEMA_VERSION = 3
+
+_BUSY_TIMEOUT_S = 30.0
+
+_SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS series_metadata (
+        series_id TEXT PRIMARY KEY,
+        provider TEXT NOT NULL,
+        provider_symbol TEXT NOT NULL,
+        category TEXT NOT NULL,
+        frequency_target TEXT NOT NULL,
+        timezone TEXT NOT NULL,
+        units TEXT NOT NULL,
+        transform TEXT NOT NULL,
+        notes TEXT NOT NULL,
+        enabled INTEGER NOT NULL,
+        status TEXT NOT NULL,
+        message TEXT NOT NULL,
+        last_run_at TEXT NOT NULL,
+        last_ok_at TEXT,
+        last_observation_date TEXT,
+        stored_path TEXT,
+        new_points INTEGER NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_series_metadata_status ON series_metadata(status);
+    CREATE TABLE IF NOT EXISTS series_summary (
+        series_id TEXT PRIMARY KEY,
+        stored_path TEXT NOT NULL,
+        fingerprint TEXT NOT NULL,
+        last_date TEXT NOT NULL,
+        last_value REAL,
+        anchors TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS series_runs (
+        id INTEGER PRIMARY KEY,
+        run_id TEXT NOT NULL,
+        series_id TEXT NOT NULL,
+        provider TEXT NOT NULL,
+        status TEXT NOT NULL,
+        message TEXT NOT NULL,
+        run_at TEXT NOT NULL,
+        new_points INTEGER NOT NULL,
+        revised_points INTEGER NOT NULL,
+        last_observation_date TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_series_runs_series_run_at ON series_runs(series_id, run_at);
+    CREATE INDEX IF NOT EXISTS idx_series_runs_status ON series_runs(status, series_id, run_at);
+    CREATE INDEX IF NOT EXISTS idx_series_runs_new_data ON series_runs(series_id, run_at) WHERE new_points > 0;
+"""
+
+_INSERT_RUN_SQL = """
+    INSERT INTO series_runs (
+        run_id, series_id, provider, status, message, run_at, new_points, revised_points,
+        last_observation_date
+    ) VALUES (
+        :run_id, :series_id, :provider, :status, :message, :run_at, :new_points, :revised_points,
+        :last_observation_date
+    );
+"""
+
+# Per-series health from the run history. Every subquery is an index lookup on one
+# series (idx_series_runs_status, the partial idx_series_runs_new_data, and
+# idx_series_runs_series_run_at for the streak), so last_ok_at/last_new_data_at
+# read one index entry per series instead of scanning its history:
+# - last_ok_at: latest run with status ok
+# - last_new_data_at: latest run that stored new points
+# - failure_streak: runs since the last ok run (all of them if there was none)
+_SERIES_STATUS_SQL = """
+    SELECT s.*,
+        (
+            SELECT COUNT(*) FROM series_runs r
+            WHERE r.series_id = s.series_id AND r.run_at > COALESCE(s.last_ok_at, '')
+        ) AS failure_streak
+    FROM (
+        SELECT
+            m.series_id,
+            m.provider,
+            m.status,
+            m.last_run_at,
+            m.last_observation_date,
+            (
+                SELECT MAX(r.run_at) FROM series_runs r
+                WHERE r.status = 'ok' AND r.series_id = m.series_id
+            ) AS last_ok_at,
+            (
+                SELECT r.run_at FROM series_runs r
+                WHERE r.series_id = m.series_id AND r.new_points > 0
+                ORDER BY r.run_at DESC LIMIT 1
+            ) AS last_new_data_at
+        FROM series_metadata m
+    ) s
+    WHERE (:stale_before IS NULL OR s.last_new_data_at IS NULL OR s.last_new_data_at < :stale_before)
+    AND failure_streak >= :min_failure_streak
+    ORDER BY s.series_id
+"""
+
+_UPSERT_METADATA_SQL = """
+    INSERT INTO series_metadata (
+        series_id,
+        provider,
+        provider_symbol,
+        category,
+        frequency_target,
+        timezone,
+        units,
+        transform,
+        notes,
+        enabled,
+        status,
+        message,
+        last_run_at,
+        last_ok_at,
+        last_observation_date,
+        stored_path,
+        new_points
+    ) VALUES (
+        :series_id,
+        :provider,
+        :provider_symbol,
+        :category,
+        :frequency_target,
+        :timezone,
+        :units,
+        :transform,
+        :notes,
+        :enabled,
+        :status,
+        :message,
+        :last_run_at,
+        :last_ok_at,
+        :last_observation_date,
+        :stored_path,
+        :new_points
+    )
+    ON CONFLICT(series_id) DO UPDATE SET
+        provider=excluded.provider,
+        provider_symbol=excluded.provider_symbol,
+        category=excluded.category,
+        frequency_target=excluded.frequency_target,
+        timezone=excluded.timezone,
+        units=excluded.units,
+        transform=excluded.transform,
+        notes=excluded.notes,
+        enabled=excluded.enabled,
+        status=excluded.status,
+        message=excluded.message,
+        last_run_at=excluded.last_run_at,
+        last_ok_at=excluded.last_ok_at,
+        last_observation_date=excluded.last_observation_date,
+        stored_path=excluded.stored_path,
+        new_points=excluded.new_points;
+"""
+
+_UPSERT_SUMMARY_SQL = """
+    INSERT INTO series_summary (
+        series_id, stored_path, fingerprint, last_date, last_value, anchors, updated_at
+    ) VALUES (
+        :series_id, :stored_path, :fingerprint, :last_date, :last_value, :anchors, :updated_at
+    )
+    ON CONFLICT(series_id) DO UPDATE SET
+        stored_path=excluded.stored_path,
+        fingerprint=excluded.fingerprint,
+        last_date=excluded.last_date,
+        last_value=excluded.last_value,
+        anchors=excluded.anchors,
+        updated_at=excluded.updated_at;
+"""
 
 
 @dataclass(frozen=True)
@@ -28,130 +202,244 @@ class SeriesMetadataRecord:
     new_points: int
 
 
+@dataclass(frozen=True)
+class SeriesSummaryRecord:
+    """Report-facing summary of a stored series (see storage.summary).
+
+    anchors maps delta window (days) to the most recent value on or before
+    last_date - window (None: no history that far back).
+    """
+
+    series_id: str
+    stored_path: Path
+    fingerprint: str
+    last_date: datetime
+    last_value: float
+    anchors: Dict[int, Optional[float]]
+    updated_at: datetime
+
+
+@dataclass(frozen=True)
+class SeriesRunRecord:
+    """One row of the append-only run history (one per series per run)."""
+
+    run_id: str
+    series_id: str
+    provider: str
+    status: str
+    message: str
+    run_at: datetime
+    new_points: int
+    revised_points: int
+    last_observation_date: Optional[date]
+
+
+@dataclass(frozen=True)
+class SeriesStatusRecord:
+    """Health of one series derived from the run history (see query_series_status)."""
+
+    series_id: str
+    provider: str
+    status: str
+    last_run_at: datetime
+    last_ok_at: Optional[datetime]
+    last_new_data_at: Optional[datetime]
+    last_observation_date: Optional[date]
+    failure_streak: int
+
+
 def init_db(path: Path) -> None:
-    """Ensure metadata database exists with the expected schema."""
+    """Ensure metadata database exists with the expected schema.
+
+    The schema version is kept in PRAGMA user_version; an up-to-date database only
+    costs one pragma read. The CLI calls this from the commands that use the
+    metadata (run-all, run-one, status, and report before refreshing summaries).
+
+    WAL mode (readers and the single writer do not block each other) is persistent
+    in the database file, so it is set here once instead of on every connection.
+    """
 
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    with sqlite3.connect(path) as conn:
-        conn.executescript(
-            """
-            CREATE TABLE IF NOT EXISTS series_metadata (
-                series_id TEXT PRIMARY KEY,
-                provider TEXT NOT NULL,
-                provider_symbol TEXT NOT NULL,
-                category TEXT NOT NULL,
-                frequency_target TEXT NOT NULL,
-                timezone TEXT NOT NULL,
-                units TEXT NOT NULL,
-                transform TEXT NOT NULL,
-                notes TEXT NOT NULL,
-                enabled INTEGER NOT NULL,
-                status TEXT NOT NULL,
-                message TEXT NOT NULL,
-                last_run_at TEXT NOT NULL,
-                last_ok_at TEXT,
-                last_observation_date TEXT,
-                stored_path TEXT,
-                new_points INTEGER NOT NULL
-            );
-            CREATE INDEX IF NOT EXISTS idx_series_metadata_status ON series_metadata(status);
-            """
-        )
+    with closing(_connect(path)) as conn:
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+        conn.execute("PRAGMA journal_mode=WAL")
+        with conn:
+            conn.executescript(_SCHEMA_SQL)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+class MetadataSession:
+    """One metadata connection for a whole run.
+
+    Upserts are buffered and written with executemany in a single transaction per
+    batch (every batch_size records, on flush() and on close()), instead of one
+    connection and one fsync per series. The database runs in WAL mode, so readers
+    (e.g. the status command) are not blocked by a running ingest.
+
+    Reads flush pending writes first. Use as a context manager; the session is bound
+    to the thread that opened it.
+
+    write_s accumulates the wall time of the batch writes (the SQLite transactions),
+    whichever call triggered them.
+    """
+
+    def __init__(self, path: Path, *, batch_size: int = 256) -> None:
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self._conn = _connect(path)
+        self._conn.row_factory = sqlite3.Row
+        self._pending_metadata: List[dict] = []
+        self._pending_summaries: List[dict] = []
+        self._pending_runs: List[dict] = []
+        self.write_s = 0.0
+
+    def __enter__(self) -> "MetadataSession":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def upsert_series_metadata(self, record: SeriesMetadataRecord) -> None:
+        self._pending_metadata.append(_serialize_record(record))
+        self._maybe_flush()
+
+    def upsert_series_summaries(self, summaries: List[SeriesSummaryRecord]) -> None:
+        self._pending_summaries.extend(_serialize_summary(s) for s in summaries)
+        self._maybe_flush()
+
+    def append_series_run(self, record: SeriesRunRecord) -> None:
+        self._pending_runs.append(_serialize_run(record))
+        self._maybe_flush()
+
+    def flush(self) -> None:
+        if not (self._pending_metadata or self._pending_summaries or self._pending_runs):
+            return
+        start = time.perf_counter()
+        with self._conn:
+            if self._pending_metadata:
+                self._conn.executemany(_UPSERT_METADATA_SQL, self._pending_metadata)
+            if self._pending_summaries:
+                self._conn.executemany(_UPSERT_SUMMARY_SQL, self._pending_summaries)
+            if self._pending_runs:
+                self._conn.executemany(_INSERT_RUN_SQL, self._pending_runs)
+        self.write_s += time.perf_counter() - start
+        self._pending_metadata.clear()
+        self._pending_summaries.clear()
+        self._pending_runs.clear()
+
+    def list_series_metadata(self) -> List[SeriesMetadataRecord]:
+        self.flush()
+        rows = self._conn.execute("SELECT * FROM series_metadata ORDER BY series_id").fetchall()
+        return [_row_to_record(row) for row in rows]
+
+    def get_series_metadata(self, series_id: str) -> Optional[SeriesMetadataRecord]:
+        self.flush()
+        row = self._conn.execute(
+            "SELECT * FROM series_metadata WHERE series_id = ?", (series_id,)
+        ).fetchone()
+        return _row_to_record(row) if row is not None else None
+
+    def list_series_summaries(self) -> Dict[str, SeriesSummaryRecord]:
+        self.flush()
+        try:
+            rows = self._conn.execute("SELECT * FROM series_summary").fetchall()
+        except sqlite3.OperationalError:
+            return {}  # database created before the summary table existed
+        return {row["series_id"]: _row_to_summary(row) for row in rows}
+
+    def query_series_status(
+        self,
+        *,
+        stale_before: Optional[datetime] = None,
+        min_failure_streak: int = 0,
+    ) -> List[SeriesStatusRecord]:
+        """Per-series health; optionally only series without new data since stale_before
+        and/or with at least min_failure_streak non-ok runs since their last ok run."""
+
+        self.flush()
+        rows = self._conn.execute(
+            _SERIES_STATUS_SQL,
+            {
+                "stale_before": stale_before.isoformat() if stale_before is not None else None,
+                "min_failure_streak": min_failure_streak,
+            },
+        ).fetchall()
+        return [_row_to_status(row) for row in rows]
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
+
+    def _maybe_flush(self) -> None:
+        pending = len(self._pending_metadata) + len(self._pending_summaries) + len(self._pending_runs)
+        if pending >= self.batch_size:
+            self.flush()
 
 
 def upsert_series_metadata(db_path: Path, record: SeriesMetadataRecord) -> None:
-    """Insert or update a series metadata record."""
-
-    payload = _serialize_record(record)
-
-    with sqlite3.connect(db_path) as conn:
-        conn.execute(
-            """
-            INSERT INTO series_metadata (
-                series_id,
-                provider,
-                provider_symbol,
-                category,
-                frequency_target,
-                timezone,
-                units,
-                transform,
-                notes,
-                enabled,
-                status,
-                message,
-                last_run_at,
-                last_ok_at,
-                last_observation_date,
-                stored_path,
-                new_points
-            ) VALUES (
-                :series_id,
-                :provider,
-                :provider_symbol,
-                :category,
-                :frequency_target,
-                :timezone,
-                :units,
-                :transform,
-                :notes,
-                :enabled,
-                :status,
-                :message,
-                :last_run_at,
-                :last_ok_at,
-                :last_observation_date,
-                :stored_path,
-                :new_points
-            )
-            ON CONFLICT(series_id) DO UPDATE SET
-                provider=excluded.provider,
-                provider_symbol=excluded.provider_symbol,
-                category=excluded.category,
-                frequency_target=excluded.frequency_target,
-                timezone=excluded.timezone,
-                units=excluded.units,
-                transform=excluded.transform,
-                notes=excluded.notes,
-                enabled=excluded.enabled,
-                status=excluded.status,
-                message=excluded.message,
-                last_run_at=excluded.last_run_at,
-                last_ok_at=excluded.last_ok_at,
-                last_observation_date=excluded.last_observation_date,
-                stored_path=excluded.stored_path,
-                new_points=excluded.new_points;
-            """,
-            payload,
-        )
+    """Insert or update a series metadata record (one-off; runs use MetadataSession)."""
+
+    with MetadataSession(db_path) as session:
+        session.upsert_series_metadata(record)
 
 
 def list_series_metadata(db_path: Path) -> List[SeriesMetadataRecord]:
     """Return all series metadata records ordered by series_id."""
 
-    with sqlite3.connect(db_path) as conn:
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute(
-            "SELECT * FROM series_metadata ORDER BY series_id"
-        ).fetchall()
-
-    return [_row_to_record(row) for row in rows]
+    with MetadataSession(db_path) as session:
+        return session.list_series_metadata()
 
 
 def get_series_metadata(db_path: Path, series_id: str) -> Optional[SeriesMetadataRecord]:
     """Return one series metadata entry if present."""
 
-    with sqlite3.connect(db_path) as conn:
-        conn.row_factory = sqlite3.Row
-        row = conn.execute(
-            "SELECT * FROM series_metadata WHERE series_id = ?", (series_id,)
-        ).fetchone()
+    with MetadataSession(db_path) as session:
+        return session.get_series_metadata(series_id)
+
+
+def upsert_series_summaries(db_path: Path, summaries: List[SeriesSummaryRecord]) -> None:
+    """Insert or replace series summaries in one transaction."""
+
+    if not summaries:
+        return
+
+    with MetadataSession(db_path, batch_size=len(summaries)) as session:
+        session.upsert_series_summaries(summaries)
 
-    if row is None:
-        return None
 
-    return _row_to_record(row)
+def list_series_summaries(db_path: Path) -> Dict[str, SeriesSummaryRecord]:
+    """Return all series summaries keyed by series_id (empty if the database is missing)."""
+
+    if not db_path.exists():
+        return {}
+
+    with MetadataSession(db_path) as session:
+        return session.list_series_summaries()
+
+
+def query_series_status(
+    db_path: Path,
+    *,
+    stale_before: Optional[datetime] = None,
+    min_failure_streak: int = 0,
+) -> List[SeriesStatusRecord]:
+    """Return per-series health from the run history (see MetadataSession.query_series_status)."""
+
+    with MetadataSession(db_path) as session:
+        return session.query_series_status(stale_before=stale_before, min_failure_streak=min_failure_streak)
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=_BUSY_TIMEOUT_S)
+    # per-connection settings (journal_mode=WAL is set once by init_db); NORMAL sync
+    # is durable across application crashes and only fsyncs at checkpoints in WAL mode
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
 
 
 def _serialize_record(record: SeriesMetadataRecord) -> dict:
@@ -178,6 +466,67 @@ def _serialize_record(record: SeriesMetadataRecord) -> dict:
     }
 
 
+def _serialize_run(record: SeriesRunRecord) -> dict:
+    return {
+        "run_id": record.run_id,
+        "series_id": record.series_id,
+        "provider": record.provider,
+        "status": record.status,
+        "message": record.message,
+        "run_at": record.run_at.isoformat(),
+        "new_points": record.new_points,
+        "revised_points": record.revised_points,
+        "last_observation_date": record.last_observation_date.isoformat()
+        if record.last_observation_date
+        else None,
+    }
+
+
+def _row_to_status(row: sqlite3.Row) -> SeriesStatusRecord:
+    last_ok_at = row["last_ok_at"]
+    last_new_data_at = row["last_new_data_at"]
+    last_observation_date = row["last_observation_date"]
+
+    return SeriesStatusRecord(
+        series_id=row["series_id"],
+        provider=row["provider"],
+        status=row["status"],
+        last_run_at=datetime.fromisoformat(row["last_run_at"]),
+        last_ok_at=datetime.fromisoformat(last_ok_at) if last_ok_at else None,
+        last_new_data_at=datetime.fromisoformat(last_new_data_at) if last_new_data_at else None,
+        last_observation_date=date.fromisoformat(last_observation_date)
+        if last_observation_date
+        else None,
+        failure_streak=int(row["failure_streak"]),
+    )
+
+
+def _serialize_summary(summary: SeriesSummaryRecord) -> dict:
+    return {
+        "series_id": summary.series_id,
+        "stored_path": str(summary.stored_path),
+        "fingerprint": summary.fingerprint,
+        "last_date": summary.last_date.isoformat(),
+        # SQLite stores NaN as NULL; _row_to_summary maps it back
+        "last_value": summary.last_value,
+        "anchors": json.dumps({str(w): v for w, v in summary.anchors.items()}),
+        "updated_at": summary.updated_at.isoformat(),
+    }
+
+
+def _row_to_summary(row: sqlite3.Row) -> SeriesSummaryRecord:
+    last_value = row["last_value"]
+    return SeriesSummaryRecord(
+        series_id=row["series_id"],
+        stored_path=Path(row["stored_path"]),
+        fingerprint=row["fingerprint"],
+        last_date=datetime.fromisoformat(row["last_date"]),
+        last_value=float(last_value) if last_value is not None else math.nan,
+        anchors={int(w): v for w, v in json.loads(row["anchors"]).items()},
+        updated_at=datetime.fromisoformat(row["updated_at"]),
+    )
+
+
 def _row_to_record(row: sqlite3.Row) -> SeriesMetadataRecord:
     last_ok_at = row["last_ok_at"]
     last_observation_date = row["last_observation_date"]
@@ -207,9 +556,17 @@ def _row_to_record(row: sqlite3.Row) -> SeriesMetadataRecord:
 
 
 __all__ = [
+    "MetadataSession",
+    "SCHEMA_VERSION",
     "SeriesMetadataRecord",
+    "SeriesRunRecord",
+    "SeriesStatusRecord",
+    "SeriesSummaryRecord",
     "get_series_metadata",
     "init_db",
     "list_series_metadata",
+    "list_series_summaries",
+    "query_series_status",
     "upsert_series_metadata",
+    "upsert_series_summaries",
 ]
@@ -1,32 +1,213 @@
 from __future__ import annotations
 
+import json
+import os
+import shutil
+import time
 from dataclasses import dataclass
+from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Literal, Optional, Union
 
+import numpy as np
 import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from macrolens_poc.storage.series_cache import CacheStats, Fingerprint, SeriesCache
+
+StorageLayout = Literal["file", "partitioned", "dataset"]
+DateLike = Union[date, pd.Timestamp, str]
+
+MANIFEST_NAME = "manifest.json"
+DATASET_DIRNAME = "dataset"
+
+# process-local cache of full series loads (see configure_series_cache)
+_SERIES_CACHE = SeriesCache()
+
+
+@dataclass(frozen=True)
+class DatasetKey:
+    """Address of one series inside the consolidated dataset at root.
+
+    The dataset layout has no file per series, so series_path returns this key
+    instead of a Path; the storage functions dispatch on its type.
+    """
+
+    root: Path
+    series_id: str
+
+    def __str__(self) -> str:
+        return str(self.root / self.series_id)
+
+
+# a Path (single file or partitioned directory) or a DatasetKey
+SeriesLocation = Union[Path, DatasetKey]
 
 
 @dataclass(frozen=True)
 class StoreResult:
-    path: Path
+    """Outcome of store_series, summarized from the in-memory merged frame.
+
+    first_date/last_date are the min/max stored dates (the frame is sorted), so
+    callers never need to re-read the file after a write.
+
+    read_s/merge_s/write_s are the wall times (monotonic clock) spent loading the
+    existing data, merging and writing Parquet.
+
+    changes holds the incoming points that were new or revised (see
+    MergeResult.changes); None when the backend did not report them.
+
+    frame is the end of the stored series as written, from memory: the whole merged
+    series for file and dataset stores; for partitioned stores the touched
+    partitions that end the series (None if the last partition was not touched).
+    """
+
+    path: SeriesLocation
     rows_before: int
     rows_after: int
     new_points: int
+    revised_points: int = 0
+    first_date: Optional[pd.Timestamp] = None
+    last_date: Optional[pd.Timestamp] = None
+    last_value: Optional[float] = None
+    read_s: float = 0.0
+    merge_s: float = 0.0
+    write_s: float = 0.0
+    changes: Optional[pd.DataFrame] = None
+    frame: Optional[pd.DataFrame] = None
+
+
+def series_path(data_dir: Path, series_id: str, layout: StorageLayout = "file") -> SeriesLocation:
+    """Storage location of one series for the given layout.
+
+    - file:        data/series/{id}.parquet (one Parquet file per series)
+    - partitioned: data/series/{id}/ (one Parquet file per calendar year + manifest)
+    - dataset:     DatasetKey(data/dataset, id), a key into the consolidated
+                   long-format dataset (see storage.dataset_store)
+    """
 
-
-def load_series(path: Path) -> Optional[pd.DataFrame]:
+    if layout == "dataset":
+        return DatasetKey(data_dir / DATASET_DIRNAME, series_id)
+    if layout == "partitioned":
+        return data_dir / "series" / series_id
+    if layout == "file":
+        return data_dir / "series" / f"{series_id}.parquet"
+    raise ValueError(f"unknown storage layout: {layout}")
+
+
+def load_series(
+    path: SeriesLocation,
+    *,
+    start: Optional[DateLike] = None,
+    end: Optional[DateLike] = None,
+) -> Optional[pd.DataFrame]:
     """Load an existing stored series.
 
     Storage format:
     - Parquet with columns: date (datetime64[ns, UTC] or datetime64[ns]), value (float)
+    - a path ending in .parquet is a single file, any other path is a partitioned
+      series directory; a DatasetKey addresses the consolidated dataset (see
+      series_path)
+
+    start/end (inclusive) restrict the returned range; for partitioned series only
+    the partitions overlapping the range are read.
+
+    Full loads go through the process-local series cache (keyed by path, validated
+    by file mtime/size, or by the series' content token for dataset keys); range loads are answered from a cached full frame when one
+    exists. Returned frames share memory with the cache: treat them as read-only.
 
-    Returns None if file does not exist.
+    Returns None if the series does not exist.
     """
 
-    if not path.exists():
+    fingerprint = _fingerprint(path)
+    if fingerprint is None:
         return None
 
+    lo, hi = _to_utc_ts(start), _to_utc_ts(end)
+    ranged = lo is not None or hi is not None
+
+    df = _SERIES_CACHE.get(path, fingerprint)
+    if df is None:
+        if ranged and not _is_file(path):
+            # partial read straight from the backend; not cached
+            return _load_uncached(path, start=lo, end=hi)
+
+        df = _load_uncached(path, start=None, end=None)
+        if df is None:
+            return None
+        _SERIES_CACHE.put(path, fingerprint, df)
+
+    if ranged and not df.empty:
+        df = _slice_range(df, start=lo, end=hi)
+    return df.copy(deep=False)
+
+
+def configure_series_cache(max_bytes: int) -> None:
+    """Set the byte budget of the series cache (0 disables it)."""
+
+    _SERIES_CACHE.resize(max_bytes)
+
+
+def series_cache_stats() -> CacheStats:
+    return _SERIES_CACHE.stats()
+
+
+def clear_series_cache() -> None:
+    _SERIES_CACHE.clear()
+
+
+def _load_uncached(
+    path: SeriesLocation, *, start: Optional[pd.Timestamp], end: Optional[pd.Timestamp]
+) -> Optional[pd.DataFrame]:
+    if isinstance(path, DatasetKey):
+        from macrolens_poc.storage.dataset_store import load_dataset_series
+
+        return load_dataset_series(path, start=start, end=end)
+
+    if _is_partitioned(path):
+        df = _load_partitioned(path, start=start, end=end)
+    else:
+        df = _read_frame(path)
+
+    if df.empty or (start is None and end is None):
+        return df
+    return _slice_range(df, start=start, end=end)
+
+
+def series_fingerprint(path: SeriesLocation) -> Optional[str]:
+    """Stable text form of the stored state's identity (None if nothing is stored).
+
+    Changes whenever the series is rewritten; for the dataset layout it follows the
+    series' own content, so writes to other series in the same bucket keep it.
+    """
+
+    fingerprint = _fingerprint(path)
+    if fingerprint is None:
+        return None
+    return ":".join(str(part) for part in fingerprint)
+
+
+def _fingerprint(path: SeriesLocation) -> Optional[Fingerprint]:
+    """Cheap identity of the stored state (None if nothing is stored)."""
+
+    if isinstance(path, DatasetKey):
+        from macrolens_poc.storage.dataset_store import dataset_fingerprint
+
+        return dataset_fingerprint(path)
+    if _is_partitioned(path):
+        target = path / MANIFEST_NAME
+    else:
+        target = path
+
+    try:
+        st = target.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_frame(path: Path) -> pd.DataFrame:
     df = pd.read_parquet(path)
     if df.empty:
         return df
@@ -35,11 +216,38 @@ def load_series(path: Path) -> Optional[pd.DataFrame]:
         raise ValueError(f"Invalid stored series schema in {path}: expected columns date,value")
 
     df = df.copy()
-    df["date"] = pd.to_datetime(df["date"], utc=True)
-    df = df.sort_values("date")
+    df["date"] = _as_utc(df["date"])
+    # files written by store_series are already sorted; skip the O(n log n) re-sort
+    if not df["date"].is_monotonic_increasing:
+        df = df.sort_values("date")
     return df
 
 
+def _slice_range(df: pd.DataFrame, *, start: Optional[pd.Timestamp], end: Optional[pd.Timestamp]) -> pd.DataFrame:
+    dates = df["date"]
+    lo = 0 if start is None else int(dates.searchsorted(start, side="left"))
+    hi = len(df) if end is None else int(dates.searchsorted(end, side="right"))
+    return df.iloc[lo:hi]
+
+
+@dataclass(frozen=True)
+class MergeResult:
+    """Outcome of merge_series_detailed.
+
+    - new_points: dates that were not stored before
+    - revised_points: stored dates whose value changed (NaN == NaN counts as equal)
+    - revisions: one row per revised date (date, previous_value, value)
+    - changes: incoming rows that are new or revised (date, value), i.e. what a
+      vintage log has to record (see storage.revision_store)
+    """
+
+    frame: pd.DataFrame
+    new_points: int
+    revised_points: int
+    revisions: pd.DataFrame
+    changes: pd.DataFrame
+
+
 def merge_series(existing: Optional[pd.DataFrame], incoming: pd.DataFrame) -> tuple[pd.DataFrame, int]:
     """Merge incoming points into existing without duplicates.
 
@@ -50,56 +258,462 @@ def merge_series(existing: Optional[pd.DataFrame], incoming: pd.DataFrame) -> tu
     Returns merged dataframe and number of *new* dates added.
     """
 
+    result = merge_series_detailed(existing, incoming)
+    return result.frame, result.new_points
+
+
+def merge_series_detailed(existing: Optional[pd.DataFrame], incoming: pd.DataFrame) -> MergeResult:
+    """Vectorized sorted merge of two (date, value) series.
+
+    Same rules as merge_series (incoming wins on equal dates, output sorted by
+    date), but implemented on int64 nanosecond arrays with searchsorted instead of
+    Python sets + concat/drop_duplicates/sort:
+
+    - both inputs are normally already sorted and unique (normalize/load_series
+      guarantee it); they are only re-sorted when they are not
+    - when every incoming date is after the stored tail (the daily append case) the
+      result is a plain concatenation
+    - otherwise existing rows overwritten by incoming are dropped and the incoming
+      rows are placed with one searchsorted over the remaining dates
+
+    Output has the canonical columns (date, value) and a fresh RangeIndex.
+    """
+
     if incoming.empty:
         if existing is None:
             out = incoming.copy()
             out["date"] = pd.to_datetime(out.get("date", pd.Series([], dtype="datetime64[ns]")), utc=True)
-            return out, 0
-        return existing.copy(), 0
-
-    inc = incoming.copy()
-    if "date" not in inc.columns or "value" not in inc.columns:
+            return MergeResult(
+                frame=out, new_points=0, revised_points=0, revisions=_empty_revisions(), changes=_empty_changes()
+            )
+        return MergeResult(
+            frame=existing.copy(),
+            new_points=0,
+            revised_points=0,
+            revisions=_empty_revisions(),
+            changes=_empty_changes(),
+        )
+
+    if "date" not in incoming.columns or "value" not in incoming.columns:
         raise ValueError("Incoming series must have columns: date, value")
 
-    inc["date"] = pd.to_datetime(inc["date"], utc=True)
+    inc_ns, inc_values = _sorted_unique_arrays(incoming)
 
     if existing is None or existing.empty:
-        merged = inc.drop_duplicates(subset=["date"], keep="last").sort_values("date")
-        return merged, len(merged)
+        frame = _frame_from_arrays(inc_ns, inc_values)
+        return MergeResult(
+            frame=frame,
+            new_points=len(inc_ns),
+            revised_points=0,
+            revisions=_empty_revisions(),
+            changes=frame,
+        )
+
+    ex_ns, ex_values = _sorted_unique_arrays(existing)
+
+    # fast path: pure append at the tail
+    if inc_ns[0] > ex_ns[-1]:
+        return MergeResult(
+            frame=_frame_from_arrays(
+                np.concatenate([ex_ns, inc_ns]), np.concatenate([ex_values, inc_values])
+            ),
+            new_points=len(inc_ns),
+            revised_points=0,
+            revisions=_empty_revisions(),
+            changes=_frame_from_arrays(inc_ns, inc_values),
+        )
+
+    pos = np.searchsorted(ex_ns, inc_ns)
+    in_bounds = pos < len(ex_ns)
+    matched = np.zeros(len(inc_ns), dtype=bool)
+    matched[in_bounds] = ex_ns[pos[in_bounds]] == inc_ns[in_bounds]
+
+    matched_pos = pos[matched]
+    previous = ex_values[matched_pos]
+    current = inc_values[matched]
+    changed = ~_values_equal(previous, current)
+
+    revisions = pd.DataFrame(
+        {
+            "date": _to_utc_datetimes(inc_ns[matched][changed]),
+            "previous_value": previous[changed],
+            "value": current[changed],
+        }
+    )
+
+    # new dates plus matched dates whose value changed
+    is_change = ~matched
+    is_change[matched] = changed
+
+    # drop overwritten existing rows, then interleave incoming rows by position
+    keep = np.ones(len(ex_ns), dtype=bool)
+    keep[matched_pos] = False
+    kept_ns = ex_ns[keep]
+    kept_values = ex_values[keep]
+
+    total = len(kept_ns) + len(inc_ns)
+    inc_slots = np.searchsorted(kept_ns, inc_ns) + np.arange(len(inc_ns))
+    kept_slots = np.ones(total, dtype=bool)
+    kept_slots[inc_slots] = False
+
+    out_ns = np.empty(total, dtype=np.int64)
+    out_ns[inc_slots] = inc_ns
+    out_ns[kept_slots] = kept_ns
+
+    out_values = np.empty(total, dtype=np.result_type(kept_values, inc_values))
+    out_values[inc_slots] = inc_values
+    out_values[kept_slots] = kept_values
+
+    return MergeResult(
+        frame=_frame_from_arrays(out_ns, out_values),
+        new_points=int((~matched).sum()),
+        revised_points=int(changed.sum()),
+        revisions=revisions,
+        changes=_frame_from_arrays(inc_ns[is_change], inc_values[is_change]),
+    )
+
+
+def _sorted_unique_arrays(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """Return (int64 ns dates, values) sorted by date with duplicates resolved keep-last."""
+
+    dates = _as_utc(df["date"])
+    ns = dates.dt.tz_convert(None).to_numpy(dtype="datetime64[ns]").view(np.int64)
+    values = df["value"].to_numpy()
+
+    if len(ns) > 1 and not (np.diff(ns) > 0).all():
+        # stable sort keeps input order among equal dates; take the last of each run
+        order = np.argsort(ns, kind="stable")
+        ns = ns[order]
+        values = values[order]
+        last_of_run = np.append(ns[1:] != ns[:-1], True)
+        ns = ns[last_of_run]
+        values = values[last_of_run]
 
-    ex = existing.copy()
-    ex["date"] = pd.to_datetime(ex["date"], utc=True)
+    return ns, values
 
-    # pandas prevents .astype("datetime64[ns]") on tz-aware; normalize via tz_localize(None)
-    ex_dates_ns = set(ex["date"].dt.tz_convert("UTC").dt.tz_localize(None).astype("int64").tolist())
 
-    combined = pd.concat([ex, inc], ignore_index=True)
-    merged = combined.drop_duplicates(subset=["date"], keep="last").sort_values("date")
+def _as_utc(dates: pd.Series) -> pd.Series:
+    """Like pd.to_datetime(utc=True), but free for columns that are already tz-aware.
 
-    merged_dates_ns = set(
-        merged["date"].dt.tz_convert("UTC").dt.tz_localize(None).astype("int64").tolist()
+    (to_datetime walks tz-aware input element by element to decide on caching.)
+    """
+
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        return dates.dt.tz_convert("UTC")
+    return pd.to_datetime(dates, utc=True)
+
+
+def _values_equal(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    equal = a == b
+    if a.dtype.kind == "f" or b.dtype.kind == "f":
+        equal |= pd.isna(a) & pd.isna(b)
+    return equal
+
+
+def _to_utc_datetimes(ns: np.ndarray) -> pd.DatetimeIndex:
+    return pd.DatetimeIndex(ns.view("datetime64[ns]")).tz_localize("UTC")
+
+
+def _frame_from_arrays(ns: np.ndarray, values: np.ndarray) -> pd.DataFrame:
+    return pd.DataFrame({"date": _to_utc_datetimes(ns), "value": values})
+
+
+def _empty_revisions() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "date": pd.DatetimeIndex([], dtype="datetime64[ns, UTC]"),
+            "previous_value": pd.Series([], dtype="float64"),
+            "value": pd.Series([], dtype="float64"),
+        }
     )
-    new_points = len(merged_dates_ns - ex_dates_ns)
 
-    return merged, new_points
 
+def _empty_changes() -> pd.DataFrame:
+    return _frame_from_arrays(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64))
 
-def store_series(path: Path, incoming: pd.DataFrame) -> StoreResult:
-    """Merge and write series to Parquet."""
+
+def store_series(path: SeriesLocation, incoming: pd.DataFrame) -> StoreResult:
+    """Merge and write series to Parquet.
+
+    Single-file series are rewritten as a whole; partitioned series only rewrite the
+    year partitions that incoming touches (plus the manifest); dataset keys append
+    the new and revised points as a delta file next to the series' bucket (see
+    storage.dataset_store). Writes go to a temporary file that is renamed into place.
+    """
+
+    if isinstance(path, DatasetKey):
+        from macrolens_poc.storage.dataset_store import store_dataset_series
+
+        _SERIES_CACHE.invalidate(path)
+        return store_dataset_series(path, incoming)
+
+    if _is_partitioned(path):
+        _SERIES_CACHE.invalidate(path)
+        return _store_partitioned(path, incoming)
 
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    t0 = time.perf_counter()
     existing = load_series(path)
     rows_before = 0 if existing is None else len(existing)
 
-    merged, new_points = merge_series(existing, incoming)
+    t1 = time.perf_counter()
+    merge_result = merge_series_detailed(existing, incoming)
+    merged = merge_result.frame
     rows_after = len(merged)
 
-    merged.to_parquet(path, index=False)
+    t2 = time.perf_counter()
+    _write_frame(merged, path)
+    t3 = time.perf_counter()
+    fingerprint = _fingerprint(path)
+    if fingerprint is not None:
+        _SERIES_CACHE.put(path, fingerprint, merged)
+
+    first_date: Optional[pd.Timestamp] = None
+    last_date: Optional[pd.Timestamp] = None
+    last_value: Optional[float] = None
+    if rows_after:
+        first_date = merged["date"].iloc[0]
+        last_date = merged["date"].iloc[-1]
+        last_value = float(merged["value"].iloc[-1])
 
     return StoreResult(
         path=path,
         rows_before=rows_before,
         rows_after=rows_after,
+        new_points=merge_result.new_points,
+        revised_points=merge_result.revised_points,
+        first_date=first_date,
+        last_date=last_date,
+        last_value=last_value,
+        read_s=t1 - t0,
+        merge_s=t2 - t1,
+        write_s=t3 - t2,
+        changes=merge_result.changes,
+        frame=merged,
+    )
+
+
+def migrate_series(src: SeriesLocation, dst: SeriesLocation) -> Optional[StoreResult]:
+    """Move a stored series to another layout (e.g. file -> partitioned).
+
+    Data is merged into dst first; src is only removed after the write succeeded.
+    Returns None when src does not exist.
+    """
+
+    existing = load_series(src)
+    if existing is None:
+        return None
+
+    result = store_series(dst, existing)
+
+    _SERIES_CACHE.invalidate(src)
+    if isinstance(src, DatasetKey):
+        from macrolens_poc.storage.dataset_store import delete_dataset_series
+
+        delete_dataset_series(src)
+    elif src.is_dir():
+        shutil.rmtree(src)
+    else:
+        src.unlink()
+
+    return result
+
+
+def stored_last_date(path: SeriesLocation) -> Optional[date]:
+    """Last stored date of a series without loading it (None if nothing is stored).
+
+    file: max of the date column statistics in the Parquet footer (falls back to
+    reading the date column only when a writer left no statistics); partitioned:
+    the manifest's last partition; dataset: the series' date column, read with
+    series_id pushdown.
+    """
+
+    if isinstance(path, DatasetKey):
+        from macrolens_poc.storage.dataset_store import dataset_last_date
+
+        return dataset_last_date(path)
+
+    if _is_partitioned(path):
+        partitions = _sorted_partitions(_read_manifest(path)) if path.exists() else []
+        return pd.Timestamp(partitions[-1]["max_date"]).date() if partitions else None
+
+    if not path.exists():
+        return None
+    last = _footer_max(path, "date")
+    if last is None:
+        dates = pq.read_table(path, columns=["date"])["date"]
+        if len(dates) == 0:
+            return None
+        last = pc.max(dates).as_py()
+    return _to_utc_ts(last).date() if last is not None else None
+
+
+def _footer_max(path: Path, column: str) -> Optional[Any]:
+    """Max of a column from the row group statistics; None if any group lacks them."""
+
+    meta = pq.ParquetFile(path).metadata
+    names = [meta.schema.column(j).path for j in range(meta.num_columns)]
+    if column not in names or meta.num_row_groups == 0:
+        return None
+    j = names.index(column)
+    best = None
+    for i in range(meta.num_row_groups):
+        stats = meta.row_group(i).column(j).statistics
+        if meta.row_group(i).num_rows == 0:
+            continue
+        if stats is None or not stats.has_min_max:
+            return None
+        best = stats.max if best is None else max(best, stats.max)
+    return best
+
+
+def series_exists(path: SeriesLocation) -> bool:
+    """True if a series is stored at path (works for dataset keys, too)."""
+
+    if isinstance(path, DatasetKey):
+        from macrolens_poc.storage.dataset_store import dataset_series_exists
+
+        return dataset_series_exists(path)
+    return path.exists()
+
+
+# dataset_store imports this module, so its functions are imported where used
+def _is_partitioned(path: Path) -> bool:
+    return path.suffix != ".parquet"
+
+
+def _is_file(path: SeriesLocation) -> bool:
+    return isinstance(path, Path) and not _is_partitioned(path)
+
+
+def _write_frame(df: pd.DataFrame, path: Path) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    df.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+
+
+def _partition_file(year: int) -> str:
+    return f"year={year}.parquet"
+
+
+def _read_manifest(root: Path) -> Dict[str, Any]:
+    manifest_path = root / MANIFEST_NAME
+    if not manifest_path.exists():
+        return {"version": 1, "partitioning": "year", "partitions": {}}
+    return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+
+def _write_manifest(root: Path, manifest: Dict[str, Any]) -> None:
+    tmp = root / f".{MANIFEST_NAME}.tmp"
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, root / MANIFEST_NAME)
+
+
+def _partition_entry(df: pd.DataFrame, year: int) -> Dict[str, Any]:
+    return {
+        "file": _partition_file(year),
+        "rows": len(df),
+        "min_date": df["date"].iloc[0].isoformat(),
+        "max_date": df["date"].iloc[-1].isoformat(),
+        "last_value": float(df["value"].iloc[-1]),
+    }
+
+
+def _sorted_partitions(manifest: Dict[str, Any]) -> List[Dict[str, Any]]:
+    partitions = manifest["partitions"]
+    return [partitions[k] for k in sorted(partitions, key=int)]
+
+
+def _load_partitioned(
+    root: Path, *, start: Optional[pd.Timestamp], end: Optional[pd.Timestamp]
+) -> pd.DataFrame:
+    frames: List[pd.DataFrame] = []
+    for entry in _sorted_partitions(_read_manifest(root)):
+        if start is not None and pd.Timestamp(entry["max_date"]) < start:
+            continue
+        if end is not None and pd.Timestamp(entry["min_date"]) > end:
+            continue
+        frames.append(_read_frame(root / entry["file"]))
+
+    if not frames:
+        return pd.DataFrame(
+            {"date": pd.DatetimeIndex([], dtype="datetime64[ns, UTC]"), "value": pd.Series([], dtype="float64")}
+        )
+    # partitions are disjoint calendar years, each sorted: concatenation stays sorted
+    return pd.concat(frames, ignore_index=True)
+
+
+def _store_partitioned(root: Path, incoming: pd.DataFrame) -> StoreResult:
+    root.mkdir(parents=True, exist_ok=True)
+    manifest = _read_manifest(root)
+    rows_before = sum(int(e["rows"]) for e in manifest["partitions"].values())
+
+    new_points = 0
+    revised_points = 0
+    read_s = merge_s = write_s = 0.0
+    changes: List[pd.DataFrame] = []
+    written: Dict[int, pd.DataFrame] = {}
+
+    if not incoming.empty:
+        if "date" not in incoming.columns or "value" not in incoming.columns:
+            raise ValueError("Incoming series must have columns: date, value")
+
+        inc_ns, inc_values = _sorted_unique_arrays(incoming)
+        years = inc_ns.view("datetime64[ns]").astype("datetime64[Y]").astype(np.int64) + 1970
+        bounds = np.flatnonzero(np.diff(years)) + 1
+
+        for lo, hi in zip(np.r_[0, bounds], np.r_[bounds, len(years)]):
+            year = int(years[lo])
+            part_path = root / _partition_file(year)
+            t0 = time.perf_counter()
+            existing = _read_frame(part_path) if part_path.exists() else None
+
+            t1 = time.perf_counter()
+            merge_result = merge_series_detailed(existing, _frame_from_arrays(inc_ns[lo:hi], inc_values[lo:hi]))
+            new_points += merge_result.new_points
+            revised_points += merge_result.revised_points
+            changes.append(merge_result.changes)
+
+            t2 = time.perf_counter()
+            _write_frame(merge_result.frame, part_path)
+            manifest["partitions"][str(year)] = _partition_entry(merge_result.frame, year)
+            written[year] = merge_result.frame
+            t3 = time.perf_counter()
+            read_s, merge_s, write_s = read_s + (t1 - t0), merge_s + (t2 - t1), write_s + (t3 - t2)
+
+        t0 = time.perf_counter()
+        _write_manifest(root, manifest)
+        write_s += time.perf_counter() - t0
+
+    partitions = _sorted_partitions(manifest)
+    # the run of touched partitions at the end of the series, oldest first
+    tail: List[pd.DataFrame] = []
+    for year in sorted((int(k) for k in manifest["partitions"]), reverse=True):
+        if year not in written:
+            break
+        tail.insert(0, written[year])
+
+    return StoreResult(
+        path=root,
+        rows_before=rows_before,
+        rows_after=sum(int(e["rows"]) for e in partitions),
         new_points=new_points,
+        revised_points=revised_points,
+        first_date=pd.Timestamp(partitions[0]["min_date"]) if partitions else None,
+        last_date=pd.Timestamp(partitions[-1]["max_date"]) if partitions else None,
+        last_value=float(partitions[-1]["last_value"]) if partitions else None,
+        read_s=read_s,
+        merge_s=merge_s,
+        write_s=write_s,
+        # partitions are disjoint calendar years in ascending order
+        changes=pd.concat(changes, ignore_index=True) if changes else _empty_changes(),
+        frame=pd.concat(tail, ignore_index=True) if tail else None,
     )
+
+
+def _to_utc_ts(value: Optional[DateLike]) -> Optional[pd.Timestamp]:
+    if value is None:
+        return None
+    ts = pd.Timestamp(value)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
@@ -0,0 +1,271 @@
+"""Vintage log of stored series values (storage.revisions).
+
+Layout:
+
+    data/revisions/{series_id}/checkpoint.parquet
+        every vintage folded so far, sorted by (valid_from, seq)
+    data/revisions/{series_id}/{min_valid_from_ns}-{seq}.parquet
+        vintages recorded since the last checkpoint
+    columns date, value, valid_from, realtime_end, seq
+
+The series file only keeps the latest value per date (merge_series overwrites).
+This log keeps every value a date has had: a vintage is recorded when a date is
+first stored or its value changes (MergeResult.changes), stamped with valid_from,
+the start of the vintage (the observation's FRED realtime_start when the provider
+reports it, else the run time), and realtime_end as FRED reports it (null for other
+providers). Unchanged re-deliveries (e.g. the incremental revision overlap) add
+nothing, so the log is about the size of the series plus its revisions.
+
+Every record_vintages call writes one small delta file and never reads or
+rewrites the existing ones, so appending costs the size of the change. Once
+MAX_VINTAGE_FILES deltas pile up they are folded into the checkpoint, which keeps
+the file count per series bounded. Rows are ordered by valid_from, then by the
+write sequence number seq, so vintages sort correctly even when stamps are not
+monotonic in write order (e.g. a run-time fallback followed by an earlier FRED
+realtime_start).
+
+An as-of query reads the checkpoint with a valid_from filter (its row groups are
+sorted by valid_from, so later ones are skipped) plus the deltas whose smallest
+valid_from (in the file name) is on or before the cut-off, and keeps the last
+value per date in vintage order.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+REVISIONS_DIRNAME = "revisions"
+CHECKPOINT_NAME = "checkpoint.parquet"
+ROW_GROUP_ROWS = 65_536
+# fold the deltas into the checkpoint once this many pile up
+MAX_VINTAGE_FILES = 32
+
+AsOf = Union[date, datetime, pd.Timestamp, str]
+
+_SCHEMA = pa.schema(
+    [
+        ("date", pa.timestamp("ns", tz="UTC")),
+        ("value", pa.float64()),
+        ("valid_from", pa.timestamp("ns", tz="UTC")),
+        ("realtime_end", pa.date32()),
+        ("seq", pa.int64()),
+    ]
+)
+
+# writers and compaction replace/delete files of a series; serialize access per
+# series directory so readers never open a delta that compaction just removed
+_PATH_LOCKS: Dict[Path, threading.Lock] = {}
+_PATH_LOCKS_GUARD = threading.Lock()
+
+# last write sequence number handed out in this process (see _next_seq)
+_SEQ_LOCK = threading.Lock()
+_LAST_SEQ = 0
+
+
+def revisions_path(data_dir: Path, series_id: str) -> Path:
+    return data_dir / REVISIONS_DIRNAME / series_id
+
+
+def record_vintages(
+    path: Path,
+    changes: pd.DataFrame,
+    *,
+    valid_from: Union[date, datetime, pd.Timestamp],
+    realtime_end: Optional[date] = None,
+) -> int:
+    """Write changed (date, value) points as one vintage file.
+
+    A valid_from column in changes stamps rows individually (e.g. per-observation
+    FRED realtime_start); rows without one, or NaT, start at valid_from.
+    Returns the number of rows written (0 writes nothing).
+    """
+
+    if changes.empty:
+        return 0
+
+    default = _to_utc(valid_from).value
+    if "valid_from" in changes.columns:
+        stamps = pd.to_datetime(changes["valid_from"], utc=True).dt.as_unit("ns")
+        starts = np.where(stamps.isna(), default, stamps.to_numpy(dtype="datetime64[ns]").view(np.int64))
+    else:
+        starts = np.full(len(changes), default, dtype=np.int64)
+    if starts.min() < 0:
+        raise ValueError(f"valid_from before 1970 is not supported: {pd.Timestamp(starts.min(), tz='UTC')}")
+
+    seq = _next_seq()
+    table = pa.table(
+        {
+            "date": pa.array(pd.to_datetime(changes["date"], utc=True).dt.as_unit("ns"), type=_SCHEMA.field("date").type),
+            "value": pa.array(changes["value"].to_numpy(dtype=np.float64), type=pa.float64()),
+            "valid_from": pa.array(starts, type=pa.int64()).cast(_SCHEMA.field("valid_from").type),
+            "realtime_end": pa.array([realtime_end] * len(changes), type=pa.date32()),
+            "seq": pa.array(np.full(len(changes), seq, dtype=np.int64), type=pa.int64()),
+        },
+        schema=_SCHEMA,
+    )
+
+    with _path_lock(path):
+        path.mkdir(parents=True, exist_ok=True)
+        _write_table(table, path / f"{int(starts.min()):020d}-{seq:020d}.parquet")
+        if len(_vintage_files(path)) >= MAX_VINTAGE_FILES:
+            _compact(path)
+    return len(changes)
+
+
+def compact_vintages(path: Path) -> int:
+    """Fold the delta files of a series log into its checkpoint; returns the files folded."""
+
+    if not path.is_dir():
+        return 0
+    with _path_lock(path):
+        return _compact(path)
+
+
+def load_vintages(path: Path) -> Optional[pd.DataFrame]:
+    """The whole log (date, value, valid_from, realtime_end) in vintage order, or None if missing.
+
+    Vintage order is by valid_from; vintages with the same valid_from keep write order.
+    """
+
+    if not path.is_dir():
+        return None
+    with _path_lock(path):
+        table = _read_log(path)
+    table = table.take(_vintage_order(table))
+    return table.drop_columns(["seq"]).to_pandas()
+
+
+def load_series_as_of(path: Path, as_of: AsOf) -> Optional[pd.DataFrame]:
+    """The series (date, value) as it was known at as_of, or None without a log.
+
+    A datetime.date covers the whole day; datetimes/timestamps/strings are an
+    inclusive cut-off. Dates first recorded after as_of are absent.
+    """
+
+    if not path.is_dir():
+        return None
+
+    bound = _to_utc(as_of)
+    if isinstance(as_of, date) and not isinstance(as_of, datetime):
+        limit = (bound + pd.Timedelta(days=1)).value - 1
+    else:
+        limit = bound.value
+    with _path_lock(path):
+        table = _read_log(path, limit_ns=limit)
+
+    dates = table["date"].to_numpy().astype("datetime64[ns]").view(np.int64)
+    values = table["value"].to_numpy()
+
+    # sort by date, then vintage order; the last row per date is current at as_of
+    order = np.lexsort(
+        (
+            table["seq"].to_numpy(),
+            table["valid_from"].to_numpy().astype("datetime64[ns]").view(np.int64),
+            dates,
+        )
+    )
+    dates, values = dates[order], values[order]
+    last_of_run = np.append(dates[1:] != dates[:-1], True) if len(dates) else np.zeros(0, dtype=bool)
+
+    return pd.DataFrame(
+        {
+            "date": pd.DatetimeIndex(dates[last_of_run].view("datetime64[ns]")).tz_localize("UTC"),
+            "value": values[last_of_run],
+        }
+    )
+
+
+def _compact(path: Path) -> int:
+    # caller holds the path lock
+    deltas = _vintage_files(path)
+    if not deltas:
+        return 0
+    table = _read_log(path)
+    _write_table(table.take(_vintage_order(table)), path / CHECKPOINT_NAME)
+    for delta in deltas:
+        delta.unlink()
+    return len(deltas)
+
+
+def _read_log(path: Path, *, limit_ns: Optional[int] = None) -> pa.Table:
+    """Checkpoint plus deltas (caller holds the path lock); rows up to limit_ns only."""
+
+    tables: List[pa.Table] = []
+    checkpoint = path / CHECKPOINT_NAME
+    if checkpoint.exists():
+        tables.append(pq.read_table(checkpoint, filters=_until(limit_ns)).cast(_SCHEMA))
+    for delta in _vintage_files(path):
+        if limit_ns is not None and _valid_from_ns(delta) > limit_ns:
+            continue
+        table = pq.read_table(delta).cast(_SCHEMA)
+        if limit_ns is not None:
+            table = table.filter(_until(limit_ns))
+        tables.append(table)
+    return pa.concat_tables(tables) if tables else _SCHEMA.empty_table()
+
+
+def _until(limit_ns: Optional[int]) -> Optional[pc.Expression]:
+    if limit_ns is None:
+        return None
+    return pc.field("valid_from") <= pa.scalar(limit_ns, type=pa.int64()).cast(_SCHEMA.field("valid_from").type)
+
+
+def _vintage_order(table: pa.Table) -> np.ndarray:
+    valid_from = table["valid_from"].to_numpy().astype("datetime64[ns]").view(np.int64)
+    return np.lexsort((table["seq"].to_numpy(), valid_from))
+
+
+def _vintage_files(path: Path) -> List[Path]:
+    # deltas only (zero-padded (valid_from, seq) names); the checkpoint is read separately
+    return sorted(path.glob("[0-9]*.parquet"))
+
+
+def _valid_from_ns(vintage: Path) -> int:
+    return int(vintage.name.split("-", 1)[0])
+
+
+def _write_table(table: pa.Table, target: Path) -> None:
+    tmp = target.with_name(f".{target.name}.tmp")
+    pq.write_table(table, tmp, row_group_size=ROW_GROUP_ROWS)
+    os.replace(tmp, target)
+
+
+def _path_lock(path: Path) -> threading.Lock:
+    with _PATH_LOCKS_GUARD:
+        return _PATH_LOCKS.setdefault(path, threading.Lock())
+
+
+def _next_seq() -> int:
+    # wall clock in ns, strictly increasing within the process
+    global _LAST_SEQ
+    with _SEQ_LOCK:
+        _LAST_SEQ = max(time.time_ns(), _LAST_SEQ + 1)
+        return _LAST_SEQ
+
+
+def _to_utc(value: AsOf) -> pd.Timestamp:
+    ts = pd.Timestamp(value)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+
+__all__ = [
+    "CHECKPOINT_NAME",
+    "MAX_VINTAGE_FILES",
+    "REVISIONS_DIRNAME",
+    "compact_vintages",
+    "load_series_as_of",
+    "load_vintages",
+    "record_vintages",
+    "revisions_path",
+]
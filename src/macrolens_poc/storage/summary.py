@@ -0,0 +1,184 @@
+"""Per-series summaries for the report path.
+
+A summary holds what the report needs from a stored series: the last observation
+and the anchor values for the delta windows (the most recent value on or before
+last_date - window days). It is written to the series_summary table of the metadata
+database at ingest time, together with the storage fingerprint (mtime/size, or the
+content token for the dataset layout) it was computed from. generate_series_report uses it instead of loading Parquet as long
+as the fingerprint still matches.
+
+At ingest time the summary is built from the frame store_series just wrote
+(summarize_store_result), so the series is not read back after the write.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from macrolens_poc.storage.metadata_db import SeriesSummaryRecord
+from macrolens_poc.storage.parquet_store import (
+    SeriesLocation,
+    StoreResult,
+    load_series,
+    series_fingerprint,
+)
+
+DAY_NS = 86_400 * 1_000_000_000
+
+
+def anchor_indices(dates_ns: np.ndarray, windows: Iterable[int]) -> np.ndarray:
+    """Index of the anchor row per window (-1 if there is no history that far back).
+
+    dates_ns must be sorted ascending (int64 nanoseconds).
+    """
+
+    cutoffs = dates_ns[-1] - np.asarray(list(windows), dtype=np.int64) * DAY_NS
+    return np.searchsorted(dates_ns, cutoffs, side="right") - 1
+
+
+def build_series_summary(
+    *,
+    series_id: str,
+    path: SeriesLocation,
+    fingerprint: str,
+    dates_ns: np.ndarray,
+    values: np.ndarray,
+    windows: Iterable[int],
+) -> Optional[SeriesSummaryRecord]:
+    """Summarize sorted date (int64 ns, UTC) / value arrays; None if they are empty."""
+
+    if len(dates_ns) == 0:
+        return None
+
+    window_list = sorted(set(windows))
+    idx = anchor_indices(dates_ns, window_list)
+
+    return SeriesSummaryRecord(
+        series_id=series_id,
+        stored_path=Path(str(path)),
+        fingerprint=fingerprint,
+        last_date=pd.Timestamp(dates_ns[-1], unit="ns", tz="UTC"),
+        last_value=float(values[-1]),
+        anchors={w: (float(values[i]) if i >= 0 else None) for w, i in zip(window_list, idx)},
+        updated_at=datetime.now(timezone.utc),
+    )
+
+
+def summarize_stored_series(
+    *,
+    series_id: str,
+    path: SeriesLocation,
+    windows: Iterable[int],
+    first_date: Optional[pd.Timestamp] = None,
+    last_date: Optional[pd.Timestamp] = None,
+) -> Optional[SeriesSummaryRecord]:
+    """Build the summary of a stored series, reading only the tail needed for the anchors.
+
+    last_date (e.g. from StoreResult) bounds the read to the largest window; without
+    it, or if the anchor of the largest window lies before that tail (first_date
+    earlier, or unknown), the full series is loaded. The fingerprint is taken before
+    reading, so a concurrent write makes the summary stale rather than wrong.
+    """
+
+    window_list = sorted(set(windows))
+    fingerprint = series_fingerprint(path)
+    if fingerprint is None:
+        return None
+
+    frame: Optional[pd.DataFrame] = None
+    if last_date is not None and window_list:
+        tail_start = last_date - pd.Timedelta(days=window_list[-1])
+        frame = load_series(path, start=tail_start)
+        if (
+            frame is not None
+            and (frame.empty or frame["date"].iloc[0] > tail_start)
+            and (first_date is None or first_date < tail_start)
+        ):
+            frame = None  # the largest window's anchor lies before the tail
+
+    if frame is None:
+        frame = load_series(path)
+    if frame is None:
+        return None
+
+    return _summarize_frame(series_id=series_id, path=path, fingerprint=fingerprint, frame=frame, windows=window_list)
+
+
+def summarize_store_result(
+    *, series_id: str, result: StoreResult, windows: Iterable[int]
+) -> Optional[SeriesSummaryRecord]:
+    """Build the summary of a series right after store_series, from result.frame.
+
+    Nothing is read back when the frame reaches the anchor of the largest window (or
+    is the whole series). Only a partitioned series whose untouched earlier
+    partitions hold that anchor falls back to the tail read of
+    summarize_stored_series. The fingerprint is taken after the write; a series is
+    only written by one worker at a time, so it belongs to the written frame.
+    """
+
+    window_list = sorted(set(windows))
+    frame = result.frame
+    if result.rows_after == 0:
+        return None
+    if frame is None or frame.empty or not _frame_covers(frame, result, window_list):
+        return summarize_stored_series(
+            series_id=series_id,
+            path=result.path,
+            windows=window_list,
+            first_date=result.first_date,
+            last_date=result.last_date,
+        )
+
+    fingerprint = series_fingerprint(result.path)
+    if fingerprint is None:
+        return None
+    return _summarize_frame(
+        series_id=series_id, path=result.path, fingerprint=fingerprint, frame=frame, windows=window_list
+    )
+
+
+def _frame_covers(frame: pd.DataFrame, result: StoreResult, windows: List[int]) -> bool:
+    first = frame["date"].iloc[0]
+    if first == result.first_date or not windows:
+        return True
+    # the anchor is the last row on or before the cut-off of the largest window
+    return result.last_date is not None and first <= result.last_date - pd.Timedelta(days=windows[-1])
+
+
+def _summarize_frame(
+    *, series_id: str, path: SeriesLocation, fingerprint: str, frame: pd.DataFrame, windows: List[int]
+) -> Optional[SeriesSummaryRecord]:
+    if frame.empty:
+        return None
+
+    return build_series_summary(
+        series_id=series_id,
+        path=path,
+        fingerprint=fingerprint,
+        dates_ns=frame["date"].dt.tz_convert(None).to_numpy(dtype="datetime64[ns]").view(np.int64),
+        values=frame["value"].to_numpy(dtype="float64"),
+        windows=windows,
+    )
+
+
+def summary_is_current(summary: SeriesSummaryRecord, *, path: SeriesLocation, windows: Iterable[int]) -> bool:
+    """True if summary was computed from the current stored state and covers windows."""
+
+    if summary.stored_path != Path(str(path)) or any(w not in summary.anchors for w in windows):
+        return False
+    return summary.fingerprint == series_fingerprint(path)
+
+
+__all__ = [
+    "DAY_NS",
+    "anchor_indices",
+    "build_series_summary",
+    "summarize_store_result",
+    "summarize_stored_series",
+    "summary_is_current",
+]
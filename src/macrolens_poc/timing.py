@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Dict, Iterator, List, Mapping
+
+# stage names used in series_run["timings"] (seconds, monotonic clock)
+STAGES = ("fetch", "retry_sleep", "rate_limit_wait", "normalize", "read", "merge", "write", "summary", "metadata_enqueue")
+
+_NOOP = nullcontext()
+
+
+class StageTimer:
+    """Accumulate wall time per stage with time.perf_counter.
+
+    A disabled timer hands out one shared no-op context manager and records
+    nothing, so instrumented code costs a method call per stage.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._seconds: Dict[str, float] = {}
+
+    def stage(self, name: str) -> ContextManager[None]:
+        if not self.enabled:
+            return _NOOP
+        return self._measure(name)
+
+    def add(self, name: str, seconds: float) -> None:
+        if self.enabled:
+            self._seconds[name] = self._seconds.get(name, 0.0) + seconds
+
+    def as_dict(self) -> Dict[str, float]:
+        return {name: round(seconds, 6) for name, seconds in self._seconds.items()}
+
+    @contextmanager
+    def _measure(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+
+class StageStats:
+    """Collect per-series stage timings and summarize them per provider."""
+
+    def __init__(self) -> None:
+        self._samples: Dict[str, Dict[str, List[float]]] = {}
+
+    def add(self, provider: str, timings: Mapping[str, float]) -> None:
+        by_stage = self._samples.setdefault(provider, {})
+        for stage, seconds in timings.items():
+            by_stage.setdefault(stage, []).append(seconds)
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """{provider: {stage: {count, p50, p95, max, total}}} in seconds."""
+
+        out: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for provider, by_stage in sorted(self._samples.items()):
+            out[provider] = {}
+            for stage, samples in by_stage.items():
+                ordered = sorted(samples)
+                out[provider][stage] = {
+                    "count": len(ordered),
+                    "p50": round(_percentile(ordered, 50), 6),
+                    "p95": round(_percentile(ordered, 95), 6),
+                    "max": round(ordered[-1], 6),
+                    "total": round(sum(ordered), 6),
+                }
+        return out
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    # nearest-rank percentile on a sorted, non-empty list
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+__all__ = ["STAGES", "StageStats", "StageTimer"]
@@ -0,0 +1,85 @@
+"""Shared test fixtures: fake HTTP responses and sessions, series frames and specs."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict, List, Optional, Type
+
+import pandas as pd
+import pytest
+import requests
+
+from macrolens_poc.sources.matrix import SeriesSpec
+
+FRED_URL = "https://api.stlouisfed.org/fred/series/observations?series_id=X&api_key=secret"
+
+
+class FakeSession:
+    """Stand-in for requests.Session: get() returns the queued responses in order.
+
+    calls records the keyword arguments of every get() (params, headers, timeout).
+    """
+
+    def __init__(self, responses: List[requests.Response]) -> None:
+        self.responses = responses
+        self.calls: List[Dict[str, Any]] = []
+
+    @property
+    def offsets(self) -> List[int]:
+        """The FRED paging offset of every request, in order."""
+
+        return [call["params"]["offset"] for call in self.calls]
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        self.calls.append(kwargs)
+        return self.responses.pop(0)
+
+
+def _response(
+    status_code: int, body: Any = b"", headers: Optional[Dict[str, str]] = None, url: str = FRED_URL
+) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status_code
+    # bytes are sent as they are; anything else as its JSON encoding
+    resp._content = body if isinstance(body, bytes) else json.dumps(body).encode()
+    resp.headers.update(headers or {})
+    resp.url = url
+    return resp
+
+
+def _frame(dates: List[str], values: List[float]) -> pd.DataFrame:
+    return pd.DataFrame({"date": pd.to_datetime(dates, utc=True), "value": values})
+
+
+def _spec(series_id: str, provider: str = "fred", **fields: Any) -> SeriesSpec:
+    return SeriesSpec(
+        id=series_id, provider=provider, provider_symbol=series_id.upper(), category="test", **fields
+    )
+
+
+@pytest.fixture
+def make_response() -> Callable[..., requests.Response]:
+    """make_response(status_code, body=b"", headers=None, url=FRED_URL); body may be bytes or JSON data."""
+
+    return _response
+
+
+@pytest.fixture
+def fake_session() -> Type[FakeSession]:
+    """The FakeSession class: fake_session([responses]) (subclass it to inject delays)."""
+
+    return FakeSession
+
+
+@pytest.fixture
+def make_frame() -> Callable[[List[str], List[float]], pd.DataFrame]:
+    """make_frame(dates, values): a canonical (date, value) frame with UTC dates."""
+
+    return _frame
+
+
+@pytest.fixture
+def make_spec() -> Callable[..., SeriesSpec]:
+    """make_spec(series_id, provider="fred", **fields): an enabled test SeriesSpec."""
+
+    return _spec
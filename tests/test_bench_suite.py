@@ -0,0 +1,44 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+
+import bench_suite  # noqa: E402
+from synthetic import max_rows, raw_provider_frame, synthetic_series  # noqa: E402
+
+
+def test_synthetic_series_cadences_and_limits() -> None:
+    monthly = synthetic_series(24, "monthly")
+    assert len(monthly) == 24
+    assert monthly["date"].is_monotonic_increasing
+    assert str(monthly["date"].dtype) == "datetime64[ns, UTC]"
+    assert (synthetic_series(24, "monthly")["value"] == monthly["value"]).all()
+
+    with pytest.raises(ValueError):
+        synthetic_series(max_rows("monthly") + 1, "monthly")
+    with pytest.raises(ValueError):
+        synthetic_series(10, "weekly")
+
+    raw = raw_provider_frame(1000, "daily")
+    assert len(raw) == 1010
+    assert raw["date"].duplicated().sum() > 0
+    assert not raw["date"].is_monotonic_increasing
+
+
+def test_run_suite_results_and_compare() -> None:
+    results = bench_suite.run_suite(
+        sizes=[200, 10**9], cadences=["bday"], layouts=["file"], benches=list(bench_suite.BENCHES), repeat=1
+    )
+    keys = {r["key"] for r in results}
+    assert "store_series/file/append/bday/200" in keys
+    assert "compute_deltas/pct/bday/200" in keys
+    assert "parse_fred/observations/bday/200" in keys
+    # cadence cannot hold 1e9 rows: skipped, not failed
+    assert all(r["rows"] == 200 for r in results)
+
+    baseline = {"results": results}
+    slower = {"results": [dict(r, best_s=r["best_s"] * 2 + 0.01) for r in results]}
+    assert not any(row["regressed"] for row in bench_suite.compare_results(baseline, baseline))
+    assert all(row["regressed"] for row in bench_suite.compare_results(baseline, slower))
@@ -0,0 +1,69 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+
+from bench_startup import parse_importtime, run_startup, write_config  # noqa: E402
+from typer.testing import CliRunner  # noqa: E402
+
+from macrolens_poc.cli import app  # noqa: E402
+
+
+def test_parse_importtime_sums_top_level_imports() -> None:
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:        10 |         10 |   _io",
+            "import time:        40 |         50 | encodings",
+            "import time:         5 |          5 |     numpy.core",
+            "import time:        20 |         25 |   numpy",
+            "import time:       100 |        125 | macrolens_poc.cli",
+            "warning: unrelated",
+        ]
+    )
+    total, top_level, modules = parse_importtime(stderr)
+    assert total == 175
+    assert top_level == {"encodings": 50, "macrolens_poc.cli": 125}
+    assert modules == {"_io", "encodings", "numpy.core", "numpy", "macrolens_poc.cli"}
+
+
+def test_light_commands_do_not_import_adapters_or_data_stack() -> None:
+    # budgets depend on the machine; the forbidden-module lists do not
+    results = run_startup(["help", "status", "run-one-unknown"], repeat=1, budget_scale=100.0)
+    for r in results:
+        assert r["forbidden_imported"] == [], r["command"]
+        assert r["ok"], r
+
+
+def test_metadata_db_is_only_created_by_commands_that_use_it(tmp_path: Path) -> None:
+    config = write_config(tmp_path)
+    db_path = tmp_path / "data" / "metadata.sqlite"
+    runner = CliRunner()
+
+    assert runner.invoke(app, ["--config", str(config), "--help"]).exit_code == 0
+    assert runner.invoke(app, ["--config", str(config), "run-one", "--id", "__no_such_series__"]).exit_code == 2
+    assert not db_path.exists()
+
+    assert runner.invoke(app, ["--config", str(config), "status"]).exit_code == 0
+    assert db_path.exists()
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+def test_log_tail_is_written_when_a_command_exits_early(tmp_path: Path, buffered: bool) -> None:
+    config = write_config(tmp_path)
+    if buffered:
+        with config.open("a", encoding="utf-8") as f:
+            f.write("logging:\n  buffered: true\n  flush_interval_s: 60.0\n")
+
+    result = CliRunner().invoke(app, ["--config", str(config), "run-one", "--id", "__no_such_series__"])
+
+    assert result.exit_code == 2
+    events = [
+        json.loads(line)["event"]
+        for log in (tmp_path / "logs").glob("run-*.jsonl")
+        for line in log.read_text(encoding="utf-8").splitlines()
+    ]
+    assert events[-1] == "series_not_found"
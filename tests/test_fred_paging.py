@@ -0,0 +1,108 @@
+import sys
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+
+from standins import FaultConfig, start_standins  # noqa: E402
+
+from macrolens_poc.config import FredConfig, PathsConfig, Settings  # noqa: E402
+from macrolens_poc.pipeline.run_series import _fetch_fred_normalized, run_series  # noqa: E402
+from macrolens_poc.sources.fred import fetch_fred_series_observations, iter_fred_series_observations  # noqa: E402
+from macrolens_poc.sources.matrix import SeriesSpec  # noqa: E402
+from macrolens_poc.storage.parquet_store import load_series  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def standin_url():
+    server = start_standins(points=300, faults=FaultConfig(latency_ms=0, jitter_ms=0))
+    yield f"{server.base_url}/fred"
+    server.shutdown()
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_pages_cover_the_whole_range(standin_url: str, prefetch: bool) -> None:
+    pages = list(
+        iter_fred_series_observations(
+            page_size=70, prefetch=prefetch, series_id="PAGED", api_key="k", base_url=standin_url, max_attempts=1
+        )
+    )
+    whole = fetch_fred_series_observations(series_id="PAGED", api_key="k", base_url=standin_url, max_attempts=1)
+
+    assert [len(p.data) for p in pages] == [70, 70, 70, 70, 20]
+    assert all(p.count == 300 for p in pages)
+    stitched = pd.concat([p.data for p in pages], ignore_index=True)
+    pd.testing.assert_frame_equal(stitched, whole.data.reset_index(drop=True))
+
+
+def test_failed_page_ends_the_stream(make_response, fake_session) -> None:
+    first = {"count": 4, "observations": [{"date": "2024-01-01", "value": "1"}, {"date": "2024-01-02", "value": "2"}]}
+    session = fake_session([make_response(200, first), make_response(500)])
+
+    pages = list(
+        iter_fred_series_observations(page_size=2, series_id="X", api_key="k", session=session, max_attempts=1)
+    )
+
+    assert [p.status for p in pages] == ["ok", "error"]
+    assert session.offsets == [0, 2]
+
+
+def test_run_series_streams_pages_into_storage(standin_url: str, tmp_path: Path) -> None:
+    settings = Settings(
+        fred_api_key="k",
+        paths=PathsConfig(data_dir=tmp_path, metadata_db=tmp_path / "meta.sqlite"),
+        fred=FredConfig(base_url=standin_url, page_size=64),
+    )
+    spec = SeriesSpec(id="paged", provider="fred", provider_symbol="PAGED", category="test")
+
+    result = run_series(settings=settings, spec=spec, observation_start=date(1900, 1, 1))
+
+    assert result.status == "ok"
+    assert result.new_points == 300
+    stored = load_series(result.stored_path)
+    assert len(stored) == 300
+    assert stored["date"].is_monotonic_increasing and stored["date"].is_unique
+    assert result.timings["normalize"] > 0
+
+
+def test_closing_early_does_not_wait_for_the_prefetch(make_response, fake_session) -> None:
+    started, release = threading.Event(), threading.Event()
+    first = {"observations": [{"date": "2024-01-01", "value": "1"}, {"date": "2024-01-02", "value": "2"}]}
+
+    class _SlowSecondPage(fake_session):
+        def get(self, url, params=None, **kwargs):
+            if params["offset"] > 0:
+                started.set()
+                release.wait(10)
+            return super().get(url, params=params, **kwargs)
+
+    session = _SlowSecondPage([make_response(200, first), make_response(200, {"observations": []})])
+    pages = iter_fred_series_observations(page_size=2, series_id="X", api_key="k", session=session, max_attempts=1)
+    try:
+        assert next(pages).status == "ok"
+        assert started.wait(5)  # the next page is in flight
+        start = time.perf_counter()
+        pages.close()
+        assert time.perf_counter() - start < 5
+    finally:
+        release.set()
+
+
+def test_empty_trailing_page_keeps_the_status_of_pages_with_data(make_response, fake_session) -> None:
+    full = {"observations": [{"date": "2024-01-01", "value": "1"}, {"date": "2024-01-02", "value": "2"}]}
+    session = fake_session([make_response(200, full), make_response(200, {"observations": []})])
+    settings = Settings(fred_api_key="k", fred=FredConfig(page_size=2, prefetch=False))
+    spec = SeriesSpec(id="x", provider="fred", provider_symbol="X", category="test")
+
+    fetched, _ = _fetch_fred_normalized(
+        settings=settings, spec=spec, observation_start=date(2024, 1, 1), session=session, cache=None, limiter=None
+    )
+
+    assert session.offsets == [0, 2]
+    assert fetched.status == "ok"
+    assert fetched.data["value"].tolist() == [1.0, 2.0]
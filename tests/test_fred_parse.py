@@ -0,0 +1,70 @@
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+
+from bench_fred_parse import legacy_parse_observations, response  # noqa: E402
+from synthetic import fred_payload  # noqa: E402
+
+from macrolens_poc.sources.fred import _parse_observations  # noqa: E402
+
+MALFORMED = {
+    "observations": [
+        {"date": "2020-01-03", "value": "-943305.0469559873"},  # needs correctly rounded float()
+        {"date": "2020-01-02", "value": "."},
+        {"date": "2020-01-01"},
+        {"date": "", "value": "1"},
+        [1, 2],
+        "x",
+        {"value": "2"},
+        {"date": "2020-01-04", "value": 3},
+        {"date": "2020-01-05", "value": "abc"},
+        {"date": "2020-01-06", "value": None},
+        {"date": "2020-01-07", "value": " 1e3 "},
+    ]
+}
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        fred_payload(3000, "bday"),
+        fred_payload(120, "monthly"),
+        json.dumps(MALFORMED).encode(),
+        json.dumps({"observations": [{"date": "2020-01-01T00:00:00", "value": "1"}]}).encode(),
+        json.dumps({"observations": [[1]]}).encode(),
+        json.dumps({"observations": []}).encode(),
+    ],
+    ids=["bday", "monthly", "malformed", "datetime", "no_rows", "empty"],
+)
+def test_columnar_parse_matches_legacy_loop(body: bytes) -> None:
+    expected = legacy_parse_observations(response(body))
+    got = _parse_observations(response(body))
+
+    assert (got.status, got.message) == (expected.status, expected.message)
+    pd.testing.assert_frame_equal(got.data, expected.data, check_exact=True)
+
+
+def test_columnar_parse_values_and_order() -> None:
+    result = _parse_observations(response(json.dumps(MALFORMED).encode()))
+    df = result.data
+
+    assert result.status == "ok"
+    assert df["date"].is_monotonic_increasing
+    assert str(df["date"].dt.tz) == "UTC"
+    values = dict(zip(df["date"].dt.strftime("%Y-%m-%d"), df["value"]))
+    assert np.isnan(values["2020-01-02"]) and np.isnan(values["2020-01-05"]) and np.isnan(values["2020-01-06"])
+    assert values["2020-01-03"] == float("-943305.0469559873")
+    assert values["2020-01-07"] == 1000.0
+    assert len(df) == 7
+
+
+def test_invalid_json_is_an_error() -> None:
+    result = _parse_observations(response(b"{not json"))
+    assert result.status == "error"
+    assert result.message.startswith("FRED invalid JSON")
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+from macrolens_poc.sources.fred import fetch_fred_series_observations
+from macrolens_poc.sources.http_cache import ResponseCache
+
+PAYLOAD = {"observations": [{"date": "2024-01-01", "value": "1.5"}, {"date": "2024-01-02", "value": "."}]}
+
+
+def _fetch(session, cache: ResponseCache, ttl: float):
+    return fetch_fred_series_observations(
+        series_id="X", api_key="secret", session=session, cache=cache, cache_ttl_s=ttl, max_attempts=1
+    )
+
+
+def test_fred_cache_hit_within_ttl_skips_request(tmp_path: Path, make_response, fake_session) -> None:
+    cache = ResponseCache(tmp_path)
+    session = fake_session([make_response(200, PAYLOAD)])
+
+    first = _fetch(session, cache, ttl=3600)
+    second = _fetch(session, cache, ttl=3600)
+
+    assert len(session.calls) == 1
+    assert second.status == "ok"
+    assert second.data.equals(first.data)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.stores) == (1, 1, 1)
+    # the api key stays out of the cache
+    assert not any(b"secret" in p.read_bytes() for p in tmp_path.rglob("*.*"))
+
+
+def test_fred_cache_revalidates_stale_entry_with_etag(tmp_path: Path, make_response, fake_session) -> None:
+    cache = ResponseCache(tmp_path)
+    session = fake_session(
+        [
+            make_response(200, PAYLOAD, {"ETag": '"v1"'}),
+            make_response(304),
+            make_response(200, {"observations": []}),
+        ]
+    )
+
+    _fetch(session, cache, ttl=0)
+    revalidated = _fetch(session, cache, ttl=0)
+    assert session.calls[1]["headers"] == {"If-None-Match": '"v1"'}
+    assert revalidated.status == "ok"
+    assert len(revalidated.data) == 2
+    assert cache.stats().revalidated == 1
+
+    # no cache: plain request without conditional headers
+    fresh = fetch_fred_series_observations(series_id="X", api_key="secret", session=session, max_attempts=1)
+    assert "headers" not in session.calls[2]
+    assert fresh.status == "warn"
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path: Path, make_response) -> None:
+    cache = ResponseCache(tmp_path, max_bytes=25)
+    keys = [ResponseCache.key("fred", "u", {"series_id": s, "api_key": "k"}) for s in "abc"]
+    assert keys[0] == ResponseCache.key("fred", "u", {"api_key": "other", "series_id": "a"})
+
+    cache.put(keys[0], make_response(200, b"x" * 10))
+    cache.put(keys[1], make_response(200, b"y" * 10))
+    assert cache.get(keys[0]) is not None  # a is now most recently used
+    cache.put(keys[2], make_response(200, b"z" * 10))
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]).body == b"x" * 10
+    assert cache.stats().evictions == 1
+
+    # the index is rebuilt from disk by a new instance
+    reopened = ResponseCache(tmp_path, max_bytes=25)
+    assert (reopened.stats().entries, reopened.stats().bytes) == (2, 20)
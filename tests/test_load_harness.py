@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+
+from load_harness import write_config, write_sources_matrix  # noqa: E402
+from standins import FaultConfig, start_standins  # noqa: E402
+
+from macrolens_poc.config import load_settings  # noqa: E402
+from macrolens_poc.sources.fred import fetch_fred_series_observations  # noqa: E402
+from macrolens_poc.sources.matrix import load_sources_matrix  # noqa: E402
+
+
+def test_fred_adapter_against_standin() -> None:
+    server = start_standins(points=300, faults=FaultConfig(latency_ms=0, jitter_ms=0))
+    try:
+        result = fetch_fred_series_observations(
+            series_id="SYN1", api_key="k", base_url=f"{server.base_url}/fred", max_attempts=1
+        )
+        assert result.status == "ok"
+        assert len(result.data) == 300
+        assert result.data["date"].is_monotonic_increasing
+        assert result.data["value"].isna().sum() == 4  # every 97th value is "."
+    finally:
+        server.shutdown()
+
+    failing = start_standins(points=10, faults=FaultConfig(latency_ms=0, jitter_ms=0, error_rate=1.0))
+    try:
+        result = fetch_fred_series_observations(
+            series_id="SYN1", api_key="k", base_url=f"{failing.base_url}/fred", max_attempts=1
+        )
+        assert result.status == "error"
+        assert "status=500" in result.message
+        assert failing.state.stats["fred 500"] == 1
+    finally:
+        failing.shutdown()
+
+
+def test_harness_writes_loadable_matrix_and_config(tmp_path: Path) -> None:
+    write_sources_matrix(tmp_path / "sources_matrix.yaml", fred_series=3, yahoo_series=2)
+    write_config(tmp_path / "config.yaml", workdir=tmp_path, base_url="http://127.0.0.1:1", workers=4, layout="file")
+
+    matrix = load_sources_matrix(tmp_path / "sources_matrix.yaml").matrix
+    assert [s.provider for s in matrix.series].count("yfinance") == 2
+    settings = load_settings(tmp_path / "config.yaml")
+    assert settings.fred.base_url == "http://127.0.0.1:1/fred"
+    assert settings.ingest.workers == 4
+    assert yaml.safe_load((tmp_path / "config.yaml").read_text())["fred_api_key"]
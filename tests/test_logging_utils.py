@@ -0,0 +1,70 @@
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from macrolens_poc.logging_utils import JsonlLogger, json_encoder, resolve_encoder
+
+
+def _read_events(path: Path) -> list:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_buffered_logger_concurrent_writes_are_line_atomic(tmp_path: Path) -> None:
+    path = tmp_path / "run.jsonl"
+    logger = JsonlLogger(path, buffered=True, flush_interval_s=60.0, buffer_bytes=4096)
+
+    def worker(k: int) -> None:
+        for i in range(500):
+            logger.log({"event": "e", "worker": k, "i": i, "pad": "x" * (i % 50)})
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    logger.close()
+
+    events = _read_events(path)
+    assert len(events) == 2000
+    for k in range(4):
+        assert [e["i"] for e in events if e["worker"] == k] == list(range(500))
+
+
+def test_buffered_logger_flushes_on_flush_and_interval(tmp_path: Path) -> None:
+    path = tmp_path / "run.jsonl"
+    with JsonlLogger(path, buffered=True, flush_interval_s=60.0, buffer_bytes=1 << 20) as logger:
+        logger.log({"event": "a"})
+        logger.flush()
+        assert _read_events(path) == [{"event": "a"}]
+
+    with JsonlLogger(path, buffered=True, flush_interval_s=0.05, buffer_bytes=1 << 20) as logger:
+        logger.log({"event": "b"})
+        for _ in range(100):
+            if len(path.read_text(encoding="utf-8").splitlines()) == 2:
+                break
+            threading.Event().wait(0.02)
+        assert _read_events(path)[-1] == {"event": "b"}
+
+    logger.log({"event": "after_close"})  # falls back to a direct write
+    assert _read_events(path)[-1] == {"event": "after_close"}
+
+
+def test_custom_encoder_and_encoder_errors(tmp_path: Path) -> None:
+    path = tmp_path / "run.jsonl"
+    logger = JsonlLogger(path, buffered=True, encoder=lambda e: json_encoder({**e, "tag": 1}))
+    logger.log({"event": "a"})
+    logger.log({"event": "bad", "obj": object()})
+    with pytest.raises(RuntimeError):
+        logger.close()
+
+    assert _read_events(path) == [{"event": "a", "tag": 1}]
+
+
+def test_resolve_encoder_orjson_matches_json_content() -> None:
+    pytest.importorskip("orjson")
+    event = {"b": 1, "a": "ä", "deltas": {1: 0.5, 5: None}}
+
+    assert json.loads(resolve_encoder("orjson")(event)) == json.loads(json_encoder(event))
+    assert resolve_encoder("json") is json_encoder
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
+import pytest
+import yaml
+
 from macrolens_poc.sources.matrix import load_sources_matrix
 
 
@@ -14,3 +18,77 @@ def test_load_sources_matrix_ok() -> None:
     assert len(result.matrix.series) >= 10
     assert any(s.provider == "fred" for s in result.matrix.series)
     assert any(s.provider == "yfinance" for s in result.matrix.series)
+
+
+def _write_matrix(path: Path, series: list) -> None:
+    path.write_text(yaml.safe_dump({"version": 1, "series": series}, sort_keys=False), encoding="utf-8")
+
+
+_SERIES = [
+    {"id": "a", "provider": "fred", "provider_symbol": "A", "category": "rates"},
+    {"id": "b", "provider": "yfinance", "provider_symbol": "B", "category": "equity", "enabled": False},
+    {"id": "c", "provider": "fred", "provider_symbol": "C", "category": "equity", "units": "%"},
+]
+
+
+def test_matrix_index_groups_in_matrix_order(tmp_path: Path) -> None:
+    path = tmp_path / "matrix.yaml"
+    _write_matrix(path, _SERIES)
+
+    index = load_sources_matrix(path).index
+
+    assert index.by_id["c"].units == "%"
+    assert [s.id for s in index.by_provider["fred"]] == ["a", "c"]
+    assert [s.id for s in index.by_category["equity"]] == ["b", "c"]
+    assert [s.id for s in index.enabled] == ["a", "c"]
+    assert [s.id for s in index.disabled] == ["b"]
+
+
+def test_matrix_cache_hits_until_content_changes(tmp_path: Path) -> None:
+    path = tmp_path / "matrix.yaml"
+    cache_dir = tmp_path / "cache"
+    _write_matrix(path, _SERIES)
+
+    first = load_sources_matrix(path, cache_dir=cache_dir)
+    assert not first.cache_hit
+    second = load_sources_matrix(path, cache_dir=cache_dir)
+    assert second.cache_hit
+    assert second.matrix == first.matrix
+
+    # touched but unchanged: recognized by hash
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    assert load_sources_matrix(path, cache_dir=cache_dir).cache_hit
+
+    _write_matrix(path, _SERIES[:2])
+    changed = load_sources_matrix(path, cache_dir=cache_dir)
+    assert not changed.cache_hit
+    assert list(changed.index.by_id) == ["a", "b"]
+    assert load_sources_matrix(path, cache_dir=cache_dir).cache_hit
+
+
+def test_matrix_cache_rebuilds_unusable_entries(tmp_path: Path) -> None:
+    path = tmp_path / "matrix.yaml"
+    cache_dir = tmp_path / "cache"
+    _write_matrix(path, _SERIES)
+    load_sources_matrix(path, cache_dir=cache_dir)
+
+    (entry,) = cache_dir.iterdir()
+    entry.write_bytes(entry.read_bytes().replace(b'"provider":"fred"', b'"provider":"nope"', 1))
+    rebuilt = load_sources_matrix(path, cache_dir=cache_dir)
+    assert not rebuilt.cache_hit
+    assert rebuilt.index.by_id["a"].provider == "fred"
+
+    entry.write_bytes(b"garbage")
+    assert not load_sources_matrix(path, cache_dir=cache_dir).cache_hit
+    assert load_sources_matrix(path, cache_dir=cache_dir).cache_hit
+
+
+def test_invalid_matrix_is_not_cached(tmp_path: Path) -> None:
+    path = tmp_path / "matrix.yaml"
+    cache_dir = tmp_path / "cache"
+    _write_matrix(path, [_SERIES[0], _SERIES[0]])
+
+    with pytest.raises(ValueError, match="Duplicate series ids"):
+        load_sources_matrix(path, cache_dir=cache_dir)
+    assert not cache_dir.exists()
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
-from macrolens_poc.storage.parquet_store import merge_series
+from macrolens_poc.storage.parquet_store import merge_series, merge_series_detailed, store_series
 
 
 def test_merge_series_counts_new_points_and_dedupes() -> None:
@@ -27,3 +28,61 @@ def test_merge_series_counts_new_points_and_dedupes() -> None:
     # 2024-01-02 overwritten by incoming (keep last)
     v_0102 = merged.loc[merged["date"].dt.strftime("%Y-%m-%d") == "2024-01-02", "value"].iloc[0]
     assert v_0102 == 20.0
+
+
+def test_store_series_returns_summary(tmp_path) -> None:
+    path = tmp_path / "series" / "s.parquet"
+    store_series(
+        path,
+        pd.DataFrame({"date": pd.to_datetime(["2024-01-02", "2024-01-01"], utc=True), "value": [2.0, 1.0]}),
+    )
+
+    result = store_series(
+        path,
+        pd.DataFrame({"date": pd.to_datetime(["2024-01-03"], utc=True), "value": [3.0]}),
+    )
+
+    assert result.rows_before == 2
+    assert result.rows_after == 3
+    assert result.new_points == 1
+    assert result.first_date == pd.Timestamp("2024-01-01", tz="UTC")
+    assert result.last_date == pd.Timestamp("2024-01-03", tz="UTC")
+    assert result.last_value == 3.0
+
+
+def test_merge_series_detailed_reports_revisions() -> None:
+    existing = pd.DataFrame(
+        {"date": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"], utc=True), "value": [1.0, 2.0, float("nan")]}
+    )
+    incoming = pd.DataFrame(
+        {"date": pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-05"], utc=True), "value": [2.5, float("nan"), 5.0]}
+    )
+
+    result = merge_series_detailed(existing, incoming)
+
+    assert result.new_points == 1
+    assert result.revised_points == 1
+    assert result.revisions["date"].dt.strftime("%Y-%m-%d").tolist() == ["2024-01-02"]
+    assert result.revisions["previous_value"].tolist() == [2.0]
+    assert result.frame["value"].tolist()[:2] == [1.0, 2.5]
+    assert result.frame["date"].is_monotonic_increasing
+
+
+def test_merge_series_matches_concat_reference() -> None:
+    rng = np.random.default_rng(7)
+    for _ in range(20):
+        ex_days = np.sort(rng.choice(400, size=rng.integers(1, 200), replace=False))
+        inc_days = rng.choice(450, size=rng.integers(1, 100), replace=True)
+        base = pd.Timestamp("2020-01-01", tz="UTC")
+        existing = pd.DataFrame({"date": base + pd.to_timedelta(ex_days, unit="D"), "value": rng.normal(size=len(ex_days))})
+        incoming = pd.DataFrame({"date": base + pd.to_timedelta(inc_days, unit="D"), "value": rng.normal(size=len(inc_days))})
+
+        combined = pd.concat([existing, incoming], ignore_index=True)
+        expected = combined.drop_duplicates(subset=["date"], keep="last").sort_values("date")
+        expected_new = len(set(inc_days) - set(ex_days))
+
+        merged, new_points = merge_series(existing, incoming)
+
+        assert new_points == expected_new
+        assert merged["date"].tolist() == expected["date"].tolist()
+        assert merged["value"].tolist() == expected["value"].tolist()
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import sqlite3
+from contextlib import closing
 from dataclasses import replace
 from datetime import date, datetime, timezone
 from pathlib import Path
 
 from macrolens_poc.storage.metadata_db import (
+    _SERIES_STATUS_SQL,
+    SCHEMA_VERSION,
+    MetadataSession,
     SeriesMetadataRecord,
+    SeriesRunRecord,
     get_series_metadata,
     init_db,
     list_series_metadata,
+    query_series_status,
     upsert_series_metadata,
 )
 
@@ -72,3 +79,109 @@ def test_upsert_overwrites_existing(tmp_path: Path) -> None:
     assert fetched.message == "provider timeout"
     assert fetched.last_ok_at is None
     assert fetched.new_points == 0
+
+
+def test_session_batches_upserts_and_flushes_on_close(tmp_path: Path) -> None:
+    db_path = tmp_path / "meta.sqlite"
+    init_db(db_path)
+    base = _sample_record(tmp_path)
+
+    with MetadataSession(db_path, batch_size=3) as session:
+        for i in range(4):
+            session.upsert_series_metadata(replace(base, series_id=f"s{i}"))
+        # the first batch of 3 is committed, the 4th is still buffered
+        assert len(list_series_metadata(db_path)) == 3
+
+    assert [r.series_id for r in list_series_metadata(db_path)] == ["s0", "s1", "s2", "s3"]
+
+
+def test_wal_reader_not_blocked_by_open_write_transaction(tmp_path: Path) -> None:
+    db_path = tmp_path / "meta.sqlite"
+    init_db(db_path)
+    upsert_series_metadata(db_path, _sample_record(tmp_path))
+
+    writer = sqlite3.connect(db_path)
+    try:
+        writer.execute("BEGIN IMMEDIATE")
+        writer.execute("UPDATE series_metadata SET status = 'error'")
+
+        reader = sqlite3.connect(db_path, timeout=0)
+        try:
+            assert reader.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert reader.execute("SELECT status FROM series_metadata").fetchone()[0] == "ok"
+        finally:
+            reader.close()
+    finally:
+        writer.rollback()
+        writer.close()
+
+
+def test_init_db_records_schema_version(tmp_path: Path) -> None:
+    db_path = tmp_path / "meta.sqlite"
+    init_db(db_path)
+    init_db(db_path)
+
+    with closing(sqlite3.connect(db_path)) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_init_db_upgrades_older_schema_with_new_data_index(tmp_path: Path) -> None:
+    db_path = tmp_path / "meta.sqlite"
+    init_db(db_path)
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.execute("DROP INDEX idx_series_runs_new_data")
+        conn.execute("PRAGMA user_version = 2")
+        conn.commit()
+
+    init_db(db_path)
+
+    with closing(sqlite3.connect(db_path)) as conn:
+        plan = " ".join(
+            row[-1]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN " + _SERIES_STATUS_SQL, {"stale_before": None, "min_failure_streak": 0}
+            )
+        )
+    assert "idx_series_runs_new_data" in plan
+
+
+def _run(series_id: str, status: str, day: int, new_points: int) -> SeriesRunRecord:
+    return SeriesRunRecord(
+        run_id=f"run-{day}",
+        series_id=series_id,
+        provider="fred",
+        status=status,
+        message=status,
+        run_at=datetime(2024, 1, day, 6, 0, tzinfo=timezone.utc),
+        new_points=new_points,
+        revised_points=0,
+        last_observation_date=None,
+    )
+
+
+def test_query_series_status_from_run_history(tmp_path: Path) -> None:
+    db_path = tmp_path / "meta.sqlite"
+    init_db(db_path)
+    base = _sample_record(tmp_path)
+
+    with MetadataSession(db_path) as session:
+        session.upsert_series_metadata(replace(base, series_id="healthy"))
+        session.upsert_series_metadata(replace(base, series_id="failing", status="error"))
+        for day in range(1, 6):
+            session.append_series_run(_run("healthy", "ok", day, new_points=1))
+        session.append_series_run(_run("failing", "ok", 1, new_points=5))
+        session.append_series_run(_run("failing", "ok", 2, new_points=0))
+        for day in range(3, 6):
+            session.append_series_run(_run("failing", "error", day, new_points=0))
+
+    rows = {r.series_id: r for r in query_series_status(db_path)}
+    assert rows["healthy"].failure_streak == 0
+    assert rows["healthy"].last_new_data_at == datetime(2024, 1, 5, 6, 0, tzinfo=timezone.utc)
+    assert rows["failing"].failure_streak == 3
+    assert rows["failing"].last_ok_at == datetime(2024, 1, 2, 6, 0, tzinfo=timezone.utc)
+    assert rows["failing"].last_new_data_at == datetime(2024, 1, 1, 6, 0, tzinfo=timezone.utc)
+
+    stale = query_series_status(db_path, stale_before=datetime(2024, 1, 3, tzinfo=timezone.utc))
+    assert [r.series_id for r in stale] == ["failing"]
+    assert [r.series_id for r in query_series_status(db_path, min_failure_streak=1)] == ["failing"]
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+
+from macrolens_poc.pipeline.executor import plan_units, run_specs
+from macrolens_poc.pipeline.run_series import SeriesRunResult
+from macrolens_poc.sources.matrix import SeriesSpec
+
+
+def _ok(spec: SeriesSpec) -> SeriesRunResult:
+    return SeriesRunResult(
+        series_id=spec.id,
+        provider=spec.provider,
+        status="ok",
+        message="ok",
+        stored_path=None,
+        new_points=1,
+        last_observation_date=None,
+        run_at=datetime.now(timezone.utc),
+    )
+
+
+def test_run_specs_serial_keeps_order(make_spec) -> None:
+    specs = [make_spec(f"s{i}", "fred") for i in range(5)]
+
+    out = list(run_specs(specs, runner=_ok, workers=1, provider_concurrency={}))
+
+    assert [spec.id for spec, _ in out] == [s.id for s in specs]
+
+
+def test_run_specs_respects_provider_caps(make_spec) -> None:
+    specs = [make_spec(f"f{i}", "fred") for i in range(8)] + [make_spec(f"y{i}", "yfinance") for i in range(8)]
+    lock = threading.Lock()
+    active = {"fred": 0, "yfinance": 0}
+    peak = {"fred": 0, "yfinance": 0}
+
+    def _runner(spec: SeriesSpec) -> SeriesRunResult:
+        with lock:
+            active[spec.provider] += 1
+            peak[spec.provider] = max(peak[spec.provider], active[spec.provider])
+        time.sleep(0.01)
+        with lock:
+            active[spec.provider] -= 1
+        return _ok(spec)
+
+    out = list(run_specs(specs, runner=_runner, workers=6, provider_concurrency={"fred": 2, "yfinance": 3}))
+
+    assert sorted(spec.id for spec, _ in out) == sorted(s.id for s in specs)
+    assert peak["fred"] <= 2
+    assert peak["yfinance"] <= 3
+
+
+def test_run_specs_turns_exceptions_into_error_results(make_spec) -> None:
+    def _boom(spec: SeriesSpec) -> SeriesRunResult:
+        raise RuntimeError("kaputt")
+
+    out = list(run_specs([make_spec("a", "fred")], runner=_boom, workers=2, provider_concurrency={}))
+
+    assert out[0][1].status == "error"
+    assert "kaputt" in out[0][1].message
+
+
+def test_plan_units_chunks_batchable_provider(make_spec) -> None:
+    specs = [make_spec("y1", "yfinance"), make_spec("f1", "fred"), make_spec("y2", "yfinance"), make_spec("y3", "yfinance")]
+
+    units = plan_units(specs, batch_sizes={"yfinance": 2})
+
+    assert [[s.id for s in u] for u in units] == [["y1", "y2"], ["f1"], ["y3"]]
+
+
+def test_yahoo_batches_fetch_daily_bars(tmp_path, monkeypatch) -> None:
+    from macrolens_poc.config import PathsConfig, Settings
+    from macrolens_poc.pipeline import executor
+    from macrolens_poc.sources.yahoo import FetchResult
+
+    calls = []
+
+    def _fake_batch(*, symbols, interval="1d", **kwargs):
+        calls.append((sorted(symbols), interval))
+        return {s: FetchResult(status="warn", message="yfinance returned 0 rows", data=None) for s in symbols}
+
+    monkeypatch.setattr(executor, "fetch_yahoo_history_batch", _fake_batch)
+    settings = Settings(paths=PathsConfig(data_dir=tmp_path, metadata_db=tmp_path / "meta.sqlite"))
+    specs = [
+        SeriesSpec(id="d1", provider="yfinance", provider_symbol="D1", category="t"),
+        SeriesSpec(id="w1", provider="yfinance", provider_symbol="W1", category="t", frequency_target="weekly"),
+        SeriesSpec(id="d2", provider="yfinance", provider_symbol="D2", category="t"),
+        SeriesSpec(id="w2", provider="yfinance", provider_symbol="W2", category="t", frequency_target="weekly"),
+    ]
+
+    out = list(executor.iter_series_runs(settings=settings, specs=specs, workers=1))
+
+    assert len(out) == 4
+    # frequency_target does not change the bars merged into the daily series files
+    assert calls == [(["D1", "D2", "W1", "W2"], "1d")]
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from macrolens_poc.config import PathsConfig, Settings
+from macrolens_poc.pipeline.windows import plan_observation_starts, resolve_observation_start
+from macrolens_poc.sources.matrix import SeriesSpec
+from macrolens_poc.storage.metadata_db import SeriesMetadataRecord, init_db, upsert_series_metadata
+from macrolens_poc.storage.parquet_store import series_path, store_series, stored_last_date
+
+
+def test_resolve_observation_start_incremental_and_full() -> None:
+    today = date(2024, 6, 30)
+
+    assert resolve_observation_start(
+        today=today, lookback_days=3650, last_observation_date=date(2024, 6, 28), revision_overlap_days=10
+    ) == date(2024, 6, 18)
+    assert resolve_observation_start(
+        today=today,
+        lookback_days=30,
+        last_observation_date=date(2024, 6, 28),
+        revision_overlap_days=10,
+        full_backfill=True,
+    ) == date(2024, 5, 31)
+    # never reach further back than the lookback window
+    assert resolve_observation_start(
+        today=today, lookback_days=30, last_observation_date=date(2020, 1, 1), revision_overlap_days=10
+    ) == date(2024, 5, 31)
+    assert resolve_observation_start(
+        today=today, lookback_days=30, last_observation_date=None, revision_overlap_days=10
+    ) == date(2024, 5, 31)
+
+
+def test_plan_observation_starts_uses_metadata_then_parquet(tmp_path: Path) -> None:
+    settings = Settings(paths=PathsConfig(data_dir=tmp_path, metadata_db=tmp_path / "meta.sqlite"))
+    settings.ingest.revision_overlap_days = 5
+    init_db(settings.paths.metadata_db)
+
+    from_db = SeriesSpec(id="from_db", provider="fred", provider_symbol="A", category="test")
+    from_file = SeriesSpec(id="from_file", provider="fred", provider_symbol="B", category="test")
+    unknown = SeriesSpec(id="unknown", provider="fred", provider_symbol="C", category="test")
+    # metadata row survived, but the Parquet file was deleted
+    gone = SeriesSpec(id="gone", provider="fred", provider_symbol="D", category="test")
+
+    for series_id, symbol in (("from_db", "A"), ("gone", "D")):
+        upsert_series_metadata(
+            settings.paths.metadata_db,
+            SeriesMetadataRecord(
+                series_id=series_id,
+                provider="fred",
+                provider_symbol=symbol,
+                category="test",
+                frequency_target="daily",
+                timezone="UTC",
+                units="",
+                transform="none",
+                notes="",
+                enabled=True,
+                status="ok",
+                message="ok",
+                last_run_at=datetime(2024, 6, 29, tzinfo=timezone.utc),
+                last_ok_at=datetime(2024, 6, 29, tzinfo=timezone.utc),
+                last_observation_date=date(2024, 6, 20),
+                stored_path=None,
+                new_points=1,
+            ),
+        )
+    (tmp_path / "series").mkdir()
+    for series_id in ("from_db", "from_file"):
+        pd.DataFrame(
+            {"date": pd.to_datetime(["2024-06-01", "2024-06-10"], utc=True), "value": [1.0, 2.0]}
+        ).to_parquet(tmp_path / "series" / f"{series_id}.parquet", index=False)
+
+    starts = plan_observation_starts(
+        settings=settings,
+        specs=[from_db, from_file, unknown, gone],
+        lookback_days=365,
+        today=date(2024, 6, 30),
+    )
+
+    assert starts == {
+        "from_db": date(2024, 6, 15),
+        "from_file": date(2024, 6, 5),
+        "unknown": date(2023, 7, 1),
+        "gone": date(2023, 7, 1),
+    }
+
+
+@pytest.mark.parametrize("layout", ["file", "partitioned", "dataset"])
+def test_stored_last_date_reads_metadata_not_rows(tmp_path: Path, layout: str, make_frame) -> None:
+    path = series_path(tmp_path, "s", layout)
+    assert stored_last_date(path) is None
+
+    store_series(path, make_frame(["2023-12-30", "2024-01-02"], [1.0, 2.0]))
+    if layout == "dataset":
+        # another series in the same dataset must not leak into the answer
+        store_series(series_path(tmp_path, "other", layout), make_frame(["2025-01-01"], [9.0]))
+
+    assert stored_last_date(path) == date(2024, 1, 2)
@@ -0,0 +1,97 @@
+from datetime import datetime, timezone
+from typing import List
+
+import pytest
+
+from macrolens_poc.config import Settings
+from macrolens_poc.sources.fred import fetch_fred_series_observations
+from macrolens_poc.sources.rate_limit import TokenBucket, build_rate_limiters, parse_retry_after
+
+
+class _Clock:
+    """Fake monotonic clock; sleep advances it."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _bucket(rate: float, burst: float) -> "tuple[TokenBucket, _Clock]":
+    clock = _Clock()
+    return TokenBucket(rate, burst, clock=clock, sleep=clock.sleep), clock
+
+
+def test_token_bucket_allows_burst_then_paces() -> None:
+    bucket, clock = _bucket(rate=2.0, burst=2)
+    assert [bucket.acquire() for _ in range(4)] == [0.0, 0.0, 0.5, 0.5]
+    assert clock.now == 1.0
+
+
+def test_token_bucket_refills_while_idle() -> None:
+    bucket, clock = _bucket(rate=1.0, burst=3)
+    for _ in range(3):
+        bucket.acquire()
+    clock.now += 10.0
+    # refill is capped at burst
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == 1.0
+
+
+def test_token_bucket_batch_acquire_goes_into_debt() -> None:
+    bucket, _ = _bucket(rate=2.0, burst=2)
+    # a 10-symbol batch needs more than burst: waits for the deficit
+    assert bucket.acquire(10) == 4.0
+    assert bucket.acquire() == 0.5
+
+
+def test_token_bucket_block_for_pauses_and_empties_bucket() -> None:
+    bucket, clock = _bucket(rate=1.0, burst=5)
+    bucket.block_for(3.0)
+    assert bucket.acquire() == 4.0  # 3s block, then one token at 1/s
+    assert clock.now == 4.0
+
+
+def test_parse_retry_after_seconds_and_http_date() -> None:
+    now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Mon, 01 Jan 2024 12:00:30 GMT", now=now) == 30.0
+    assert parse_retry_after("Mon, 01 Jan 2024 11:00:00 GMT", now=now) == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+
+def test_default_rate_limits_cover_fred() -> None:
+    limiters = build_rate_limiters(Settings().ingest.rate_limits)
+    assert set(limiters) == {"fred"}
+    assert limiters["fred"].rate_per_s == 2.0
+
+
+def test_fred_429_retry_after_blocks_shared_limiter(make_response, fake_session) -> None:
+    payload = {"observations": [{"date": "2024-01-01", "value": "1.5"}]}
+    session = fake_session([make_response(429, headers={"Retry-After": "2"}), make_response(200, payload)])
+    bucket, clock = _bucket(rate=100.0, burst=10)
+
+    result = fetch_fred_series_observations(
+        series_id="X", api_key="secret", session=session, limiter=bucket, max_attempts=2
+    )
+
+    assert result.status == "ok"
+    assert result.retry_sleep_s == 0.0
+    # Retry-After, then one token from an empty bucket
+    assert result.rate_limit_wait_s == clock.now == pytest.approx(2.01)
+    # another worker sharing the bucket is paced from there
+    assert bucket.acquire() == pytest.approx(0.01)
+
+
+def test_fred_429_exhausted_reports_rate_limited(make_response, fake_session) -> None:
+    session = fake_session([make_response(429)])
+    result = fetch_fred_series_observations(series_id="X", api_key="secret", session=session, max_attempts=1)
+    assert result.status == "error"
+    assert result.message.startswith("code=rate_limited")
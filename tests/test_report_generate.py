@@ -1,6 +1,9 @@
 from datetime import datetime, timezone
 from pathlib import Path
 
+import math
+
+import numpy as np
 import pandas as pd
 
 from macrolens_poc.logging_utils import RunContext
@@ -8,6 +11,7 @@ from macrolens_poc.report.generate import (
     DEFAULT_DELTA_WINDOWS,
     compute_deltas,
     generate_series_report,
+    iter_series_reports,
     write_report_artifacts,
 )
 from macrolens_poc.sources.matrix import SeriesSpec
@@ -27,6 +31,43 @@ def test_compute_deltas_calendar_days() -> None:
     assert deltas[3] == 3  # 5 - 2
 
 
+def test_compute_deltas_matches_mask_reference_unsorted() -> None:
+    rng = np.random.default_rng(3)
+    dates = pd.date_range("2020-01-01", periods=400, freq="B", tz="UTC")
+    df = pd.DataFrame({"date": dates, "value": rng.normal(100, 5, len(dates))})
+    shuffled = df.sample(frac=1.0, random_state=1).reset_index(drop=True)
+    windows = [1, 5, 21, 63, 252, 5000]
+
+    deltas = compute_deltas(shuffled, windows=windows)
+
+    last_date, last_value = df["date"].iloc[-1], df["value"].iloc[-1]
+    for w in windows:
+        hist = df[df["date"] <= last_date - pd.Timedelta(days=w)]
+        expected = None if hist.empty else last_value - hist["value"].iloc[-1]
+        if expected is None:
+            assert deltas[w] is None
+        else:
+            assert deltas[w] == expected
+
+
+def test_compute_deltas_pct_and_log() -> None:
+    df = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=3, freq="D", tz="UTC"),
+            "value": [0.0, 50.0, 100.0],
+        }
+    )
+
+    pct = compute_deltas(df, windows=[1, 2, 7], kind="pct")
+    log = compute_deltas(df, windows=[1, 2], kind="log")
+
+    assert pct[1] == 100.0
+    assert math.isnan(pct[2])  # base value 0
+    assert pct[7] is None
+    assert log[1] == math.log(2.0)
+    assert math.isnan(log[2])
+
+
 def test_generate_series_report_missing(tmp_path: Path) -> None:
     spec = SeriesSpec(
         id="missing_series",
@@ -41,6 +82,30 @@ def test_generate_series_report_missing(tmp_path: Path) -> None:
     assert report.last_value is None
 
 
+def test_iter_series_reports_process_pool_keeps_order(tmp_path: Path) -> None:
+    (tmp_path / "series").mkdir()
+    specs = []
+    for i in range(6):
+        series_id = f"s{i}"
+        specs.append(SeriesSpec(id=series_id, provider="fred", provider_symbol="X", category="test"))
+        if i == 3:
+            continue  # one missing series
+        pd.DataFrame(
+            {
+                "date": pd.date_range("2024-01-01", periods=30, freq="D", tz="UTC"),
+                "value": np.arange(30, dtype="float64") * (i + 1),
+            }
+        ).to_parquet(tmp_path / "series" / f"{series_id}.parquet", index=False)
+
+    serial = list(iter_series_reports(specs=specs, data_dir=tmp_path, windows=[1, 5]))
+    pooled = list(iter_series_reports(specs=specs, data_dir=tmp_path, windows=[1, 5], jobs=2))
+
+    assert [r.series_id for r in pooled] == [s.id for s in specs]
+    assert pooled == serial
+    assert pooled[3].status == "missing"
+    assert pooled[2].deltas == {1: 3.0, 5: 15.0}
+
+
 def test_write_report_artifacts(tmp_path: Path) -> None:
     data_dir = tmp_path / "data"
     data_dir.mkdir()
@@ -78,3 +143,4 @@ def test_write_report_artifacts(tmp_path: Path) -> None:
     assert "Δ1d" in md_text and "Δ5d" in md_text
     assert "report-20240103.md" in str(artifacts["markdown"])
     assert "\"id\": " in json_text and "s1" in json_text
+    assert "\"delta_kind\": \"abs\"" in json_text
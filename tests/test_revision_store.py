@@ -0,0 +1,185 @@
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from macrolens_poc.config import PathsConfig, Settings, StorageConfig
+from macrolens_poc.pipeline.run_series import run_series
+from macrolens_poc.storage.parquet_store import merge_series_detailed
+from macrolens_poc.storage.revision_store import (
+    CHECKPOINT_NAME,
+    MAX_VINTAGE_FILES,
+    compact_vintages,
+    load_series_as_of,
+    load_vintages,
+    record_vintages,
+    revisions_path,
+)
+
+
+def test_merge_changes_are_new_and_revised_points_only(make_frame) -> None:
+    existing = make_frame(["2024-01-01", "2024-01-02", "2024-01-03"], [1.0, np.nan, 3.0])
+    incoming = make_frame(["2024-01-02", "2024-01-03", "2024-01-04"], [np.nan, 3.5, 4.0])
+
+    result = merge_series_detailed(existing, incoming)
+
+    assert result.changes["date"].dt.strftime("%Y-%m-%d").tolist() == ["2024-01-03", "2024-01-04"]
+    assert result.changes["value"].tolist() == [3.5, 4.0]
+
+    appended = merge_series_detailed(existing, make_frame(["2024-01-05"], [5.0]))
+    assert appended.changes["value"].tolist() == [5.0]
+    assert merge_series_detailed(existing, existing).changes.empty
+
+
+def test_as_of_rebuilds_each_vintage(tmp_path: Path, make_frame) -> None:
+    path = revisions_path(tmp_path, "s")
+    record_vintages(path, make_frame(["2024-01-01", "2024-01-02"], [1.0, 2.0]), valid_from=date(2024, 2, 1))
+    record_vintages(path, make_frame(["2024-01-02", "2024-02-01"], [2.5, 3.0]), valid_from=date(2024, 3, 1))
+    record_vintages(path, make_frame(["2024-01-01"], [0.5]), valid_from=datetime(2024, 4, 1, 12, tzinfo=timezone.utc))
+
+    assert len(load_vintages(path)) == 5
+    assert load_series_as_of(path, date(2024, 1, 31)).empty
+
+    first = load_series_as_of(path, date(2024, 2, 1))
+    assert first["value"].tolist() == [1.0, 2.0]
+
+    second = load_series_as_of(path, "2024-03-15")
+    assert second["value"].tolist() == [1.0, 2.5, 3.0]
+    assert second["date"].is_monotonic_increasing
+
+    # a date covers the whole day, a timestamp is an exact cut-off
+    assert load_series_as_of(path, date(2024, 4, 1))["value"].tolist() == [0.5, 2.5, 3.0]
+    assert load_series_as_of(path, pd.Timestamp("2024-04-01T11:00", tz="UTC"))["value"].tolist() == [1.0, 2.5, 3.0]
+
+    assert load_series_as_of(revisions_path(tmp_path, "missing"), date(2024, 1, 1)) is None
+
+
+def test_appends_write_new_files_and_order_by_valid_from(tmp_path: Path, make_frame) -> None:
+    path = revisions_path(tmp_path, "s")
+    record_vintages(path, make_frame(["2024-01-01", "2024-01-02"], [1.0, 2.0]), valid_from=date(2024, 2, 1))
+    first = {f.name: f.stat().st_mtime_ns for f in path.iterdir()}
+
+    # run-time fallback stamp, then a vintage FRED dates earlier
+    record_vintages(path, make_frame(["2024-01-02"], [2.9]), valid_from=datetime(2024, 3, 10, tzinfo=timezone.utc))
+    record_vintages(path, make_frame(["2024-01-02"], [2.5]), valid_from=date(2024, 3, 1), realtime_end=date(9999, 12, 31))
+
+    assert len(list(path.iterdir())) == 3
+    assert all(path.joinpath(name).stat().st_mtime_ns == mtime for name, mtime in first.items())
+
+    log = load_vintages(path)
+    assert log["value"].tolist() == [1.0, 2.0, 2.5, 2.9]
+    assert log["realtime_end"].tolist() == [None, None, date(9999, 12, 31), None]
+
+    assert load_series_as_of(path, date(2024, 3, 5))["value"].tolist() == [1.0, 2.5]
+    assert load_series_as_of(path, date(2024, 3, 15))["value"].tolist() == [1.0, 2.9]
+
+
+def _payload(realtime_start: str, values: List[str]) -> dict:
+    return {
+        "realtime_start": realtime_start,
+        "realtime_end": realtime_start,
+        "count": len(values),
+        "observations": [
+            {"date": f"2024-01-0{i + 1}", "value": v, "realtime_start": realtime_start} for i, v in enumerate(values)
+        ],
+    }
+
+
+def test_run_series_logs_fred_vintages(tmp_path: Path, make_response, fake_session, make_spec) -> None:
+    settings = Settings(
+        fred_api_key="k",
+        paths=PathsConfig(data_dir=tmp_path, metadata_db=tmp_path / "meta.sqlite"),
+        storage=StorageConfig(revisions=["fred"]),
+    )
+    spec = make_spec("gdp")
+    session = fake_session(
+        [
+            make_response(200, _payload("2024-02-01", ["1.0", "2.0", "3.0"])),
+            # one revision, one new point
+            make_response(200, _payload("2024-03-01", ["1.0", "2.2", "3.0", "4.0"])),
+        ]
+    )
+
+    for _ in range(2):
+        result = run_series(settings=settings, spec=spec, observation_start=date(2024, 1, 1), session=session)
+        assert result.status == "ok"
+
+    log = load_vintages(revisions_path(tmp_path, "gdp"))
+    assert len(log) == 5
+    assert sorted(log["valid_from"].dt.strftime("%Y-%m-%d").unique()) == ["2024-02-01", "2024-03-01"]
+    assert (log["realtime_end"] == log["valid_from"].dt.date).all()
+
+    before = load_series_as_of(revisions_path(tmp_path, "gdp"), date(2024, 2, 15))
+    assert before["value"].tolist() == [1.0, 2.0, 3.0]
+    now = load_series_as_of(revisions_path(tmp_path, "gdp"), date(2024, 3, 1))
+    assert now["value"].tolist() == [1.0, 2.2, 3.0, 4.0]
+
+
+def test_enabling_the_log_seeds_it_from_stored_history(
+    tmp_path: Path, make_response, fake_session, make_spec
+) -> None:
+    paths = PathsConfig(data_dir=tmp_path, metadata_db=tmp_path / "meta.sqlite")
+    spec = make_spec("cpi")
+    session = fake_session(
+        [
+            make_response(200, _payload("2024-02-01", ["1.0", "2.0"])),
+            make_response(200, _payload("2024-03-01", ["1.0", "2.0", "3.0"])),
+        ]
+    )
+
+    run_series(settings=Settings(fred_api_key="k", paths=paths), spec=spec, session=session)
+    assert load_vintages(revisions_path(tmp_path, "cpi")) is None
+
+    enabled = Settings(fred_api_key="k", paths=paths, storage=StorageConfig(revisions=["fred"]))
+    run_series(settings=enabled, spec=spec, session=session)
+
+    log = load_vintages(revisions_path(tmp_path, "cpi"))
+    assert log["value"].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_deltas_fold_into_a_checkpoint(tmp_path: Path, make_frame) -> None:
+    path = revisions_path(tmp_path, "s")
+    for i in range(MAX_VINTAGE_FILES + 3):
+        record_vintages(path, make_frame(["2024-01-01"], [float(i)]), valid_from=date(2024, 2, 1) + timedelta(days=i))
+    # a late write stamped earlier than everything in the checkpoint
+    record_vintages(path, make_frame(["2024-01-02"], [9.0]), valid_from=date(2024, 1, 15))
+
+    files = sorted(f.name for f in path.iterdir())
+    assert CHECKPOINT_NAME in files
+    assert len(files) == 5  # checkpoint + 4 deltas written after it
+
+    assert load_series_as_of(path, date(2024, 2, 10))["value"].tolist() == [9.0, 9.0]
+    assert load_series_as_of(path, date(2024, 1, 20))["value"].tolist() == [9.0]
+    assert load_series_as_of(path, date(2099, 1, 1))["value"].tolist() == [float(MAX_VINTAGE_FILES + 2), 9.0]
+
+    assert compact_vintages(path) == 4
+    assert [f.name for f in path.iterdir()] == [CHECKPOINT_NAME]
+    log = load_vintages(path)
+    assert len(log) == MAX_VINTAGE_FILES + 4
+    assert log["valid_from"].is_monotonic_increasing
+    assert load_series_as_of(path, date(2024, 2, 10))["value"].tolist() == [9.0, 9.0]
+
+
+def test_run_series_uses_per_observation_realtime_start(
+    tmp_path: Path, make_response, fake_session, make_spec
+) -> None:
+    settings = Settings(
+        fred_api_key="k",
+        paths=PathsConfig(data_dir=tmp_path, metadata_db=tmp_path / "meta.sqlite"),
+        storage=StorageConfig(revisions=["fred"]),
+    )
+    spec = make_spec("gdp")
+    body = _payload("2024-03-01", ["1.0", "2.0"])
+    # only the second value was revised on 2024-02-20; the first dates back further
+    body["observations"][0]["realtime_start"] = "2023-11-30"
+    body["observations"][1]["realtime_start"] = "2024-02-20"
+    session = fake_session([make_response(200, body)])
+
+    run_series(settings=settings, spec=spec, observation_start=date(2024, 1, 1), session=session)
+
+    log = load_vintages(revisions_path(tmp_path, "gdp"))
+    assert log["valid_from"].dt.strftime("%Y-%m-%d").tolist() == ["2023-11-30", "2024-02-20"]
+    as_of = load_series_as_of(revisions_path(tmp_path, "gdp"), date(2024, 1, 1))
+    assert as_of["value"].tolist() == [1.0]
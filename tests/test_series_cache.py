@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from macrolens_poc.storage.parquet_store import (
+    clear_series_cache,
+    configure_series_cache,
+    load_series,
+    series_cache_stats,
+    store_series,
+)
+from macrolens_poc.storage.series_cache import SeriesCache
+
+
+def _frame(n: int) -> pd.DataFrame:
+    return pd.DataFrame({"date": pd.date_range("2024-01-01", periods=n, tz="UTC"), "value": range(n)})
+
+
+def test_load_series_hits_cache_and_sees_external_writes(tmp_path: Path) -> None:
+    clear_series_cache()
+    path = tmp_path / "s.parquet"
+    _frame(3).to_parquet(path, index=False)
+
+    before = series_cache_stats()
+    load_series(path)
+    load_series(path)
+    after = series_cache_stats()
+
+    assert after.misses - before.misses == 1
+    assert after.hits - before.hits == 1
+
+    # rewrite outside the store layer: new size/mtime -> miss, fresh data
+    _frame(5).to_parquet(path, index=False)
+    os.utime(path, ns=(0, 1))
+    reloaded = load_series(path)
+    assert reloaded is not None and len(reloaded) == 5
+
+
+def test_store_series_refreshes_cache(tmp_path: Path) -> None:
+    clear_series_cache()
+    path = tmp_path / "s.parquet"
+    store_series(path, _frame(3))
+    hits = series_cache_stats().hits
+
+    loaded = load_series(path)
+
+    assert loaded is not None and len(loaded) == 3
+    assert series_cache_stats().hits == hits + 1
+
+
+def test_cache_byte_budget_evicts_lru() -> None:
+    frame = _frame(100)
+    size = int(frame.memory_usage(index=True).sum())
+    cache = SeriesCache(max_bytes=2 * size)
+
+    cache.put("a", (1,), frame)
+    cache.put("b", (1,), frame)
+    assert cache.get("a", (1,)) is not None  # a is now most recent
+    cache.put("c", (1,), frame)
+
+    assert cache.get("b", (1,)) is None
+    assert cache.get("a", (1,)) is not None
+    assert cache.stats().evictions == 1
+    assert cache.stats().bytes <= 2 * size
+
+
+def test_configure_series_cache_zero_disables(tmp_path: Path) -> None:
+    path = tmp_path / "s.parquet"
+    _frame(3).to_parquet(path, index=False)
+    try:
+        configure_series_cache(0)
+        load_series(path)
+        assert series_cache_stats().entries == 0
+    finally:
+        configure_series_cache(256 * 1024 * 1024)
@@ -0,0 +1,195 @@
+import math
+import time
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from macrolens_poc.cli import _record_series_metadata
+from macrolens_poc.pipeline import SeriesRunResult
+from macrolens_poc.report.generate import compute_deltas, generate_series_report
+from macrolens_poc.storage.metadata_db import MetadataSession, init_db, list_series_summaries, upsert_series_summaries
+from macrolens_poc.storage.parquet_store import series_path, store_series
+from macrolens_poc.storage import summary as summary_mod
+from macrolens_poc.storage.summary import summarize_store_result, summarize_stored_series
+
+
+def _frame(start: str, periods: int, freq: str = "D") -> pd.DataFrame:
+    dates = pd.date_range(start, periods=periods, freq=freq, tz="UTC")
+    return pd.DataFrame({"date": dates, "value": np.arange(periods, dtype="float64") + 1.0})
+
+
+def test_summarize_stored_series_tail_read_matches_full_history(tmp_path: Path) -> None:
+    path = series_path(tmp_path, "s1", "partitioned")
+    # monthly history with a gap: the 252d anchor lies before the read tail
+    df = pd.concat([_frame("2015-01-31", 60, freq="ME"), _frame("2021-06-01", 40)], ignore_index=True)
+    result = store_series(path, df)
+    windows = [1, 5, 21, 252, 5000]
+
+    summary = summarize_stored_series(
+        series_id="s1",
+        path=path,
+        windows=windows,
+        first_date=result.first_date,
+        last_date=result.last_date,
+    )
+
+    assert summary is not None
+    assert summary.last_date == df["date"].iloc[-1]
+    last_value = summary.last_value
+    expected = compute_deltas(df, windows=windows)
+    for w in windows:
+        anchor = summary.anchors[w]
+        assert (anchor is None) == (expected[w] is None)
+        if anchor is not None:
+            assert last_value - anchor == expected[w]
+
+
+@pytest.mark.parametrize("layout", ["file", "partitioned", "dataset"])
+def test_summarize_store_result_uses_written_frame(tmp_path: Path, monkeypatch, layout: str) -> None:
+    path = series_path(tmp_path, "s1", layout)
+    windows = [1, 5, 60]
+    store_series(path, _frame("2023-01-01", 500))
+    stored_calls = []
+    monkeypatch.setattr(summary_mod, "load_series", lambda *a, **k: stored_calls.append(a))
+
+    # incremental write inside the last partition: the written frame reaches every anchor
+    result = store_series(path, _frame("2024-05-14", 5))
+    summary = summarize_store_result(series_id="s1", result=result, windows=windows)
+    monkeypatch.undo()
+    expected = summarize_stored_series(
+        series_id="s1", path=path, windows=windows, first_date=result.first_date, last_date=result.last_date
+    )
+
+    assert summary is not None and expected is not None
+    assert stored_calls == []
+    assert summary.fingerprint == expected.fingerprint
+    assert (summary.last_date, summary.last_value, summary.anchors) == (
+        expected.last_date,
+        expected.last_value,
+        expected.anchors,
+    )
+
+
+def test_summarize_store_result_reads_untouched_partitions_for_anchor(tmp_path: Path) -> None:
+    path = series_path(tmp_path, "s1", "partitioned")
+    store_series(path, _frame("2023-01-01", 400))
+    result = store_series(path, _frame("2024-02-04", 3))
+    assert result.frame is not None and result.frame["date"].iloc[0].year == 2024
+
+    summary = summarize_store_result(series_id="s1", result=result, windows=[1, 252])
+    expected = summarize_stored_series(series_id="s1", path=path, windows=[1, 252])
+
+    # 252 days back from 2024-02-06 lies in the untouched 2023 partition
+    assert summary is not None and expected is not None
+    assert summary.anchors == expected.anchors
+    assert summary.anchors[252] is not None
+
+
+def test_report_uses_summary_until_series_changes(tmp_path: Path, make_spec) -> None:
+    db_path = tmp_path / "metadata.sqlite"
+    init_db(db_path)
+    path = series_path(tmp_path, "s1")
+    result = store_series(path, _frame("2024-01-01", 30))
+
+    summary = summarize_stored_series(
+        series_id="s1", path=path, windows=[1, 5], first_date=result.first_date, last_date=result.last_date
+    )
+    assert summary is not None
+    upsert_series_summaries(db_path, [summary])
+    stored = list_series_summaries(db_path)["s1"]
+
+    from_summary = generate_series_report(spec=make_spec("s1"), data_dir=tmp_path, windows=[1, 5], summary=stored)
+    from_parquet = generate_series_report(spec=make_spec("s1"), data_dir=tmp_path, windows=[1, 5])
+    assert from_summary.source == "summary"
+    assert from_parquet.source == "parquet"
+    assert from_summary == replace(from_parquet, source="summary")
+
+    # a window the summary does not cover falls back to Parquet
+    wider = generate_series_report(spec=make_spec("s1"), data_dir=tmp_path, windows=[1, 21], summary=stored)
+    assert wider.source == "parquet"
+
+    store_series(path, _frame("2024-01-31", 1).assign(value=100.0))
+    changed = generate_series_report(spec=make_spec("s1"), data_dir=tmp_path, windows=[1, 5], summary=stored)
+    assert changed.source == "parquet"
+    assert changed.last_value == 100.0
+    assert changed.summary is not None and changed.summary.fingerprint != stored.fingerprint
+
+
+def test_series_summary_roundtrip_keeps_nan_and_missing_anchors(tmp_path: Path) -> None:
+    db_path = tmp_path / "metadata.sqlite"
+    init_db(db_path)
+    path = series_path(tmp_path, "s1")
+    df = _frame("2024-01-01", 3)
+    df.loc[2, "value"] = np.nan
+    store_series(path, df)
+
+    summary = summarize_stored_series(series_id="s1", path=path, windows=[1, 10])
+    assert summary is not None
+    upsert_series_summaries(db_path, [summary])
+    stored = list_series_summaries(db_path)["s1"]
+
+    assert math.isnan(stored.last_value)
+    assert stored.anchors == {1: 2.0, 10: None}
+    assert list_series_summaries(tmp_path / "missing.sqlite") == {}
+
+
+def test_record_series_metadata_stores_the_run_summary(tmp_path: Path, make_spec) -> None:
+    db_path = tmp_path / "metadata.sqlite"
+    init_db(db_path)
+    path = series_path(tmp_path, "s1")
+    store_series(path, _frame("2024-01-01", 10))
+    summary = summarize_stored_series(series_id="s1", path=path, windows=[1])
+    result = SeriesRunResult(
+        series_id="s1",
+        provider="fred",
+        status="ok",
+        message="ok",
+        stored_path=path,
+        new_points=10,
+        last_observation_date=None,
+        run_at=datetime(2024, 1, 11, tzinfo=timezone.utc),
+        summary=summary,
+    )
+
+    with MetadataSession(db_path) as metadata:
+        _record_series_metadata(metadata, "run-1", make_spec("s1"), result)
+        assert metadata.write_s == 0.0  # only buffered so far
+
+    assert list_series_summaries(db_path)["s1"].fingerprint == summary.fingerprint
+    # the SQLite write happens on close and is timed by the session, not the enqueue
+    assert metadata.write_s > 0.0
+
+
+def test_record_series_metadata_excludes_batch_writes(tmp_path: Path, monkeypatch, make_spec) -> None:
+    db_path = tmp_path / "metadata.sqlite"
+    init_db(db_path)
+    result = SeriesRunResult(
+        series_id="s1",
+        provider="fred",
+        status="ok",
+        message="ok",
+        stored_path=None,
+        new_points=0,
+        last_observation_date=None,
+        run_at=datetime(2024, 1, 11, tzinfo=timezone.utc),
+    )
+
+    with MetadataSession(db_path, batch_size=1) as metadata:
+        flush = metadata.flush
+
+        def _slow_flush() -> None:
+            # each batch write takes at least 50ms
+            start = time.perf_counter()
+            time.sleep(0.05)
+            metadata.write_s += time.perf_counter() - start
+            flush()
+
+        monkeypatch.setattr(metadata, "flush", _slow_flush)
+        enqueue_s = _record_series_metadata(metadata, "run-1", make_spec("s1"), result)
+
+    assert metadata.write_s >= 0.1  # metadata row + run row, one batch each
+    assert 0.0 <= enqueue_s < 0.05
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from datetime import date
 
 import pandas as pd
@@ -17,6 +18,10 @@ class _DummyResponse:
     def json(self):  # type: ignore[override]
         return self._payload
 
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode("utf-8")
+
 
 def test_fetch_fred_retries_on_timeout(monkeypatch) -> None:
     payload = {"observations": [{"date": "2020-01-01", "value": "1.0"}]}
@@ -44,6 +49,7 @@ def test_fetch_fred_retries_on_timeout(monkeypatch) -> None:
     assert len(calls) == 2
     assert result.status == "ok"
     assert result.data is not None and not result.data.empty
+    assert result.retry_sleep_s == 1.0  # backoff_factor ** 0 after the first attempt
 
 
 def test_fetch_fred_timeout_exhausted(monkeypatch) -> None:
@@ -92,6 +98,7 @@ def test_fetch_yahoo_retries_download(monkeypatch) -> None:
     assert len(calls) == 2
     assert result.status == "ok"
     assert result.data is not None and not result.data.empty
+    assert result.retry_sleep_s == 1.0  # backoff_factor ** 0 after the first attempt
 
 
 def test_fetch_yahoo_timeout_exhausted(monkeypatch) -> None:
@@ -113,3 +120,83 @@ def test_fetch_yahoo_timeout_exhausted(monkeypatch) -> None:
 
     assert result.status == "error"
     assert "code=timeout" in result.message or "code=download_failed" in result.message
+
+
+def test_fetch_fred_uses_shared_session(monkeypatch) -> None:
+    payload = {"observations": [{"date": "2020-01-01", "value": "1.0"}]}
+
+    class _FakeSession:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def get(self, *_, **__):
+            self.calls += 1
+            return _DummyResponse(payload=payload)
+
+    def _module_get(*_, **__):
+        raise AssertionError("module-level requests.get must not be used when a session is passed")
+
+    monkeypatch.setattr(fred.requests, "get", _module_get)
+    session = _FakeSession()
+
+    for _ in range(2):
+        result = fred.fetch_fred_series_observations(series_id="SERIES", api_key="dummy", session=session)
+        assert result.status == "ok"
+
+    assert session.calls == 2
+
+
+def test_build_http_session_pool_and_headers() -> None:
+    from macrolens_poc.sources.http import build_http_session
+
+    session = build_http_session(pool_size=7)
+    adapter = session.get_adapter("https://api.stlouisfed.org")
+
+    assert adapter._pool_maxsize == 7
+    assert "gzip" in session.headers["Accept-Encoding"]
+    assert session.headers["Connection"] == "keep-alive"
+
+
+def test_fetch_yahoo_batch_splits_per_symbol(monkeypatch) -> None:
+    calls: list[list[str]] = []
+    idx = pd.date_range("2020-01-01", periods=3)
+
+    def _fake_download(tickers, **__):
+        calls.append(list(tickers))
+        columns = pd.MultiIndex.from_product([["Close", "Open"], tickers])
+        frame = pd.DataFrame(1.0, index=idx, columns=columns)
+        if "BAD" in tickers:
+            frame[("Close", "BAD")] = float("nan")
+            frame = frame.drop(columns=[("Close", "GONE"), ("Open", "GONE")])
+        return frame
+
+    monkeypatch.setattr(yahoo.yf, "download", _fake_download)
+
+    results = yahoo.fetch_yahoo_history_batch(
+        symbols=["AAPL", "MSFT", "BAD", "GONE", "AAPL"],
+        start=date(2020, 1, 1),
+        chunk_size=2,
+    )
+
+    assert calls == [["AAPL", "MSFT"], ["BAD", "GONE"]]
+    assert set(results) == {"AAPL", "MSFT", "BAD", "GONE"}
+    assert results["AAPL"].status == "ok"
+    assert list(results["AAPL"].data.columns) == ["date", "value"]
+    assert len(results["MSFT"].data) == 3
+    # per-symbol status comes from the frame: all-NaN is "no rows" like the single path
+    assert results["BAD"].status == "warn"
+    assert results["BAD"].data.empty
+    assert results["GONE"].status == "error"
+    assert results["GONE"].message.startswith("code=symbol_failed")
+
+
+def test_fetch_yahoo_batch_exhausted_marks_whole_chunk(monkeypatch) -> None:
+    def _always_timeout(*_, **__):
+        raise requests.Timeout("download timeout")
+
+    monkeypatch.setattr(yahoo.yf, "download", _always_timeout)
+    monkeypatch.setattr(yahoo.time, "sleep", lambda *_: None)
+
+    results = yahoo.fetch_yahoo_history_batch(symbols=["A", "B"], max_attempts=2, backoff_factor=0.0)
+
+    assert {r.status for r in results.values()} == {"error"}
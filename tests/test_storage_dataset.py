@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import threading
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+from macrolens_poc.storage.dataset_store import bucket_path, compact_dataset, scan_dataset
+from macrolens_poc.storage.parquet_store import (
+    DatasetKey,
+    load_series,
+    migrate_series,
+    series_exists,
+    series_fingerprint,
+    series_path,
+    store_series,
+)
+
+
+def test_dataset_roundtrip_keeps_series_apart(tmp_path: Path, make_frame) -> None:
+    a = series_path(tmp_path, "a", "dataset")
+    b = series_path(tmp_path, "b", "dataset")
+
+    store_series(a, make_frame(["2024-01-01", "2024-01-02"], [1.0, 2.0]))
+    store_series(b, make_frame(["2024-01-01"], [10.0]))
+    result = store_series(a, make_frame(["2024-01-02", "2024-01-03"], [2.5, 3.0]))
+
+    assert result.new_points == 1
+    assert result.revised_points == 1
+    assert result.last_value == 3.0
+
+    loaded_a = load_series(a)
+    loaded_b = load_series(b)
+    assert loaded_a is not None and loaded_a["value"].tolist() == [1.0, 2.5, 3.0]
+    assert loaded_b is not None and loaded_b["value"].tolist() == [10.0]
+    assert load_series(series_path(tmp_path, "missing", "dataset")) is None
+    assert not (tmp_path / "dataset" / "a").exists()
+
+
+def test_dataset_range_and_scan(tmp_path: Path, make_frame) -> None:
+    for sid, offset in [("a", 0.0), ("b", 100.0)]:
+        store_series(
+            series_path(tmp_path, sid, "dataset"),
+            make_frame(["2023-12-31", "2024-01-01", "2024-01-02"], [offset + 1, offset + 2, offset + 3]),
+        )
+
+    ranged = load_series(series_path(tmp_path, "a", "dataset"), start=date(2024, 1, 1), end=date(2024, 1, 1))
+    assert ranged is not None and ranged["value"].tolist() == [2.0]
+
+    empty_range = load_series(series_path(tmp_path, "a", "dataset"), start=date(2030, 1, 1))
+    assert empty_range is not None and empty_range.empty
+
+    scanned = scan_dataset(tmp_path / "dataset", series_ids=["b"], start=pd.Timestamp("2024-01-01", tz="UTC"))
+    assert scanned["series_id"].unique().tolist() == ["b"]
+    assert scanned["value"].tolist() == [102.0, 103.0]
+
+
+def test_dataset_concurrent_writers_same_bucket(tmp_path: Path, make_frame) -> None:
+    root = tmp_path / "dataset"
+    ids = [f"s{i}" for i in range(40)]
+    target = bucket_path(root, ids[0])
+    same_bucket = [sid for sid in ids if bucket_path(root, sid) == target] or [ids[0]]
+
+    threads = [
+        threading.Thread(
+            target=store_series, args=(series_path(tmp_path, sid, "dataset"), make_frame(["2024-01-01"], [1.0]))
+        )
+        for sid in ids
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert all(series_exists(series_path(tmp_path, sid, "dataset")) for sid in ids)
+    assert len(scan_dataset(root, series_ids=same_bucket)) == len(same_bucket)
+
+
+def test_migrate_file_to_dataset(tmp_path: Path, make_frame) -> None:
+    src = series_path(tmp_path, "s1", "file")
+    dst = series_path(tmp_path, "s1", "dataset")
+    store_series(src, make_frame(["2024-01-01"], [1.0]))
+
+    migrate_series(src, dst)
+
+    assert not src.exists()
+    assert series_exists(dst)
+
+
+def _same_bucket_ids(root: Path, n: int) -> list[str]:
+    ids = [f"s{i}" for i in range(200)]
+    target = bucket_path(root, ids[0])
+    return [sid for sid in ids if bucket_path(root, sid) == target][:n]
+
+
+def test_dataset_writes_append_deltas_and_compact(tmp_path: Path, make_frame) -> None:
+    root = tmp_path / "dataset"
+    a, b = (series_path(tmp_path, sid, "dataset") for sid in _same_bucket_ids(root, 2))
+    bucket = bucket_path(root, a.series_id)
+
+    store_series(a, make_frame(["2024-01-01", "2024-01-02"], [1.0, 2.0]))
+    store_series(b, make_frame(["2024-01-01"], [10.0]))
+    assert not bucket.exists()
+    assert len(list(bucket.with_suffix(".deltas").iterdir())) == 2
+
+    # unchanged points write nothing
+    assert store_series(b, make_frame(["2024-01-01"], [10.0])).new_points == 0
+    assert len(list(bucket.with_suffix(".deltas").iterdir())) == 2
+
+    fp_b = series_fingerprint(b)
+    store_series(a, make_frame(["2024-01-02", "2024-01-03"], [2.5, 3.0]))
+    assert series_fingerprint(b) == fp_b
+
+    fp_a = series_fingerprint(a)
+    assert compact_dataset(root) == 1
+    assert bucket.exists()
+    assert list(bucket.with_suffix(".deltas").iterdir()) == []
+    # compaction keeps the content, so fingerprints (and summaries) stay valid
+    assert series_fingerprint(a) == fp_a
+    assert series_fingerprint(b) == fp_b
+
+    loaded = load_series(a)
+    assert loaded is not None and loaded["value"].tolist() == [1.0, 2.5, 3.0]
+
+    store_series(a, make_frame(["2024-01-03"], [3.5]))
+    assert series_fingerprint(b) == fp_b
+    loaded = load_series(a)
+    assert loaded is not None and loaded["value"].tolist() == [1.0, 2.5, 3.5]
+    assert scan_dataset(root, series_ids=[a.series_id])["value"].tolist() == [1.0, 2.5, 3.5]
+
+
+def test_dataset_layout_is_explicit(tmp_path: Path, make_frame) -> None:
+    data_dir = tmp_path / "dataset"
+    path = series_path(data_dir, "s1", "file")
+    store_series(path, make_frame(["2024-01-01"], [1.0]))
+
+    assert isinstance(series_path(data_dir, "s1", "dataset"), DatasetKey)
+    assert path.is_file()
+    loaded = load_series(path)
+    assert loaded is not None and loaded["value"].tolist() == [1.0]
+
+
+def test_migrate_dataset_to_file_with_pending_deltas(tmp_path: Path, make_frame) -> None:
+    root = tmp_path / "dataset"
+    a, b = (series_path(tmp_path, sid, "dataset") for sid in _same_bucket_ids(root, 2))
+    store_series(a, make_frame(["2024-01-01"], [1.0]))
+    store_series(b, make_frame(["2024-01-01"], [2.0]))
+
+    dst = series_path(tmp_path, a.series_id, "file")
+    migrate_series(a, dst)
+
+    assert not series_exists(a)
+    assert series_exists(b) and series_exists(dst)
+    loaded = load_series(b)
+    assert loaded is not None and loaded["value"].tolist() == [2.0]
+
+
+def test_bucket_count_is_read_once_per_root(tmp_path: Path, monkeypatch, make_frame) -> None:
+    root = tmp_path / "dataset"
+    store_series(series_path(tmp_path, "a", "dataset"), make_frame(["2024-01-01"], [1.0]))
+    expected = bucket_path(root, "b")
+
+    reads = []
+    read_text = Path.read_text
+    monkeypatch.setattr(Path, "read_text", lambda self, *a, **k: reads.append(self) or read_text(self, *a, **k))
+    for _ in range(3):
+        store_series(series_path(tmp_path, "b", "dataset"), make_frame(["2024-01-02"], [2.0]))
+        assert load_series(series_path(tmp_path, "b", "dataset")) is not None
+
+    assert bucket_path(root, "b") == expected
+    assert not [p for p in reads if p.name == "_dataset.json"]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+from macrolens_poc.storage.parquet_store import load_series, migrate_series, series_path, store_series
+
+
+def test_partitioned_store_writes_year_partitions_and_manifest(tmp_path: Path, make_frame) -> None:
+    root = series_path(tmp_path, "s1", "partitioned")
+
+    result = store_series(root, make_frame(["2022-12-30", "2023-01-02", "2024-01-02"], [1.0, 2.0, 3.0]))
+
+    assert sorted(p.name for p in root.glob("*.parquet")) == [
+        "year=2022.parquet",
+        "year=2023.parquet",
+        "year=2024.parquet",
+    ]
+    manifest = json.loads((root / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["partitions"]["2024"]["rows"] == 1
+    assert result.rows_after == 3
+    assert result.new_points == 3
+    assert result.last_date == pd.Timestamp("2024-01-02", tz="UTC")
+    assert result.last_value == 3.0
+
+
+def test_partitioned_update_only_rewrites_touched_partition(tmp_path: Path, make_frame) -> None:
+    root = series_path(tmp_path, "s1", "partitioned")
+    store_series(root, make_frame(["2023-06-01", "2024-01-02"], [1.0, 2.0]))
+    untouched_mtime = (root / "year=2023.parquet").stat().st_mtime_ns
+
+    result = store_series(root, make_frame(["2024-01-02", "2024-01-03"], [2.5, 3.0]))
+
+    assert (root / "year=2023.parquet").stat().st_mtime_ns == untouched_mtime
+    assert result.rows_before == 2
+    assert result.rows_after == 3
+    assert result.new_points == 1
+    assert result.revised_points == 1
+
+    loaded = load_series(root)
+    assert loaded is not None
+    assert loaded["value"].tolist() == [1.0, 2.5, 3.0]
+
+
+def test_load_series_date_range(tmp_path: Path, make_frame) -> None:
+    root = series_path(tmp_path, "s1", "partitioned")
+    store_series(root, make_frame(["2022-01-01", "2023-01-01", "2024-01-01", "2024-02-01"], [1.0, 2.0, 3.0, 4.0]))
+
+    ranged = load_series(root, start=date(2023, 6, 1), end=date(2024, 1, 31))
+
+    assert ranged is not None
+    assert ranged["value"].tolist() == [3.0]
+
+
+def test_migrate_series_file_to_partitioned(tmp_path: Path, make_frame) -> None:
+    src = series_path(tmp_path, "s1", "file")
+    dst = series_path(tmp_path, "s1", "partitioned")
+    store_series(src, make_frame(["2023-01-01", "2024-01-01"], [1.0, 2.0]))
+
+    result = migrate_series(src, dst)
+
+    assert result is not None and result.rows_after == 2
+    assert not src.exists()
+    loaded = load_series(dst)
+    assert loaded is not None
+    assert loaded["value"].tolist() == [1.0, 2.0]
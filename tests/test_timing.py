@@ -0,0 +1,72 @@
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+from macrolens_poc.config import LoggingConfig, PathsConfig, Settings
+from macrolens_poc.pipeline import run_series
+from macrolens_poc.sources.fred import FetchResult
+from macrolens_poc.sources.matrix import SeriesSpec
+from macrolens_poc.timing import StageStats, StageTimer
+
+
+def test_stage_timer_accumulates_and_disabled_is_noop() -> None:
+    timer = StageTimer()
+    with timer.stage("merge"):
+        pass
+    timer.add("merge", 0.5)
+    timer.add("fetch", 0.25)
+
+    assert timer.as_dict()["fetch"] == 0.25
+    assert timer.as_dict()["merge"] >= 0.5
+
+    disabled = StageTimer(enabled=False)
+    with disabled.stage("merge"):
+        pass
+    disabled.add("fetch", 1.0)
+    assert disabled.as_dict() == {}
+
+
+def test_stage_stats_percentiles_per_provider() -> None:
+    stats = StageStats()
+    for i in range(1, 101):
+        stats.add("fred", {"fetch": i / 100})
+    stats.add("yfinance", {"fetch": 2.0})
+
+    summary = stats.summary()
+    assert summary["fred"]["fetch"] == {"count": 100, "p50": 0.5, "p95": 0.95, "max": 1.0, "total": 50.5}
+    assert summary["yfinance"]["fetch"]["p95"] == 2.0
+
+
+def _settings(tmp_path: Path, *, stage_timings: bool) -> Settings:
+    return Settings(
+        paths=PathsConfig(data_dir=tmp_path, metadata_db=tmp_path / "meta.sqlite"),
+        logging=LoggingConfig(stage_timings=stage_timings),
+    )
+
+
+def test_run_series_reports_stage_timings(tmp_path: Path) -> None:
+    spec = SeriesSpec(id="s1", provider="fred", provider_symbol="X", category="test")
+    data = pd.DataFrame({"date": pd.date_range("2024-01-01", periods=10, tz="UTC"), "value": range(10)})
+    fetched = FetchResult(status="ok", message="ok", data=data, retry_sleep_s=0.5)
+
+    result = run_series(
+        settings=_settings(tmp_path, stage_timings=True),
+        spec=spec,
+        observation_start=date(2024, 1, 1),
+        prefetched=fetched,
+        prefetch_s=2.0,
+    )
+
+    assert result.status == "ok"
+    assert result.timings["fetch"] == 1.5
+    assert result.timings["retry_sleep"] == 0.5
+    assert {"normalize", "read", "merge", "write", "summary"} <= set(result.timings)
+
+    untimed = run_series(
+        settings=_settings(tmp_path, stage_timings=False),
+        spec=spec,
+        observation_start=date(2024, 1, 1),
+        prefetched=fetched,
+    )
+    assert untimed.timings == {}